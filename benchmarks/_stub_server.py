@@ -0,0 +1,75 @@
+"""
+A small threaded HTTP/1.1 server used by the benchmarks in this directory.
+
+The server keeps connections alive and can simulate the cost of opening a new connection
+(TCP + TLS handshake) with ``connect_delay``, which is paid once per accepted socket.
+"""
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def json_route(payload, status=200):
+    body = json.dumps(payload).encode()
+    return lambda handler: (status, {"Content-Type": "application/json"}, body)
+
+
+class StubServer:
+    """
+    Runs a stub API server on a background thread.
+
+    Args:
+        routes (callable): Called with the request handler, returns (status, headers, body).
+        connect_delay (float): Seconds slept once per new connection.
+        response_delay (float): Seconds slept before every response.
+    """
+
+    def __init__(self, routes, connect_delay=0.0, response_delay=0.0):
+        self.connections = 0
+        self.requests = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                server.connections += 1
+                if connect_delay:
+                    time.sleep(connect_delay)
+                super().setup()
+                # Headers and body are written separately; avoid Nagle + delayed ACK stalls.
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def _respond(self):
+                server.requests += 1
+                length = int(self.headers.get("Content-Length") or 0)
+                self.body = self.rfile.read(length) if length else b""
+                if response_delay:
+                    time.sleep(response_delay)
+                status, headers, body = routes(self)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _respond
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,53 @@
+"""
+Times a 10k-symbol get_equity_options lookup against a local stub server, fetching the URL-safe
+batches serially and with increasing concurrency.
+
+    python benchmarks/bench_batching.py --symbols 10000 --response-delay 0.05
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _stub_server import StubServer
+from tastytrade_api.batching import chunk_symbols
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.transport import Transport
+
+
+def equity_options_route(handler):
+    symbols = parse_qs(urlsplit(handler.path).query).get("symbol[]", [])
+    items = [{"symbol": symbol, "instrument-type": "Equity Option", "active": True} for symbol in symbols]
+    return 200, {"Content-Type": "application/json"}, json.dumps({"data": {"items": items}}).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=10000)
+    parser.add_argument("--response-delay", type=float, default=0.05,
+                        help="Simulated server time per request, in seconds.")
+    args = parser.parse_args()
+
+    symbols = [f"SPY   24{(n % 12) + 1:02d}15C{n:08d}" for n in range(args.symbols)]
+    single_url_length = len(urlencode({"symbol[]": symbols}, doseq=True))
+    batches = chunk_symbols(symbols, "symbol[]")
+    print(f"{args.symbols} symbols: one URL would be {single_url_length} bytes; "
+          f"split into {len(batches)} batches")
+
+    with StubServer(equity_options_route, response_delay=args.response_delay) as server:
+        with Transport(pool_maxsize=16) as transport:
+            for workers in (1, 4, 8, 16):
+                instruments = TastytradeInstruments("token", server.url, transport=transport, max_workers=workers)
+                start = time.perf_counter()
+                options = instruments.get_equity_options(symbols)
+                elapsed = time.perf_counter() - start
+                assert [o["symbol"] for o in options] == symbols
+                print(f"max_workers={workers:<3} {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Times loading the option chains of a watchlist-size list of underlyings from a local stub server with simulated
+API latency: one at a time, and concurrently with load_chains.
+
+    python benchmarks/bench_chain_loader.py --underlyings 100 --latency 0.05 --concurrency 16
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _stub_server import StubServer
+from bench_instrument_master import option_chain
+from tastytrade_api.exceptions import TastytradeError
+from tastytrade_api.market_data.chain_loader import load_chains, load_snapshot
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.transport import Transport
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--underlyings", type=int, default=100)
+    parser.add_argument("--strikes", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="seconds the server waits per request")
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+
+    symbols = [f"SYM{n}" for n in range(args.underlyings)]
+
+    def route(handler):
+        underlying = urlsplit(handler.path).path.split("/")[-2]
+        if underlying == "SYM13":
+            return 404, {"Content-Type": "application/json"}, b'{"error": {"message": "Not found"}}'
+        body = {"data": {"items": [option_chain(underlying, args.strikes, 8)]}}
+        return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+
+    with StubServer(route, response_delay=args.latency) as server, \
+            Transport(pool_maxsize=args.concurrency) as transport, tempfile.TemporaryDirectory() as directory:
+        instruments = TastytradeInstruments("token", server.url, transport=transport)
+
+        start = time.perf_counter()
+        for symbol in symbols:
+            try:
+                instruments.get_option_chains(symbol)
+            except TastytradeError:
+                pass
+        print(f"sequential        {time.perf_counter() - start:6.2f} s")
+
+        path = os.path.join(directory, "chains.json.gz")
+        load = load_chains(instruments, symbols, max_concurrency=args.concurrency, path=path)
+        print(f"load_chains       {load.wall_time:6.2f} s   {len(load)} chains, failed: {', '.join(load.failed)}")
+        slowest = ", ".join(f"{symbol} {seconds * 1e3:.0f} ms" for symbol, seconds in load.slowest(3))
+        print(f"slowest           {slowest}")
+
+        start = time.perf_counter()
+        restored = load_snapshot(path)
+        print(f"snapshot          {os.path.getsize(path) / 2 ** 20:6.2f} MiB, read in "
+              f"{(time.perf_counter() - start) * 1e3:.0f} ms ({len(restored)} chains)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Compares the parse time and allocations of the available JSON codecs on representative option-chain,
+positions and dxFeed stream payloads.
+
+    python benchmarks/bench_codec.py --repeat 200
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tastytrade_api import codec
+
+
+def option_chain_payload(expirations=40, strikes=120):
+    return {"data": {"items": [{
+        "underlying-symbol": "SPY",
+        "root-symbol": "SPY",
+        "option-chain-type": "Standard",
+        "shares-per-contract": 100,
+        "expirations": [{
+            "expiration-type": "Regular",
+            "expiration-date": f"2026-{(e % 12) + 1:02d}-{(e % 28) + 1:02d}",
+            "days-to-expiration": e * 7,
+            "settlement-type": "PM",
+            "strikes": [{
+                "strike-price": f"{300 + s * 2.5:.1f}",
+                "call": f"SPY   26{(e % 12) + 1:02d}{(e % 28) + 1:02d}C{int((300 + s * 2.5) * 1000):08d}",
+                "call-streamer-symbol": f".SPY26{(e % 12) + 1:02d}{(e % 28) + 1:02d}C{300 + s * 2.5:g}",
+                "put": f"SPY   26{(e % 12) + 1:02d}{(e % 28) + 1:02d}P{int((300 + s * 2.5) * 1000):08d}",
+                "put-streamer-symbol": f".SPY26{(e % 12) + 1:02d}{(e % 28) + 1:02d}P{300 + s * 2.5:g}",
+            } for s in range(strikes)],
+        } for e in range(expirations)],
+    }]}}
+
+
+def positions_payload(count=500):
+    return {"data": {"items": [{
+        "account-number": "5WT00000",
+        "symbol": f"SYM{n}",
+        "instrument-type": "Equity",
+        "underlying-symbol": f"SYM{n}",
+        "quantity": n % 300 + 1,
+        "quantity-direction": "Long",
+        "close-price": f"{100 + n * 0.37:.2f}",
+        "average-open-price": f"{95 + n * 0.31:.2f}",
+        "multiplier": 1,
+        "cost-effect": "Credit",
+        "is-suppressed": False,
+        "is-frozen": False,
+        "realized-day-gain": "0.0",
+        "created-at": "2026-10-01T14:30:00.000+00:00",
+        "updated-at": "2026-10-16T19:59:59.000+00:00",
+    } for n in range(count)]}}
+
+
+def stream_payload(symbols=500):
+    values = []
+    for n in range(symbols):
+        values += [f"SYM{n}", 0, 0, 1729000000000 + n, "Q", 100.0 + n / 100, 100.02 + n / 100, 300 + n, 250 + n]
+    return [{"channel": "/service/data", "data": [
+        ["Quote", ["eventSymbol", "eventTime", "sequence", "timeNanoPart", "bidExchangeCode", "bidPrice",
+                   "askPrice", "bidSize", "askSize"]],
+        values,
+    ]}]
+
+
+def measure(decoder, payload, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        decoder.loads(payload)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = decoder.loads(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    codecs = [codec.StdlibCodec()]
+    if codec.orjson is not None:
+        codecs.append(codec.OrjsonCodec())
+    else:
+        print("orjson is not installed; only the stdlib codec is measured")
+
+    payloads = {
+        "option chain": json.dumps(option_chain_payload()).encode(),
+        "positions": json.dumps(positions_payload()).encode(),
+        "stream message": json.dumps(stream_payload()).encode(),
+    }
+    print(f"{'payload':<16}{'size':>10}  {'codec':<8}{'parse':>10}{'peak alloc':>14}")
+    for name, payload in payloads.items():
+        baseline = None
+        for decoder in codecs:
+            seconds, peak = measure(decoder, payload, args.repeat)
+            baseline = baseline or seconds
+            print(f"{name:<16}{len(payload):>9,}B  {decoder.name:<8}{seconds * 1000:>8.2f}ms{peak / 1024:>11.0f} KiB"
+                  f"  x{baseline / seconds:.1f}")
+
+
+if __name__ == "__main__":
+    main()
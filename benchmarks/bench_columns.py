@@ -0,0 +1,66 @@
+"""
+Compares turning a large equity-options response into typed columns: a pandas DataFrame built from the decoded
+dicts, and output="columns" (whole and with stream=True), against a local stub server.
+
+    python benchmarks/bench_columns.py --items 200000
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _stub_server import StubServer
+from bench_models import equity_option
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.transport import Transport
+
+
+def measure(build):
+    start = time.perf_counter()
+    count = build()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=200000)
+    args = parser.parse_args()
+
+    body = json.dumps({"data": {"items": [equity_option(n) for n in range(args.items)]}}).encode()
+    route = lambda handler: (200, {"Content-Type": "application/json"}, body)
+    print(f"{args.items} equity options, {len(body) / 2 ** 20:.1f} MiB response")
+
+    with StubServer(route) as server, Transport() as transport:
+        instruments = TastytradeInstruments("token", server.url, transport=transport)
+
+        def from_dicts():
+            frame = pd.DataFrame(instruments.get_equity_options())
+            frame["strike-price"] = frame["strike-price"].astype(float)
+            frame["expiration-date"] = pd.to_datetime(frame["expiration-date"])
+            return len(frame)
+
+        def columns(stream):
+            def build():
+                return len(instruments.get_equity_options(stream=stream, output="columns"))
+            return build
+
+        for name, build in (("DataFrame", from_dicts), ("columns", columns(False)), ("columns+stream", columns(True))):
+            count, elapsed, peak = measure(build)
+            assert count == args.items
+            print(f"{name:<15} peak {peak / 2 ** 20:8.1f} MiB   {elapsed:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Simulates a consumer that falls behind a burst of quotes, as at the open, and compares the delivery policies:
+how deep the queue gets and how old the prices are when the consumer sees them.
+
+    python benchmarks/bench_delivery.py --symbols 500 --rate 400 --batch 50 --cost 0.005 --seconds 3
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tastytrade_api.streamer.delivery import delivery_queue
+
+HEADER = ["Quote", ["eventSymbol", "time", "bidPrice", "askPrice"]]
+
+
+async def run(queue, args):
+    symbols = [f"SYM{n}" for n in range(args.symbols)]
+    ages, depth = [], 0
+    stop = time.monotonic() + args.seconds
+
+    async def produce():
+        nonlocal depth
+        interval = 1 / args.rate
+        next_at = time.monotonic()
+        first = True
+        while time.monotonic() < stop:
+            now = time.monotonic()
+            values = []
+            for symbol in random.sample(symbols, args.batch):
+                values += [symbol, now, 100.0, 100.1]
+            await queue.put([HEADER if first else "Quote", values])
+            first = False
+            depth = max(depth, queue.qsize())
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.monotonic()))
+        await queue.put(None)
+
+    async def consume():
+        while True:
+            message = await queue.get()
+            if message is None:
+                return
+            now = time.monotonic()
+            ages.extend(now - message[1][index] for index in range(1, len(message[1]), 4))
+            await asyncio.sleep(args.cost)
+
+    await asyncio.gather(produce(), consume())
+    ages.sort()
+    return depth, ages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=400, help="messages per second from the server")
+    parser.add_argument("--batch", type=int, default=50, help="quotes per message")
+    parser.add_argument("--cost", type=float, default=0.005, help="seconds the consumer spends per message")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    queues = (
+        ("unbounded", lambda: asyncio.Queue()),
+        ("block", lambda: delivery_queue("block", maxsize=100)),
+        ("drop-oldest", lambda: delivery_queue("drop-oldest", maxsize=100)),
+        ("conflate", lambda: delivery_queue("conflate")),
+    )
+    print(f"{'policy':<12} {'max depth':>10} {'quotes seen':>12} {'median age ms':>14} {'p99 age ms':>11}  metrics")
+    for name, factory in queues:
+        queue = factory()
+        depth, ages = asyncio.run(run(queue, args))
+        metrics = queue.metrics() if hasattr(queue, "metrics") else {}
+        print(f"{name:<12} {depth:10d} {len(ages):12d} {ages[len(ages) // 2] * 1e3:14.1f} "
+              f"{ages[int(len(ages) * 0.99)] * 1e3:11.1f}  {metrics}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Measures the decoding throughput of DxFeedDecoder in events per second, for full events and with field
+projection, against building a dict per event from the header.
+
+    python benchmarks/bench_dx_mapping.py --events 200000 --batch 100
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tastytrade_api.streamer.dx_mapping import DxFeedDecoder, Greeks, Quote, TimeAndSale
+
+
+def values(cls, n):
+    row = {
+        "eventSymbol": None, "bidExchangeCode": "Q", "askExchangeCode": "Q", "exchangeCode": "Q",
+        "exchangeSaleConditions": "", "aggressorSide": "BUY", "type": "NEW", "buyer": "", "seller": "",
+    }
+    flat = []
+    for number in range(n):
+        for index, field in enumerate(cls.FIELDS):
+            value = row.get(field, index + 0.5)
+            flat.append(f".SPXW240119C{4000 + number % 500}" if field == "eventSymbol" else value)
+    return flat
+
+
+def header_dicts(message):
+    (_, fields), flat = message
+    size = len(fields)
+    return [dict(zip(fields, flat[start:start + size])) for start in range(0, len(flat), size)]
+
+
+def throughput(decode, messages, events):
+    start = time.perf_counter()
+    for message in messages:
+        decode(message)
+    return events / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=200000)
+    parser.add_argument("--batch", type=int, default=100, help="events per message")
+    args = parser.parse_args()
+
+    print(f"{'event type':<12} {'header dicts':>14} {'decoder':>14} {'projected':>14}   events/s")
+    for cls, projection in ((Quote, ["bidPrice", "askPrice"]), (Greeks, ["delta", "volatility"]),
+                            (TimeAndSale, ["price", "size"])):
+        header = [cls.EVENT_TYPE, list(cls.FIELDS)]
+        messages = [[header, values(cls, args.batch)] for _ in range(args.events // args.batch)]
+        events = len(messages) * args.batch
+        full = DxFeedDecoder()
+        projected = DxFeedDecoder(fields={cls.EVENT_TYPE: projection})
+        print(f"{cls.EVENT_TYPE:<12} {throughput(header_dicts, messages, events):14,.0f} "
+              f"{throughput(full.decode, messages, events):14,.0f} "
+              f"{throughput(projected.decode, messages, events):14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Times the initial load and an incremental refresh of an InstrumentMaster against a local stub server, and the
+latency of its lookups.
+
+    python benchmarks/bench_instrument_master.py --equities 10000 --underlyings 50 --strikes 100
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from _stub_server import StubServer
+from bench_streaming import equity
+from tastytrade_api.market_data.instrument_master import InstrumentMaster
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.transport import Transport
+
+EXPIRATIONS = [(date.today() + timedelta(days=7 * n)).isoformat() for n in range(1, 9)]
+
+
+def option_chain(underlying, strikes, listed):
+    return {
+        "underlying-symbol": underlying,
+        "root-symbol": underlying,
+        "option-chain-type": "Standard",
+        "shares-per-contract": 100,
+        "expirations": [
+            {
+                "expiration-date": expiration,
+                "expiration-type": "Weekly",
+                "settlement-type": "PM",
+                "strikes": [
+                    {
+                        "strike-price": f"{strike}.0",
+                        "call": f"{underlying:<6}{expiration}C{strike}",
+                        "call-streamer-symbol": f".{underlying}{expiration}C{strike}",
+                        "put": f"{underlying:<6}{expiration}P{strike}",
+                        "put-streamer-symbol": f".{underlying}{expiration}P{strike}",
+                    }
+                    for strike in range(100, 100 + strikes)
+                ],
+            }
+            for expiration in EXPIRATIONS[:listed]
+        ],
+    }
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--equities", type=int, default=10000)
+    parser.add_argument("--underlyings", type=int, default=50)
+    parser.add_argument("--strikes", type=int, default=100)
+    args = parser.parse_args()
+
+    state = {"equities": args.equities, "expirations": len(EXPIRATIONS) - 1}
+    underlyings = [f"SYM{n}" for n in range(args.underlyings)]
+
+    def route(handler):
+        url = urlsplit(handler.path)
+        if url.path.endswith("/nested"):
+            underlying = url.path.split("/")[-2]
+            data = {"items": [option_chain(underlying, args.strikes, state["expirations"])]}
+        elif url.path.endswith("/equities/active"):
+            query = parse_qs(url.query)
+            per_page, offset = int(query["per-page"][0]), int(query["page-offset"][0])
+            count = state["equities"]
+            items = [equity(n) for n in range(offset * per_page, min(count, (offset + 1) * per_page))]
+            body = {"data": {"items": items}, "pagination": {"total-pages": -(-count // per_page)}}
+            return 200, {"Content-Type": "application/json"}, json.dumps(body).encode()
+        else:
+            data = {"items": [{"symbol": "/ESZ9", "product-code": "ES", "expiration-date": "2099-12-18"}]}
+        return 200, {"Content-Type": "application/json"}, json.dumps({"data": data}).encode()
+
+    with StubServer(route) as server, Transport() as transport, tempfile.TemporaryDirectory() as directory:
+        instruments = TastytradeInstruments("token", server.url, transport=transport)
+        path = os.path.join(directory, "instruments.sqlite")
+        master = InstrumentMaster(instruments, path, underlyings=underlyings)
+
+        report, elapsed = timed(master.sync)
+        print(f"initial load      {elapsed:6.2f} s   {len(master)} instruments")
+
+        # A few new listings and a new weekly expiration.
+        state["equities"] += 100
+        state["expirations"] += 1
+        report, elapsed = timed(master.sync)
+        added = sum(changes["added"] for changes in report.values())
+        print(f"incremental sync  {elapsed:6.2f} s   {added} added")
+        master.close()
+
+        reopened, elapsed = timed(InstrumentMaster, instruments, path)
+        print(f"reopen            {elapsed:6.2f} s")
+        with reopened:
+            n = 100000
+            lookups = (
+                ("get", reopened.get, ("SYM7",)),
+                ("option", reopened.option, ("SYM7", EXPIRATIONS[2], 150, "C")),
+                ("strikes", reopened.strikes, ("SYM7", EXPIRATIONS[2])),
+            )
+            for name, lookup, lookup_args in lookups:
+                assert lookup(*lookup_args)
+                _, elapsed = timed(lambda: [lookup(*lookup_args) for _ in range(n)])
+                print(f"{name:<17} {elapsed / n * 1e6:6.2f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
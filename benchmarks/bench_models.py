@@ -0,0 +1,90 @@
+"""
+Compares the memory held per equity option and the construction cost of decoded dicts and EquityOption models.
+
+    python benchmarks/bench_models.py --items 200000
+"""
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tastytrade_api.models import EquityOption, convert
+
+
+def equity_option(n):
+    strike = 100 + n % 400
+    return {
+        "symbol": f"SPY   240119C00{strike:03d}000",
+        "instrument-type": "Equity Option",
+        "active": True,
+        "listed-market": "XCBO",
+        "strike-price": f"{strike}.0",
+        "root-symbol": "SPY",
+        "underlying-symbol": "SPY",
+        "expiration-date": "2024-01-19",
+        "exercise-style": "American",
+        "shares-per-contract": 100,
+        "option-type": "C",
+        "option-chain-type": "Standard",
+        "expiration-type": "Regular",
+        "settlement-type": "PM",
+        "stops-trading-at": "2024-01-19T21:00:00.000+00:00",
+        "market-time-instrument-collection": "Equity Option",
+        "days-to-expiration": 30 + n % 60,
+        "expires-at": "2024-01-19T21:00:00.000+00:00",
+        "is-closing-only": False,
+        "streamer-symbol": f".SPY240119C{strike}",
+    }
+
+
+def held(build):
+    """Returns the result of build and the memory it still holds once built, in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=200000)
+    args = parser.parse_args()
+
+    body = json.dumps([equity_option(n) for n in range(args.items)])
+    print(f"{args.items} equity options")
+
+    dicts, dicts_bytes = held(lambda: json.loads(body))
+    models, models_bytes = held(lambda: convert(json.loads(body), EquityOption, "models"))
+    del dicts, models
+
+    items = json.loads(body)
+    _, decode_time = timed(json.loads, body)
+    models, build_time = timed(convert, items, EquityOption, "models")
+    _, read_dict_time = timed(lambda: [item["strike-price"] for item in items])
+    _, read_model_time = timed(lambda: [model.strike_price for model in models])
+
+    n = args.items
+    print(f"{'':<8} {'bytes/object':>12} {'build us/object':>16} {'read us/object':>15}")
+    print(f"{'dicts':<8} {dicts_bytes / n:12.0f} {decode_time / n * 1e6:16.2f} {read_dict_time / n * 1e6:15.3f}")
+    print(f"{'models':<8} {models_bytes / n:12.0f} {(decode_time + build_time) / n * 1e6:16.2f} "
+          f"{read_model_time / n * 1e6:15.3f}")
+    print("Models are built from the decoded dicts, so their build time includes the decoding; reading a model "
+          "field decodes it (here to a Decimal).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Compares the latency of common option-chain queries on an SPX-size chain: walking the nested JSON in Python
+loops and querying an OptionChain.
+
+    python benchmarks/bench_option_chain.py --expirations 120 --strikes 400
+"""
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from tastytrade_api.market_data.option_chain import OptionChain
+
+AS_OF = date(2024, 1, 2)
+
+
+def nested_chains(expirations: int, strikes: int) -> list:
+    chains = []
+    for root, step in (("SPX", 5), ("SPXW", 1)):
+        days = [AS_OF + timedelta(days=step * n) for n in range(1, expirations // 2 + 1)]
+        chains.append({
+            "underlying-symbol": "SPX",
+            "root-symbol": root,
+            "expirations": [
+                {
+                    "expiration-date": day.isoformat(),
+                    "expiration-type": "Weekly",
+                    "settlement-type": "PM",
+                    "strikes": [
+                        {
+                            "strike-price": f"{3800 + 5 * n}.0",
+                            "call": f"{root:<6}{day:%y%m%d}C0{3800 + 5 * n}000",
+                            "call-streamer-symbol": f".{root}{day:%y%m%d}C{3800 + 5 * n}",
+                            "put": f"{root:<6}{day:%y%m%d}P0{3800 + 5 * n}000",
+                            "put-streamer-symbol": f".{root}{day:%y%m%d}P{3800 + 5 * n}",
+                        }
+                        for n in range(strikes)
+                    ],
+                }
+                for day in days
+            ],
+        })
+    return chains
+
+
+def nested_expirations_between(chains, min_dte, max_dte):
+    found = []
+    for chain in chains:
+        for expiration in chain["expirations"]:
+            dte = (date.fromisoformat(expiration["expiration-date"]) - AS_OF).days
+            if min_dte <= dte <= max_dte:
+                found.append(expiration)
+    return found
+
+
+def nested_nearest(chains, expiration_date, price, n):
+    for chain in chains:
+        for expiration in chain["expirations"]:
+            if expiration["expiration-date"] == expiration_date:
+                strikes = sorted(expiration["strikes"], key=lambda s: abs(float(s["strike-price"]) - price))[:n]
+                return sorted(strikes, key=lambda s: float(s["strike-price"]))
+    return []
+
+
+def nested_symbol(chains, expiration_date, strike, option_type):
+    for chain in chains:
+        for expiration in chain["expirations"]:
+            if expiration["expiration-date"] == expiration_date:
+                for row in expiration["strikes"]:
+                    if float(row["strike-price"]) == strike:
+                        return row["call" if option_type == "C" else "put"]
+    return None
+
+
+def per_call(function, *args, repeat=200):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--expirations", type=int, default=120)
+    parser.add_argument("--strikes", type=int, default=400)
+    args = parser.parse_args()
+
+    chains = nested_chains(args.expirations, args.strikes)
+    start = time.perf_counter()
+    chain = OptionChain.from_nested(chains)
+    print(f"{chain}, built in {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    expiration = str(chain.expirations[len(chain.expirations) // 2])
+    chain.attach_greeks({symbol: 1 - n / args.strikes for n, symbol in enumerate(chain.call_streamer_symbols)})
+    queries = (
+        ("DTE 30-45", (nested_expirations_between, chains, 30, 45), (chain.expirations_between, 30, 45, AS_OF)),
+        ("nearest 10", (nested_nearest, chains, expiration, 4712.5, 10), (chain.nearest, expiration, 4712.5, 10)),
+        ("symbol", (nested_symbol, chains, expiration, 4800.0, "P"), (chain.symbol, expiration, 4800.0, "P")),
+        ("delta 0.3-0.4", None, (chain.delta_range, expiration, 0.3, 0.4)),
+    )
+    print(f"{'query':<14} {'nested us':>10} {'OptionChain us':>15}")
+    for name, nested, arrays in queries:
+        nested_time = f"{per_call(*nested):10.1f}" if nested else f"{'-':>10}"
+        print(f"{name:<14} {nested_time} {per_call(*arrays):15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Times how long a CometdWebsocketClient takes to be fully subscribed (every /service/sub message acknowledged)
+to a large symbol set on a local CometD stub server: one message per (event type, symbol), as
+send_subscription_message does, and one bulk subscribe.
+
+    python benchmarks/bench_subscriptions.py --symbols 3000 --event-types Quote,Trade,Greeks
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import websockets
+
+from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+
+
+async def cometd_server(websocket, *args):
+    """Answers handshakes and acknowledges every subscription message, like the dxFeed CometD endpoint."""
+    async for frame in websocket:
+        replies = []
+        for message in json.loads(frame):
+            if message["channel"] == "/meta/handshake":
+                replies.append({"id": message["id"], "channel": "/meta/handshake", "successful": True,
+                                "clientId": "stub-client"})
+            elif message["channel"] == "/service/sub":
+                replies.append({"id": message["id"], "channel": "/service/sub", "successful": True})
+        if replies:
+            await websocket.send(json.dumps(replies))
+
+
+async def time_to_subscribed(url, subscribe):
+    """Connects, subscribes with subscribe(client) once the handshake succeeded, and waits for the acks."""
+    handshake = asyncio.Event()
+
+    async def on_handshake_success(client):
+        handshake.set()
+
+    client = CometdWebsocketClient(url, "token", asyncio.Queue(), on_handshake_success)
+    connection = asyncio.create_task(client.connect())
+    await handshake.wait()
+    start = time.perf_counter()
+    await asyncio.gather(*await subscribe(client))
+    elapsed = time.perf_counter() - start
+    connection.cancel()
+    await asyncio.gather(connection, return_exceptions=True)
+    return elapsed, client.message_id - 1
+
+
+async def run(args):
+    symbols = [f".SPXW240119C{3000 + n}" for n in range(args.symbols)]
+    event_types = args.event_types.split(",")
+
+    async def per_symbol(client):
+        return [await client.subscribe({event_type: [symbol]}, timeout=None)
+                for event_type in event_types for symbol in symbols]
+
+    async def bulk(client):
+        return [await client.subscribe({event_type: symbols for event_type in event_types}, timeout=None)]
+
+    async with websockets.serve(cometd_server, "127.0.0.1", 0, max_size=None) as server:
+        url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+        print(f"{len(symbols) * len(event_types)} subscriptions")
+        for name, subscribe in (("per symbol", per_symbol), ("bulk", bulk)):
+            elapsed, messages = await time_to_subscribed(url, subscribe)
+            print(f"{name:<12} {elapsed * 1e3:8.0f} ms   {messages} messages")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--symbols", type=int, default=3000)
+    parser.add_argument("--event-types", default="Quote,Trade,Greeks")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compares request latency of one-shot ``requests.get`` calls (a new connection per call) with calls
+sent through a pooled, keep-alive Transport.
+
+    python benchmarks/bench_transport.py --requests 200 --connect-delay 0.02
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import requests
+
+from _stub_server import StubServer, json_route
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.transport import Transport
+
+POSITIONS = {"data": {"items": [{"symbol": "AAPL", "quantity": 100, "instrument-type": "Equity"}] * 20}}
+
+
+def measure(fn, count):
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def report(name, samples, connections):
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{name:<8} mean {statistics.mean(samples):7.2f} ms  p50 {statistics.median(samples):7.2f} ms  "
+          f"p95 {p95:7.2f} ms  connections {connections}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--connect-delay", type=float, default=0.02,
+                        help="Simulated TCP+TLS handshake cost per new connection, in seconds.")
+    args = parser.parse_args()
+
+    with StubServer(json_route(POSITIONS), connect_delay=args.connect_delay) as server:
+        url = f"{server.url}/accounts/123/positions"
+
+        before = server.connections
+        cold = measure(lambda: requests.get(url, headers={"Authorization": "token"}).json(), args.requests)
+        report("cold", cold, server.connections - before)
+
+        with Transport() as transport:
+            positions = TastytradeAccountPositions("token", server.url, transport=transport)
+            before = server.connections
+            pooled = measure(lambda: positions.get_positions("123"), args.requests)
+            report("pooled", pooled, server.connections - before)
+
+    print(f"speedup  {statistics.mean(cold) / statistics.mean(pooled):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 import asyncio
 from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
 
-from dx_mapping import Trade
+from tastytrade_api.streamer.dx_mapping import DxFeedDecoder
 import logging
 from tastytrade_api.authentication import TastytradeAuth
 import configparser
@@ -31,24 +31,19 @@ logger.debug("DxFeed Token:", dxfeedtoken)
 
 
 async def on_handshake_success(client):
-    event_type = "Trade"
     symbols = ["VIX"]
-    for symbol in symbols:
-        await client.send_subscription_message(client.websocket, event_type, symbol)
+    await client.subscribe({"Trade": symbols})
 
 
 async def consume_data(queue):
+    decoder = DxFeedDecoder()
     while True:
         data = await queue.get()
         if data is None:
             break
-        try:
-            print("This is the raw data: ", data)
-            quotes = Trade.from_list(data)
-            for quote in quotes:
-                print("Data received in script:", quote)
-        except ValueError:
-            print("Invalid data list received")
+        print("This is the raw data: ", data)
+        for trade in decoder.decode(data):
+            print("Data received in script:", trade)
 
 
 async def main():
@@ -18,17 +18,20 @@ setup(
         "Intended Audience :: Developers",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
 
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.10",
     install_requires=[
         "requests",
         "websocket-client",
         "websockets"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "fast": ["orjson"],
+        "secure": ["cryptography"],
+        "columns": ["numpy"],
+    },
 )
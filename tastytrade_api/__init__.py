@@ -1,2 +1,20 @@
-from .exceptions import ValidationError
+from .exceptions import (
+    ApiError,
+    AuthenticationError,
+    ClientError,
+    NotFoundError,
+    RateLimitError,
+    ServerError,
+    SubscriptionError,
+    TastytradeError,
+    TransportError,
+    ValidationError,
+)
 from .account.exceptions import AccountError
+from .cache import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from .coalescing import SingleFlight
+from .deadline import DeadlineExceeded, Timeout, deadline
+from .retry import RetryPolicy
+from .session import SessionManager
+from .session_store import FileSessionStore
+from .transport import Transport
@@ -1,5 +1,6 @@
-import requests
-import json
+from ..transport import get_default_transport
+from ..scheduler import Priority
+from ..exceptions import api_error
 from .exceptions import AccountError
 
 class TastytradeAccount:
@@ -8,25 +9,34 @@ class TastytradeAccount:
 
     Args:
         auth (TastytradeAuth): Authenticated session object
+        transport (Transport): Optional. The pooled transport to send requests through. Defaults to the
+            transport of the auth object, so the connection opened at login is reused.
+        validate (bool): Optional. Whether to check the session with a /sessions/validate request. Can be
+            turned off when a SessionManager keeps the session alive, since an expired session is then
+            replaced on the first call.
 
     Raises:
         ValidationError: If the session is invalid.
     """
 
-    def __init__(self, auth):
-        auth.validate_session()
+    def __init__(self, auth, transport=None, validate=True):
+        if validate:
+            auth.validate_session()
         self.session_token = auth.session_token
         self.url = auth.url
+        self.transport = transport or getattr(auth, "transport", None) or get_default_transport()
         self.headers = {"Authorization": f"{self.session_token}"}
 
     def _raise_account_error(self, msg, response):
-        raise AccountError(
+        raise api_error(
+            response,
             f"\n{msg}\n"
             f"url: {self.url}\n"
             f"headers: {self.headers}\n"
             f"status_code: {response.status_code}\n"
             f"reason: {response.reason}\n"
-            f"text: {response.text}"
+            f"text: {response.text}",
+            AccountError,
         )
 
     def get_accounts(self):
@@ -40,11 +50,11 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/customers/me/accounts", headers=self.headers
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             accounts = response_data["data"]["items"]
             return accounts
         else:
@@ -61,9 +71,9 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(f"{self.url}/customers/me", headers=self.headers)
+        response = self.transport.get(f"{self.url}/customers/me", headers=self.headers)
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             customer = response_data["data"]
             return customer
         else:
@@ -83,11 +93,11 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/customers/me/accounts/{account_number}", headers=self.headers
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             account = response_data["data"]
             return account
         else:
@@ -107,12 +117,12 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/margin/accounts/{account_number}/requirements",
             headers=self.headers,
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             report = response_data["data"]
             return report
         else:
@@ -147,10 +157,11 @@ class TastytradeAccount:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         params = {"time-back": time_back, "start-time": start_time}
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/accounts/{account_number}/net-liq/history",
             headers=self.headers,
             params=params,
+            priority=Priority.BULK,
         )
         if response.status_code == 200:
             response_data = response.json()
@@ -177,7 +188,7 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/accounts/{account_number}/margin-requirements/{underlying_symbol}/effective",
             headers=self.headers,
         )
@@ -204,11 +215,11 @@ class TastytradeAccount:
         Raises:
             AccountError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        response = requests.get(
+        response = self.transport.get(
             f"{self.url}/accounts/{account_number}/position-limit", headers=self.headers
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             position_limit = response_data["data"]["positionLimit"]
             return position_limit
         else:
@@ -1,5 +1,7 @@
-import requests
-import json
+from ..exceptions import raise_api_error
+from ..transport import get_default_transport
+from ..scheduler import Priority
+from ..models import AccountBalance, Position, convert, convert_one
 
 
 class TastytradeAccountPositions:
@@ -9,14 +11,16 @@ class TastytradeAccountPositions:
     Args:
         session_token (str): The session token used to authenticate API requests.
         api_url (str): The base URL of the API.
+        transport (Transport): Optional. The pooled transport to send requests through.
 
     Returns:
         None
     """
 
-    def __init__(self, session_token, api_url):
+    def __init__(self, session_token, api_url, transport=None):
         self.session_token = session_token
         self.api_url = api_url
+        self.transport = transport or get_default_transport()
 
     def get_positions(
         self,
@@ -29,6 +33,7 @@ class TastytradeAccountPositions:
         partition_keys=None,
         net_positions=False,
         include_marks=False,
+        output="dicts",
     ):
         """
         Makes a GET request to the /accounts/{account_number}/positions API endpoint for the specified account's positions,
@@ -44,12 +49,14 @@ class TastytradeAccountPositions:
             partition_keys (list of str, optional): Account partition keys. Defaults to None.
             net_positions (bool, optional): Whether to return net positions grouped by instrument type and symbol. Defaults to False.
             include_marks (bool, optional): Whether to include current quote marks. Defaults to False.
+            output (str, optional): "models" to return Position models, or "columns" to return their fields as
+                typed arrays (see tastytrade_api.columns), instead of dicts. Defaults to "dicts".
 
         Returns:
             list: List of position objects, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
         params = {
@@ -62,46 +69,43 @@ class TastytradeAccountPositions:
             "net-positions": net_positions,
             "include-marks": include_marks,
         }
-        response = requests.get(
+        response = self.transport.get(
             f"{self.api_url}/accounts/{account_number}/positions",
             headers=headers,
             params=params,
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             positions = response_data["data"]["items"]
-            return positions
+            return convert(positions, Position, output)
         else:
-            raise Exception(
-                f"Error getting positions: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting positions")
 
-    def get_account_balances(self, account_number):
+    def get_account_balances(self, account_number, output="dicts"):
         """
         Makes a GET request to the /accounts/{account_number}/balances API endpoint for the account's balances,
         and returns a dictionary of balance values.
 
         Args:
             account_number (int): The account number for which to retrieve balances.
+            output (str, optional): "models" to return an AccountBalance model instead of a dict. Defaults to "dicts".
 
         Returns:
             dict: Dictionary of balance values, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
-        response = requests.get(
+        response = self.transport.get(
             f"{self.api_url}/accounts/{account_number}/balances", headers=headers
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             balances = response_data["data"]
-            return balances
+            return convert_one(balances, AccountBalance, output)
         else:
-            raise Exception(
-                f"Error getting account balances: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting account balances")
 
     def get_balance_snapshots(
         self, account_number, snapshot_date=None, time_of_day="EOD"
@@ -119,19 +123,18 @@ class TastytradeAccountPositions:
             dict: The most recent snapshot and current balance, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
         params = {"snapshot-date": snapshot_date, "time-of-day": time_of_day}
-        response = requests.get(
+        response = self.transport.get(
             f"{self.api_url}/accounts/{account_number}/balance-snapshots",
             headers=headers,
             params=params,
+            priority=Priority.BULK,
         )
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             return response_data
         else:
-            raise Exception(
-                f"Error getting balance snapshots: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting balance snapshots")
@@ -1,2 +1,5 @@
-class AccountError(Exception):
+from ..exceptions import ApiError
+
+
+class AccountError(ApiError):
     pass
@@ -0,0 +1,183 @@
+"""
+Concurrent snapshots of several accounts: details, positions, balances and margin requirements.
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..exceptions import TastytradeError
+from ..pagination import submit_in_context
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Snapshot sections, in the order they are requested for each account.
+ENDPOINTS = ("account", "positions", "balances", "margin_requirements")
+
+
+class AccountSnapshot:
+    """
+    The state of one account. A section whose request failed is None and its error is kept in `errors`.
+
+    Attributes:
+        account_number (str): The account number.
+        account (dict): The account details, see TastytradeAccount.get_customer_account.
+        positions (list): The positions, see TastytradeAccountPositions.get_positions.
+        balances (dict): The balances, see TastytradeAccountPositions.get_account_balances.
+        margin_requirements (dict): The margin report, see TastytradeAccount.get_margin_requirements.
+        errors (dict): The TastytradeError raised by each failed section.
+        latencies (dict): The time each section took, in seconds.
+    """
+
+    def __init__(self, account_number: str):
+        self.account_number = account_number
+        self.account = None
+        self.positions = None
+        self.balances = None
+        self.margin_requirements = None
+        self.errors = {}
+        self.latencies = {}
+
+    @property
+    def ok(self) -> bool:
+        """Whether every section was fetched."""
+        return not self.errors
+
+    def __repr__(self):
+        return f"AccountSnapshot({self.account_number!r}, errors={sorted(self.errors)!r})"
+
+
+class PortfolioSnapshot:
+    """
+    The snapshots of several accounts, in the order the account numbers were given.
+
+    Attributes:
+        accounts (dict): The AccountSnapshot of each account number.
+        wall_time (float): How long taking the snapshot took, in seconds.
+    """
+
+    def __init__(self, accounts: dict, wall_time: float):
+        self.accounts = accounts
+        self.wall_time = wall_time
+
+    def __getitem__(self, account_number) -> AccountSnapshot:
+        return self.accounts[account_number]
+
+    def __iter__(self):
+        return iter(self.accounts.values())
+
+    def __len__(self):
+        return len(self.accounts)
+
+    @property
+    def failed(self) -> list:
+        """The account numbers with at least one failed section."""
+        return [number for number, snapshot in self.accounts.items() if not snapshot.ok]
+
+    def endpoint_latencies(self) -> dict:
+        """
+        Returns, for each section, the number of calls and errors and the mean and maximum latency in seconds.
+        """
+        stats = {}
+        for endpoint in ENDPOINTS:
+            samples = [s.latencies[endpoint] for s in self if endpoint in s.latencies]
+            if not samples:
+                continue
+            stats[endpoint] = {
+                "calls": len(samples),
+                "errors": sum(1 for s in self if endpoint in s.errors),
+                "mean": sum(samples) / len(samples),
+                "max": max(samples),
+            }
+        return stats
+
+
+def _fetchers(account, positions, endpoints) -> dict:
+    unknown = set(endpoints) - set(ENDPOINTS)
+    if unknown:
+        raise ValueError(f"Unknown snapshot endpoints: {sorted(unknown)}")
+    return {
+        "account": account.get_customer_account,
+        "positions": positions.get_positions,
+        "balances": positions.get_account_balances,
+        "margin_requirements": account.get_margin_requirements,
+    }
+
+
+def _record(snapshot: AccountSnapshot, endpoint: str, started: float, result=None, error=None):
+    snapshot.latencies[endpoint] = time.perf_counter() - started
+    if error is None:
+        setattr(snapshot, endpoint, result)
+    else:
+        snapshot.errors[endpoint] = error
+
+
+def take_snapshot(account, positions, account_numbers=None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                  endpoints=ENDPOINTS) -> PortfolioSnapshot:
+    """
+    Fetches the details, positions, balances and margin requirements of every account concurrently.
+
+    Every (account, section) request runs on its own worker thread, at most max_concurrency at a time, with
+    the caller's deadline. An error only fails its own section: it is recorded in the account's `errors`
+    and the other sections and accounts are still fetched.
+
+    Args:
+        account (TastytradeAccount): The client used for the account details and margin requirements.
+        positions (TastytradeAccountPositions): The client used for the positions and balances.
+        account_numbers (list): Optional. The accounts to snapshot. Defaults to every account of the customer.
+        max_concurrency (int): Optional. The maximum number of requests in flight.
+        endpoints (tuple): Optional. The sections to fetch, a subset of ENDPOINTS.
+
+    Returns:
+        PortfolioSnapshot: The snapshot of each account, with the wall time and per-section latencies.
+
+    Raises:
+        AccountError: If account_numbers was not given and the accounts could not be listed.
+        ValueError: If endpoints contains an unknown section.
+    """
+    started = time.perf_counter()
+    fetchers = _fetchers(account, positions, endpoints)
+    if account_numbers is None:
+        account_numbers = [item["account"]["account-number"] for item in account.get_accounts()]
+    snapshots = {number: AccountSnapshot(number) for number in account_numbers}
+
+    def fetch(snapshot, endpoint):
+        call_started = time.perf_counter()
+        try:
+            result = fetchers[endpoint](snapshot.account_number)
+        except TastytradeError as exc:
+            _record(snapshot, endpoint, call_started, error=exc)
+        else:
+            _record(snapshot, endpoint, call_started, result)
+
+    calls = [(snapshot, endpoint) for snapshot in snapshots.values() for endpoint in endpoints]
+    if calls:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(calls)))) as executor:
+            for future in [submit_in_context(executor, fetch, *call) for call in calls]:
+                future.result()
+    return PortfolioSnapshot(snapshots, time.perf_counter() - started)
+
+
+async def atake_snapshot(account, positions, account_numbers=None, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                         endpoints=ENDPOINTS) -> PortfolioSnapshot:
+    """
+    Asyncio counterpart of take_snapshot, for AsyncTastytradeAccount and AsyncTastytradeAccountPositions.
+    """
+    started = time.perf_counter()
+    fetchers = _fetchers(account, positions, endpoints)
+    if account_numbers is None:
+        account_numbers = [item["account"]["account-number"] for item in await account.get_accounts()]
+    snapshots = {number: AccountSnapshot(number) for number in account_numbers}
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(snapshot, endpoint):
+        async with semaphore:
+            call_started = time.perf_counter()
+            try:
+                result = await fetchers[endpoint](snapshot.account_number)
+            except TastytradeError as exc:
+                _record(snapshot, endpoint, call_started, error=exc)
+            else:
+                _record(snapshot, endpoint, call_started, result)
+
+    await asyncio.gather(*(fetch(snapshot, endpoint) for snapshot in snapshots.values() for endpoint in endpoints))
+    return PortfolioSnapshot(snapshots, time.perf_counter() - started)
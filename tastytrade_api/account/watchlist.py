@@ -1,11 +1,13 @@
-import requests
-import json
+from ..codec import dumps
+from ..exceptions import raise_api_error
+from ..transport import get_default_transport
 
 class TastytradeWatchlist:
 
-    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/'):
+    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/', transport=None):
         self.api_url = api_url
         self.session_token = session_token
+        self.transport = transport or get_default_transport()
         self.headers = {
             "Authorization": f"{self.session_token}"
         }
@@ -25,20 +27,20 @@ class TastytradeWatchlist:
             dict: The response data containing the pairs watchlists.
 
         Raises:
-            Exception: If there was an error retrieving the pairs watchlists.
+            ApiError: If there was an error retrieving the pairs watchlists.
         """
         if pairs_watchlist_name is None:
             url = f"{self.api_url}/pairs-watchlists"
         else:
             url = f"{self.api_url}/pairs-watchlists/{pairs_watchlist_name}"
         
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
     
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting pairs watchlists: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting pairs watchlists")
 
     def get_public_watchlists(self, counts_only: bool = False):
         """
@@ -52,19 +54,19 @@ class TastytradeWatchlist:
             dict: A dictionary containing the response data.
 
         Raises:
-            Exception: If the API request fails.
+            ApiError: If the API request fails.
         """
         url = f"{self.api_url}/public-watchlists"
         if counts_only:
             url += "?counts-only=true"
         
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
 
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting public watchlists: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting public watchlists")
         
     def get_public_watchlist(self, watchlist_name: str):
         """
@@ -78,17 +80,17 @@ class TastytradeWatchlist:
             dict: A dictionary containing the content of the watchlist.
 
         Raises:
-            Exception: If the HTTP response status code is not 200.
+            ApiError: If the HTTP response status code is not 200.
         """
     
         url = f"{self.api_url}/public-watchlists/{watchlist_name}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
 
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting public watchlist: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting public watchlist")
         
     def create_account_watchlist(self, watchlist_data):
         """
@@ -122,14 +124,14 @@ class TastytradeWatchlist:
             ... }
         """
         url = f"{self.api_url}/watchlists"
-        payload = json.dumps(watchlist_data)
-        response = requests.post(url, headers=self.headers, data=payload)
+        payload = dumps(watchlist_data)
+        response = self.transport.post(url, headers=self.headers, data=payload)
 
         if response.status_code == 201:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error creating account watchlist: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error creating account watchlist")
     
     def get_account_watchlists(self, watchlist_name: str = None):
         """
@@ -143,20 +145,20 @@ class TastytradeWatchlist:
             A dictionary containing the watchlists data, or the data for a requested watchlist, as returned by the API.
 
         Raises:
-            Exception: If the request fails or returns a non-200 status code.
+            ApiError: If the request fails or returns a non-200 status code.
         """
         if watchlist_name is None:
             url = f"{self.api_url}/watchlists"
         else:
             url = f"{self.api_url}/watchlists/{watchlist_name}"
 
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
 
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting account watchlists: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting account watchlists")
     def update_account_watchlist(self, watchlist_name: str, watchlist_data):
         """
         Replace all properties of an account watchlist
@@ -169,14 +171,14 @@ class TastytradeWatchlist:
             dict: The updated watchlist data, including the watchlist ID and watchlist entries.
         """
         url = f"{self.api_url}/watchlists/{watchlist_name}"
-        payload = json.dumps(watchlist_data)
-        response = requests.put(url, headers=self.headers, data=payload)
+        payload = dumps(watchlist_data)
+        response = self.transport.put(url, headers=self.headers, data=payload)
 
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error updating account watchlist: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error updating account watchlist")
     def delete_account_watchlist(self, watchlist_name: str):
         """
         Deletes a watchlist for the given account.
@@ -189,9 +191,9 @@ class TastytradeWatchlist:
 
         """
         url = f"{self.api_url}/watchlists/{watchlist_name}"
-        response = requests.delete(url, headers=self.headers)
+        response = self.transport.delete(url, headers=self.headers)
 
         if response.status_code == 204:
             return {}
         else:
-            raise Exception(f"Error deleting account watchlist: {response.status_code} - {response.content}")
\ No newline at end of file
+            raise_api_error(response, "Error deleting account watchlist")
\ No newline at end of file
@@ -0,0 +1,12 @@
+"""
+Asyncio counterparts of the REST clients. Requires the optional aiohttp dependency:
+
+    pip install tastytrade-api[async]
+"""
+from .transport import AsyncTransport, AsyncResponse
+from .account_handler import AsyncTastytradeAccount
+from .balances_positions import AsyncTastytradeAccountPositions
+from .watchlist import AsyncTastytradeWatchlist
+from .instruments import AsyncTastytradeInstruments
+from .market_metrics import AsyncMarketMetrics
+from .order import AsyncTastytradeOrder
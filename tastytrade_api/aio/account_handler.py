@@ -0,0 +1,126 @@
+from ..account.exceptions import AccountError
+from ..exceptions import api_error
+from .transport import get_default_async_transport
+from ..scheduler import Priority
+
+
+class AsyncTastytradeAccount:
+    """
+    Asyncio counterpart of TastytradeAccount. Every method has the same arguments and return value as
+    its blocking version, but is a coroutine.
+
+    Unlike TastytradeAccount, the session is not validated on construction, since that would require
+    awaiting a request; an invalid session surfaces as an AccountError on the first call.
+
+    Args:
+        auth (TastytradeAuth): Authenticated session object
+        transport (AsyncTransport): Optional. The pooled async transport to send requests through.
+    """
+
+    def __init__(self, auth, transport=None):
+        self.session_token = auth.session_token
+        self.url = auth.url
+        self.transport = transport or get_default_async_transport()
+        self.headers = {"Authorization": f"{self.session_token}"}
+
+    def _raise_account_error(self, msg, response):
+        raise api_error(
+            response,
+            f"\n{msg}\n"
+            f"url: {self.url}\n"
+            f"headers: {self.headers}\n"
+            f"status_code: {response.status_code}\n"
+            f"reason: {response.reason}\n"
+            f"text: {response.text}",
+            AccountError,
+        )
+
+    async def get_accounts(self):
+        """See TastytradeAccount.get_accounts."""
+        response = await self.transport.get(
+            f"{self.url}/customers/me/accounts", headers=self.headers
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]["items"]
+        else:
+            self._raise_account_error("Error getting accounts", response)
+
+    async def get_customer(self):
+        """See TastytradeAccount.get_customer."""
+        response = await self.transport.get(f"{self.url}/customers/me", headers=self.headers)
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]
+        else:
+            self._raise_account_error("Error getting customer", response)
+
+    async def get_customer_account(self, account_number):
+        """See TastytradeAccount.get_customer_account."""
+        response = await self.transport.get(
+            f"{self.url}/customers/me/accounts/{account_number}", headers=self.headers
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]
+        else:
+            self._raise_account_error(f"Error getting account {account_number}", response)
+
+    async def get_margin_requirements(self, account_number):
+        """See TastytradeAccount.get_margin_requirements."""
+        response = await self.transport.get(
+            f"{self.url}/margin/accounts/{account_number}/requirements",
+            headers=self.headers,
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]
+        else:
+            self._raise_account_error(
+                f"Error getting margin requirements for account {account_number}",
+                response
+            )
+
+    async def get_account_net_liq_history(
+        self, account_number: str, time_back: str = None, start_time: str = None
+    ) -> dict:
+        """See TastytradeAccount.get_account_net_liq_history."""
+        params = {"time-back": time_back, "start-time": start_time}
+        response = await self.transport.get(
+            f"{self.url}/accounts/{account_number}/net-liq/history",
+            headers=self.headers,
+            params=params,
+            priority=Priority.BULK,
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            self._raise_account_error("Error getting account net liq history", response)
+
+    async def get_effective_margin_requirements(self, account_number, underlying_symbol):
+        """See TastytradeAccount.get_effective_margin_requirements."""
+        response = await self.transport.get(
+            f"{self.url}/accounts/{account_number}/margin-requirements/{underlying_symbol}/effective",
+            headers=self.headers,
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            self._raise_account_error(
+                f"Error getting effective margin requirements for account {account_number}",
+                response
+            )
+
+    async def get_position_limit(self, account_number):
+        """See TastytradeAccount.get_position_limit."""
+        response = await self.transport.get(
+            f"{self.url}/accounts/{account_number}/position-limit", headers=self.headers
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]["positionLimit"]
+        else:
+            self._raise_account_error(
+                f"Error getting position limit for account {account_number}",
+                response
+            )
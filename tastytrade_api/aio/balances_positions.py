@@ -0,0 +1,85 @@
+from ..exceptions import raise_api_error
+from .transport import get_default_async_transport
+from ..scheduler import Priority
+from ..models import AccountBalance, Position, convert, convert_one
+
+
+class AsyncTastytradeAccountPositions:
+    """
+    Asyncio counterpart of TastytradeAccountPositions.
+
+    Args:
+        session_token (str): The session token used to authenticate API requests.
+        api_url (str): The base URL of the API.
+        transport (AsyncTransport): Optional. The pooled async transport to send requests through.
+    """
+
+    def __init__(self, session_token, api_url, transport=None):
+        self.session_token = session_token
+        self.api_url = api_url
+        self.transport = transport or get_default_async_transport()
+
+    async def get_positions(
+        self,
+        account_number,
+        underlying_symbol=None,
+        symbol=None,
+        instrument_type=None,
+        include_closed_positions=False,
+        underlying_product_code=None,
+        partition_keys=None,
+        net_positions=False,
+        include_marks=False,
+        output="dicts",
+    ):
+        """See TastytradeAccountPositions.get_positions."""
+        headers = {"Authorization": f"{self.session_token}"}
+        params = {
+            "underlying-symbol": underlying_symbol,
+            "symbol": symbol,
+            "instrument-type": instrument_type,
+            "include-closed-positions": include_closed_positions,
+            "underlying-product-code": underlying_product_code,
+            "partition-keys": partition_keys,
+            "net-positions": net_positions,
+            "include-marks": include_marks,
+        }
+        response = await self.transport.get(
+            f"{self.api_url}/accounts/{account_number}/positions",
+            headers=headers,
+            params=params,
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return convert(response_data["data"]["items"], Position, output)
+        else:
+            raise_api_error(response, "Error getting positions")
+
+    async def get_account_balances(self, account_number, output="dicts"):
+        """See TastytradeAccountPositions.get_account_balances."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/accounts/{account_number}/balances", headers=headers
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return convert_one(response_data["data"], AccountBalance, output)
+        else:
+            raise_api_error(response, "Error getting account balances")
+
+    async def get_balance_snapshots(
+        self, account_number, snapshot_date=None, time_of_day="EOD"
+    ):
+        """See TastytradeAccountPositions.get_balance_snapshots."""
+        headers = {"Authorization": f"{self.session_token}"}
+        params = {"snapshot-date": snapshot_date, "time-of-day": time_of_day}
+        response = await self.transport.get(
+            f"{self.api_url}/accounts/{account_number}/balance-snapshots",
+            headers=headers,
+            params=params,
+            priority=Priority.BULK,
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting balance snapshots")
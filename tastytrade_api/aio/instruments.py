@@ -0,0 +1,173 @@
+from typing import List, Dict, Any
+from ..pagination import aiter_items
+from ..batching import DEFAULT_MAX_WORKERS, chunk_symbols, afan_out, merge_in_input_order
+from ..exceptions import raise_api_error
+from .transport import get_default_async_transport
+from ..scheduler import Priority
+from ..models import Equity, EquityOption, Future, NestedOptionChain, aconvert, convert
+
+
+class AsyncTastytradeInstruments:
+    """
+    Asyncio counterpart of TastytradeInstruments. Symbol batches are fetched as concurrent tasks, at most
+    `max_workers` at a time.
+    """
+
+    def __init__(self, session_token: str, api_url: str, transport=None, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.session_token = session_token
+        self.api_url = api_url
+        self.transport = transport or get_default_async_transport()
+        self.max_workers = max_workers
+
+    async def _get_items_in_batches(self, url: str, params: dict, key: str, symbols, error_message: str) -> List[dict]:
+        """See TastytradeInstruments._get_items_in_batches."""
+        headers = {"Authorization": f"{self.session_token}"}
+
+        async def fetch(batch):
+            batch_params = dict(params)
+            if batch is not None:
+                batch_params[key] = batch
+            response = await self.transport.get(url, headers=headers, params=batch_params, priority=Priority.BULK)
+            if response.status_code == 200:
+                response_data = response.json()
+                return response_data["data"]["items"]
+            else:
+                raise_api_error(response, error_message)
+
+        if not symbols:
+            return await fetch(None)
+        symbols = list(symbols)
+        results = await afan_out(fetch, chunk_symbols(symbols, key), self.max_workers)
+        return merge_in_input_order(symbols, results)
+
+    async def get_cryptocurrencies(self, symbols: List[str] = None) -> List[dict]:
+        """See TastytradeInstruments.get_cryptocurrencies."""
+        return await self._get_items_in_batches(
+            f"{self.api_url}/instruments/cryptocurrencies", {}, "symbol[]", symbols, "Error getting cryptocurrencies"
+        )
+    async def get_cryptocurrency_by_symbol(self, symbol: str) -> dict:
+        """See TastytradeInstruments.get_cryptocurrency_by_symbol."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/instruments/cryptocurrencies/{symbol}", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, f"Error getting cryptocurrency '{symbol}'")
+
+    async def get_active_equities(
+        self, per_page: int = 1000, page_offset: int = 0, lendability: str = None, output: str = "dicts"
+    ) -> List[dict]:
+        """See TastytradeInstruments.get_active_equities."""
+        headers = {"Authorization": f"{self.session_token}"}
+        params = {"per-page": per_page, "page-offset": page_offset, "lendability": lendability}
+        response = await self.transport.get(
+            f"{self.api_url}/instruments/equities/active",
+            headers=headers,
+            params=params,
+            priority=Priority.BULK,
+        )
+        if response.status_code != 200:
+            raise_api_error(response, "Error getting active equities")
+        if output == "dicts":
+            return response.json()
+        return convert(response.json()["data"]["items"], Equity, output)
+
+    def iter_active_equities(self, per_page: int = 1000, lendability: str = None, prefetch: int = 2,
+                             timeout: float = None, output: str = "dicts"):
+        """See TastytradeInstruments.iter_active_equities. Returns an async iterator."""
+        return aconvert(aiter_items(
+            lambda offset: self.get_active_equities(per_page=per_page, page_offset=offset, lendability=lendability),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Equity, output)
+
+    async def get_equities(self, symbols=None, lendability=None, is_index=None, is_etf=None, output="dicts"):
+        """See TastytradeInstruments.get_equities."""
+        if isinstance(symbols, str):
+            return convert(await self._get_items_in_batches(
+                f"{self.api_url}/instruments/equities/", {"symbol": symbols}, "symbol", None, "Error getting equities"
+            ), Equity, output)
+        params = {"lendability": lendability or None, "is-index": is_index, "is-etf": is_etf}
+        return convert(await self._get_items_in_batches(
+            f"{self.api_url}/instruments/equities", params, "symbol[]", symbols, "Error getting equities"
+        ), Equity, output)
+    async def get_equity_options(self, symbols=None, active=None, with_expired=None, output="dicts"):
+        """See TastytradeInstruments.get_equity_options."""
+        if isinstance(symbols, str):
+            return convert(await self._get_items_in_batches(
+                f"{self.api_url}/instruments/equity-options/", {"symbol": symbols}, "symbol", None,
+                "Error getting equity options"
+            ), EquityOption, output)
+        params = {"active": active, "with-expired": with_expired}
+        return convert(await self._get_items_in_batches(
+            f"{self.api_url}/instruments/equity-options", params, "symbol[]", symbols, "Error getting equity options"
+        ), EquityOption, output)
+    async def get_futures(self, symbols=None, product_codes=None, output="dicts"):
+        """See TastytradeInstruments.get_futures."""
+        if isinstance(symbols, str):
+            symbols = [symbols]
+        params = {"product-code[]": product_codes or None}
+        return convert(await self._get_items_in_batches(
+            f"{self.api_url}/instruments/futures", params, "symbol[]", symbols, "Error getting futures"
+        ), Future, output)
+    async def get_future_option_products(self):
+        """See TastytradeInstruments.get_future_option_products."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/instruments/future-option-products", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]["items"]
+        else:
+            raise_api_error(response, "Error getting future option products")
+
+    async def get_future_products(self):
+        """See TastytradeInstruments.get_future_products."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/instruments/future-products", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]["items"]
+        else:
+            raise_api_error(response, "Error getting future products")
+
+    async def get_quantity_decimal_precisions(self):
+        """See TastytradeInstruments.get_quantity_decimal_precisions."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/instruments/quantity-decimal-precisions", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]
+        else:
+            raise_api_error(response, "Error getting quantity decimal precisions")
+
+    async def get_option_chains(self, symbol: str, output: str = "dicts"):
+        """See TastytradeInstruments.get_option_chains."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/option-chains/{symbol}/nested", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return convert(response_data["data"]["items"], NestedOptionChain, output)
+        else:
+            raise_api_error(response, f"Error getting symbol data for {symbol}")
+
+    async def get_symbol_data(self, symbol: str) -> List[Dict[str, Any]]:
+        """See TastytradeInstruments.get_symbol_data."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/symbols/search/{symbol}", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            response_data = response.json()
+            return response_data["data"]["items"]
+        else:
+            raise_api_error(response, f"Error getting symbol data for {symbol}")
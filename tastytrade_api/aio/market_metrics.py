@@ -0,0 +1,70 @@
+from typing import List
+from ..batching import DEFAULT_MAX_WORKERS, chunk_symbols, afan_out, merge_in_input_order
+from ..exceptions import raise_api_error
+from .transport import get_default_async_transport
+from ..scheduler import Priority
+from ..models import MarketMetric, convert
+
+
+class AsyncMarketMetrics:
+    """
+    Asyncio counterpart of MarketMetrics.
+
+    Args:
+        session_token (str): The session token used to authenticate API requests.
+        api_url (str): The base URL of the API.
+        transport (AsyncTransport): Optional. The pooled async transport to send requests through.
+        max_workers (int): Optional. The maximum number of symbol batches fetched concurrently by get_metrics.
+    """
+
+    def __init__(self, session_token, api_url, transport=None, max_workers=DEFAULT_MAX_WORKERS):
+        self.session_token = session_token
+        self.api_url = api_url
+        self.transport = transport or get_default_async_transport()
+        self.max_workers = max_workers
+
+    async def get_metrics(self, symbols: List[str], output: str = "dicts") -> dict:
+        """See MarketMetrics.get_metrics."""
+        headers = {"Authorization": f"{self.session_token}"}
+
+        async def fetch(batch):
+            params = {"symbols": ",".join(batch)}
+            response = await self.transport.get(f"{self.api_url}/market-metrics", headers=headers, params=params, priority=Priority.BULK)
+            if response.status_code == 200:
+                return response.json()
+            else:
+                raise_api_error(response, "Error getting market metrics")
+
+        symbols = list(symbols)
+        batches = chunk_symbols(symbols, "symbols", joined=True) or [[]]
+        responses = await afan_out(fetch, batches, self.max_workers)
+        if output != "dicts":
+            return convert(merge_in_input_order(symbols, (r["data"]["items"] for r in responses)), MarketMetric, output)
+        if len(responses) == 1:
+            return responses[0]
+        # Build a new document rather than updating the first batch, whose decoded JSON may be shared.
+        merged = dict(responses[0])
+        merged["data"] = dict(merged["data"], items=merge_in_input_order(symbols, (r["data"]["items"] for r in responses)))
+        return merged
+
+    async def get_dividend_data(self, symbol):
+        """See MarketMetrics.get_dividend_data."""
+        headers = {"Authorization": f"{self.session_token}"}
+        response = await self.transport.get(
+            f"{self.api_url}/market-metrics/historic-corporate-events/dividends/{symbol}", headers=headers, priority=Priority.BULK
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, f"Error getting dividend data for symbol {symbol}")
+
+    async def get_earnings_data(self, symbol: str, start_date: str = None) -> dict:
+        """See MarketMetrics.get_earnings_data."""
+        headers = {"Authorization": f"{self.session_token}"}
+        url = f"{self.api_url}/market-metrics/historic-corporate-events/earnings-reports/{symbol}"
+        params = {"start-date": start_date}
+        response = await self.transport.get(url, headers=headers, params=params, priority=Priority.BULK)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, f"Error getting earnings data for {symbol}")
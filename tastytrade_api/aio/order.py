@@ -0,0 +1,187 @@
+from ..pagination import aiter_items
+from ..exceptions import raise_api_error
+from .transport import get_default_async_transport
+from ..scheduler import Priority
+from ..models import Order, aconvert, convert_one
+
+
+class AsyncTastytradeOrder:
+    """
+    Asyncio counterpart of TastytradeOrder.
+    """
+
+    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/accounts', transport=None):
+        self.api_url = api_url
+        self.session_token = session_token
+        self.transport = transport or get_default_async_transport()
+        self.headers = {
+            "Authorization": f"{self.session_token}"
+        }
+
+    async def reconfirm_order(self, account_number, order_id):
+        """See TastytradeOrder.reconfirm_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/reconfirm"
+        response = await self.transport.post(url, headers=self.headers, priority=Priority.ORDERS)
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise_api_error(response, "Error reconfirming order")
+
+    async def dry_run_order(self, account_number, order_id, order_data):
+        """See TastytradeOrder.dry_run_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/dry-run"
+        response = await self.transport.post(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise_api_error(response, "Error running dry run order")
+
+    async def get_order(self, account_number, order_id, output="dicts"):
+        """See TastytradeOrder.get_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            if output == "dicts":
+                return response.json()
+            return convert_one(response.json()["data"], Order, output)
+        else:
+            raise_api_error(response, "Error getting order")
+
+    async def cancel_order(self, account_number, order_id):
+        """See TastytradeOrder.cancel_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
+        response = await self.transport.delete(url, headers=self.headers, priority=Priority.ORDERS)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error cancelling order")
+
+    async def replace_order(self, account_number, order_id, order_data):
+        """See TastytradeOrder.replace_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
+        response = await self.transport.put(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error replacing order")
+
+    async def edit_order(self, account_number, order_id, order_data):
+        """See TastytradeOrder.edit_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
+        response = await self.transport.patch(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error editing order")
+
+    async def get_live_orders(self, account_number):
+        """See TastytradeOrder.get_live_orders."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/live"
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting live orders")
+
+    async def get_orders(self, account_number, per_page=10, page_offset=0, start_date=None, end_date=None, underlying_symbol=None,
+                         status=None, futures_symbol=None, underlying_instrument_type=None, sort='Desc', start_at=None, end_at=None):
+        """See TastytradeOrder.get_orders."""
+        url = f"{self.api_url}/accounts/{account_number}/orders"
+        params = {
+            "per-page": per_page,
+            "page-offset": page_offset,
+            "start-date": start_date,
+            "end-date": end_date,
+            "underlying-symbol": underlying_symbol,
+            "status[]": status,
+            "futures-symbol": futures_symbol,
+            "underlying-instrument-type": underlying_instrument_type,
+            "sort": sort,
+            "start-at": start_at,
+            "end-at": end_at
+        }
+        response = await self.transport.get(url, headers=self.headers, params=params, priority=Priority.BULK)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting orders")
+
+    def iter_orders(self, account_number, per_page=100, prefetch=2, timeout=None, output="dicts", **filters):
+        """See TastytradeOrder.iter_orders. Returns an async iterator."""
+        return aconvert(aiter_items(
+            lambda offset: self.get_orders(account_number, per_page=per_page, page_offset=offset, **filters),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Order, output)
+
+    async def create_order(self, account_number, order):
+        """See TastytradeOrder.create_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders"
+        headers = {
+            "Authorization": f"{self.session_token}",
+            "Content-Type": "application/json"
+        }
+        response = await self.transport.post(url, headers=headers, json=order, priority=Priority.ORDERS)
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise_api_error(response, "Error creating order")
+
+    async def dry_run_new_order(self, account_number, order_data):
+        """See TastytradeOrder.dry_run_new_order."""
+        url = f"{self.api_url}/accounts/{account_number}/orders/dry-run"
+        response = await self.transport.post(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise_api_error(response, "Error running dry run new order")
+
+    async def get_customer_live_orders(self, customer_id):
+        """See TastytradeOrder.get_customer_live_orders."""
+        url = f"{self.api_url}/customers/{customer_id}/orders/live"
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, f"Error getting live orders for customer {customer_id}")
+
+    async def get_customer_orders(self, customer_id, per_page=10, page_offset=0, start_date=None, end_date=None,
+                                  underlying_symbol=None, status=None, futures_symbol=None, underlying_instrument_type=None,
+                                  sort='Desc', start_at=None, end_at=None):
+        """See TastytradeOrder.get_customer_orders."""
+        response_data = await self._get_customer_orders_page(
+            customer_id, per_page, page_offset, start_date, end_date, underlying_symbol, status, futures_symbol,
+            underlying_instrument_type, sort, start_at, end_at
+        )
+        return response_data["data"]["items"]
+
+    def iter_customer_orders(self, customer_id, per_page=100, prefetch=2, timeout=None, output="dicts", **filters):
+        """See TastytradeOrder.iter_customer_orders. Returns an async iterator."""
+        return aconvert(aiter_items(
+            lambda offset: self._get_customer_orders_page(customer_id, per_page=per_page, page_offset=offset, **filters),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Order, output)
+
+    async def _get_customer_orders_page(self, customer_id, per_page=10, page_offset=0, start_date=None, end_date=None,
+                                        underlying_symbol=None, status=None, futures_symbol=None,
+                                        underlying_instrument_type=None, sort='Desc', start_at=None, end_at=None):
+        url = f"{self.api_url}/customers/{customer_id}/orders"
+        params = {
+            "per-page": per_page,
+            "page-offset": page_offset,
+            "start-date": start_date,
+            "end-date": end_date,
+            "underlying-symbol": underlying_symbol,
+            "status[]": status,
+            "futures-symbol": futures_symbol,
+            "underlying-instrument-type": underlying_instrument_type,
+            "sort": sort,
+            "start-at": start_at,
+            "end-at": end_at
+        }
+        response = await self.transport.get(url, headers=self.headers, params=params, priority=Priority.BULK)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting customer orders")
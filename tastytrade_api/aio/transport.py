@@ -0,0 +1,320 @@
+import asyncio
+import logging
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from ..cache import CacheEntry
+from ..codec import encode_json_body, loads
+from ..coalescing import COALESCED_METHODS, request_key, share_json
+from ..deadline import DeadlineExceeded, Timeout, check_deadline, clamp, deadline, remaining
+from ..exceptions import TransportError
+from ..retry import DEFAULT_RETRY
+from ..scheduler import Priority
+from ..transport import DEFAULT_HEADERS, DEFAULT_TIMEOUT, retries_response, with_token
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncResponse:
+    """
+    A fully-read HTTP response with the subset of the requests.Response interface used by the clients.
+    """
+
+    def __init__(self, status_code: int, reason: str, headers, content: bytes, url: str, method: str = None):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.method = method
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return loads(self.content)
+
+
+def _cached_response(entry: CacheEntry) -> AsyncResponse:
+    return AsyncResponse(entry.status_code, "OK", dict(entry.headers), entry.content, entry.url, "GET")
+
+
+def _to_client_timeout(timeout):
+    """
+    Converts a timeout into an aiohttp.ClientTimeout whose total is shortened to fit the current deadline.
+    A number is a total timeout and a tuple a (connect, read) timeout.
+    """
+    left = remaining()
+    if isinstance(timeout, aiohttp.ClientTimeout):
+        if left is None:
+            return timeout
+        return aiohttp.ClientTimeout(total=clamp(timeout.total, left), connect=timeout.connect,
+                                     sock_read=timeout.sock_read, sock_connect=timeout.sock_connect)
+    if isinstance(timeout, Timeout):
+        return aiohttp.ClientTimeout(total=left, sock_connect=timeout.connect, sock_read=timeout.read)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return aiohttp.ClientTimeout(total=left, sock_connect=connect, sock_read=read)
+    return aiohttp.ClientTimeout(total=clamp(timeout, left))
+
+
+def _encode_params(params):
+    """
+    Encodes query parameters the way requests does: None values are dropped, lists are sent as
+    repeated keys and booleans become "True"/"False".
+    """
+    if not params:
+        return None
+    encoded = []
+    for key, value in params.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, (list, tuple)) else [value]
+        for item in values:
+            encoded.append((key, str(item)))
+    return encoded
+
+
+class AsyncTransport:
+    """
+    Owns an aiohttp connection pool shared by the asyncio clients.
+
+    The pool is created lazily inside the running event loop, so an AsyncTransport can be constructed
+    at import time and shared by every async client. Used from another event loop, it closes the pool of the
+    previous loop and opens a new one; await close() before a loop ends to release its connections.
+
+    Args:
+        headers (dict): Optional. Default headers sent with every request, merged over DEFAULT_HEADERS.
+        timeout (float, tuple or Timeout): Optional. Default (connect, read) timeout, a total timeout in seconds,
+            or a Timeout whose `total` bounds each call, retries included.
+        limit (int): Optional. Maximum number of simultaneous connections.
+        limit_per_host (int): Optional. Maximum number of simultaneous connections to one host.
+        scheduler (RequestScheduler): Optional. Rate limiter every request waits on before being sent. It can
+            be shared with a blocking Transport so both draw from the same budget.
+        retry (RetryPolicy): Optional. Which failed requests are sent again, see Transport.
+        coalescer (SingleFlight): Optional. Merges identical concurrent GET requests, see Transport.
+        cache (ResponseCache): Optional. Caches reference-data GET responses, see Transport.
+        session_manager (SessionManager): Optional. Supplies the session token and re-logs in on 401, see
+            Transport.
+    """
+
+    def __init__(self, headers=None, timeout=DEFAULT_TIMEOUT, limit=100, limit_per_host=0, scheduler=None,
+                 retry=DEFAULT_RETRY, coalescer=None, cache=None, session_manager=None):
+        if aiohttp is None:
+            raise ImportError("AsyncTransport requires aiohttp: pip install tastytrade-api[async]")
+        self.headers = dict(DEFAULT_HEADERS)
+        if headers:
+            self.headers.update(headers)
+        self.timeout = timeout
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.scheduler = scheduler
+        self.retry = retry
+        self.coalescer = coalescer
+        self.cache = cache
+        self.session_manager = session_manager
+        self._session = None
+        self._loop = None
+
+    async def _get_session(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            await self._release_session()
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+            )
+            self._loop = loop
+        return self._session
+
+    async def _release_session(self):
+        """
+        Closes the pool of the event loop the transport was used in before, whose connections cannot be used
+        from the running one.
+
+        Raises:
+            RuntimeError: If that loop was stopped without being closed, so its pool can be closed neither there
+                nor here.
+        """
+        session, loop = self._session, self._loop
+        self._session = self._loop = None
+        if session is None or session.closed:
+            return
+        if loop.is_running():
+            # The loop runs in another thread; close the pool there.
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(session.close(), loop))
+        elif loop.is_closed():
+            # Nothing runs on a closed loop any more, so this only marks the pool closed; its sockets are freed
+            # with it. Awaiting close() before the loop ends closes them properly.
+            logger.warning("AsyncTransport was not closed before its event loop ended")
+            await session.close()
+        else:
+            self._session, self._loop = session, loop
+            raise RuntimeError("AsyncTransport is open in a stopped event loop; await its close() in that loop "
+                               "before using it in another one")
+
+    async def request(self, method: str, url: str, params=None, timeout=None, priority: str = Priority.DEFAULT,
+                      **kwargs) -> AsyncResponse:
+        """
+        Sends a request through the pooled session and reads the whole body.
+
+        When a scheduler is configured, the request first waits for its turn in the `priority` lane, and a
+        429 Too Many Requests response is resent once the scheduler's Retry-After pause is over. Requests the
+        retry policy allows are sent again after a jittered backoff on connection errors and retryable statuses.
+        Every attempt is bounded by the current deadline, identical concurrent GET requests are merged when a
+        coalescer is configured, reference data is served from the cache when one is configured, and the
+        session token is supplied by the session manager when one is configured, see Transport.request.
+
+        Args:
+            method (str): The HTTP method, e.g. "GET".
+            url (str): The absolute URL of the request.
+            params (dict): Optional. Query parameters, encoded the same way as requests encodes them.
+            timeout (float, tuple or Timeout): Optional. Overrides the default timeout for this call.
+            priority (str): Optional. The scheduler lane of the request, see Priority.
+            **kwargs: Any other keyword argument accepted by aiohttp.ClientSession.request.
+
+        Returns:
+            AsyncResponse: The response returned by the server. Status codes are not checked here.
+
+        Raises:
+            DeadlineExceeded: If the deadline or the total timeout ran out.
+            TransportError: If the request could not be sent or its response could not be read.
+        """
+        encode_json_body(kwargs)
+        if self.cache is not None and method.upper() == "GET":
+            ttl = self.cache.ttl_for(url)
+            if ttl:
+                return await self._cached_get(url, params, timeout, priority, kwargs, ttl)
+        return await self._fetch(method, url, params, timeout, priority, kwargs)
+
+    async def _cached_get(self, url, params, timeout, priority, kwargs, ttl) -> AsyncResponse:
+        key = request_key("GET", url, params)
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return _cached_response(entry)
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        response = await self._fetch("GET", url, params, timeout, priority, kwargs)
+        entry = self.cache.update(key, entry, response, ttl)
+        return response if entry is None else _cached_response(entry)
+
+    async def _fetch(self, method, url, params, timeout, priority, kwargs) -> AsyncResponse:
+        if self.coalescer is not None and method.upper() in COALESCED_METHODS:
+            key = request_key(method, url, params, kwargs.get("headers"))
+
+            async def send():
+                return share_json(await self._request(method, url, params, timeout, priority, kwargs))
+
+            return await self.coalescer.do_async(key, send)
+        return await self._request(method, url, params, timeout, priority, kwargs)
+
+    async def _request(self, method, url, params, timeout, priority, kwargs) -> AsyncResponse:
+        timeout = self.timeout if timeout is None else timeout
+        total = timeout.total if isinstance(timeout, Timeout) else None
+        params = _encode_params(params)
+        endpoint = f"{method} {url}"
+        with deadline(total):
+            attempt = 1
+            while True:
+                try:
+                    response = await self._send_scheduled(method, url, params, priority, timeout, kwargs)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                    left = remaining()
+                    if left is not None and left <= 0:
+                        raise DeadlineExceeded(f"Deadline exceeded sending {endpoint}: {exc!r}",
+                                               endpoint=endpoint) from exc
+                    if self.retry is not None and self.retry.can_retry(method, attempt):
+                        delay = self.retry.delay(attempt)
+                        check_deadline(endpoint, needed=delay)
+                        await asyncio.sleep(delay)
+                        attempt += 1
+                        continue
+                    raise TransportError(f"Error sending {endpoint}: {exc!r}", endpoint=endpoint) from exc
+
+                if retries_response(self.retry, self.scheduler, method, response, attempt):
+                    delay = self.retry.delay(attempt, response)
+                    left = remaining()
+                    if left is not None and left <= delay:
+                        return response
+                    await asyncio.sleep(delay)
+                    attempt += 1
+                    continue
+                return response
+
+    async def _send_scheduled(self, method, url, params, priority, timeout, kwargs) -> AsyncResponse:
+        if self.scheduler is None:
+            return await self._send(method, url, params, timeout, kwargs)
+
+        for _ in range(self.scheduler.max_throttle_retries + 1):
+            await self.scheduler.acquire_async(priority)
+            response = await self._send(method, url, params, timeout, kwargs)
+            if response.status_code != 429:
+                break
+            self.scheduler.throttled(priority, response.headers.get("Retry-After"))
+        return response
+
+    async def _send(self, method, url, params, timeout, kwargs) -> AsyncResponse:
+        manager = self.session_manager
+        if manager is None or not manager.authorizes(url):
+            return await self._send_authorized(method, url, params, timeout, kwargs)
+
+        token = await manager.token_async()
+        response = await self._send_authorized(method, url, params, timeout, with_token(kwargs, token))
+        if response.status_code == 401:
+            token = await manager.renew_async(token)
+            response = await self._send_authorized(method, url, params, timeout, with_token(kwargs, token))
+        return response
+
+    async def _send_authorized(self, method, url, params, timeout, kwargs) -> AsyncResponse:
+        check_deadline(f"{method} {url}")
+        session = await self._get_session()
+        async with session.request(method, url, params=params, timeout=_to_client_timeout(timeout),
+                                   **kwargs) as response:
+            content = await response.read()
+            return AsyncResponse(response.status, response.reason, response.headers, content, str(response.url), method)
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self):
+        """Closes every pooled connection."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+
+_default_transport = None
+
+
+def get_default_async_transport() -> AsyncTransport:
+    """
+    Returns the process-wide AsyncTransport used by async clients that were not given one explicitly.
+    """
+    global _default_transport
+    if _default_transport is None:
+        _default_transport = AsyncTransport()
+    return _default_transport
@@ -0,0 +1,93 @@
+from ..codec import dumps
+from ..exceptions import raise_api_error
+from .transport import get_default_async_transport
+
+
+class AsyncTastytradeWatchlist:
+    """
+    Asyncio counterpart of TastytradeWatchlist.
+    """
+
+    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/', transport=None):
+        self.api_url = api_url
+        self.session_token = session_token
+        self.transport = transport or get_default_async_transport()
+        self.headers = {
+            "Authorization": f"{self.session_token}"
+        }
+
+    async def get_pairs_watchlists(self, pairs_watchlist_name: str = None):
+        """See TastytradeWatchlist.get_pairs_watchlists."""
+        if pairs_watchlist_name is None:
+            url = f"{self.api_url}/pairs-watchlists"
+        else:
+            url = f"{self.api_url}/pairs-watchlists/{pairs_watchlist_name}"
+
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting pairs watchlists")
+
+    async def get_public_watchlists(self, counts_only: bool = False):
+        """See TastytradeWatchlist.get_public_watchlists."""
+        url = f"{self.api_url}/public-watchlists"
+        if counts_only:
+            url += "?counts-only=true"
+
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting public watchlists")
+
+    async def get_public_watchlist(self, watchlist_name: str):
+        """See TastytradeWatchlist.get_public_watchlist."""
+        url = f"{self.api_url}/public-watchlists/{watchlist_name}"
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting public watchlist")
+
+    async def create_account_watchlist(self, watchlist_data):
+        """See TastytradeWatchlist.create_account_watchlist."""
+        url = f"{self.api_url}/watchlists"
+        payload = dumps(watchlist_data)
+        response = await self.transport.post(url, headers=self.headers, data=payload)
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise_api_error(response, "Error creating account watchlist")
+
+    async def get_account_watchlists(self, watchlist_name: str = None):
+        """See TastytradeWatchlist.get_account_watchlists."""
+        if watchlist_name is None:
+            url = f"{self.api_url}/watchlists"
+        else:
+            url = f"{self.api_url}/watchlists/{watchlist_name}"
+
+        response = await self.transport.get(url, headers=self.headers)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error getting account watchlists")
+
+    async def update_account_watchlist(self, watchlist_name: str, watchlist_data):
+        """See TastytradeWatchlist.update_account_watchlist."""
+        url = f"{self.api_url}/watchlists/{watchlist_name}"
+        payload = dumps(watchlist_data)
+        response = await self.transport.put(url, headers=self.headers, data=payload)
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise_api_error(response, "Error updating account watchlist")
+
+    async def delete_account_watchlist(self, watchlist_name: str):
+        """See TastytradeWatchlist.delete_account_watchlist."""
+        url = f"{self.api_url}/watchlists/{watchlist_name}"
+        response = await self.transport.delete(url, headers=self.headers)
+        if response.status_code == 204:
+            return {}
+        else:
+            raise_api_error(response, "Error deleting account watchlist")
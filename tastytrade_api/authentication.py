@@ -1,10 +1,34 @@
-import requests
+from .transport import get_default_transport
 import time
 from typing import Dict, Optional
-from .exceptions import ValidationError
+from .exceptions import ValidationError, api_error
+from .models import to_datetime
+
+
+def session_expiration(data: dict) -> Optional[float]:
+    """
+    Returns the time.time() at which the session of a login response expires, from its session-expiration, or
+    None if the response does not report it.
+    """
+    expiration = data["data"].get("session-expiration")
+    return to_datetime(expiration).timestamp() if expiration else None
+
 
 class TastytradeAuth:
-    def __init__(self, username: str, password: str = None, remember_token: str = None):
+    """
+    Creates and holds a Tastytrade API session.
+
+    Args:
+        username (str): The username or email of the user.
+        password (str): Optional. The password of the user.
+        remember_token (str): Optional. A remember token to log in with instead of the password.
+        transport (Transport): Optional. The pooled transport to send requests through.
+        session_store (FileSessionStore): Optional. When given, login() and refresh_session() reuse a valid
+            session saved by another process, and otherwise save the new one for them, see FileSessionStore.
+    """
+
+    def __init__(self, username: str, password: str = None, remember_token: str = None, transport=None,
+                 session_store=None):
         self.username = username
         self.password = password
         self.remember_token = remember_token
@@ -12,15 +36,21 @@ class TastytradeAuth:
         self.session_token = None
         self.user_data = None
         self.token_timestamp = None
+        # The time.time() at which the session expires, as reported by the server; None if it was not.
+        self.session_expiration = None
+        self.transport = transport or get_default_transport()
+        self.session_store = session_store
 
     def _raise_validation_error(self, response):
-        raise ValidationError(
+        raise api_error(
+            response,
             f"\nurl: {self.url}\n"
             f"session_token: {self.session_token}\n"
             f"user_data: {self.user_data}\n"
             f"status_code: {response.status_code}\n"
             f"reason: {response.reason}\n"
-            f"text: {response.text}")
+            f"text: {response.text}",
+            ValidationError)
 
     def login(self, two_factor_code: str = None) -> Dict[str, str]:
         """
@@ -35,6 +65,11 @@ class TastytradeAuth:
         Raises:
             ValidationError: If the session is invalid or there's an error.
         """
+        if self.session_store is not None:
+            return self.session_store.share(self, lambda: self._login(two_factor_code))
+        return self._login(two_factor_code)
+
+    def _login(self, two_factor_code) -> Dict[str, str]:
         payload = {"login": self.username, "remember-me": "true"}
 
         if self.password:
@@ -48,18 +83,60 @@ class TastytradeAuth:
         if two_factor_code:
             headers["X-Tastyworks-OTP"] = two_factor_code
 
-        response = requests.post(f"{self.url}/sessions", headers=headers, data=payload)
+        return self._create_session(payload, headers)
+
+    def refresh_session(self) -> Dict[str, str]:
+        """
+        Replaces the current session with a new one, created with the remember token obtained at the last login
+        so that no two-factor code is needed. Falls back to the password when there is no remember token or it
+        was rejected.
+
+        Returns:
+            Optional[Dict[str, str]]: A dictionary containing the user's session token and other related data.
+
+        Raises:
+            ValidationError: If no new session could be created.
+        """
+        if self.session_store is not None:
+            return self.session_store.share(self, self._refresh_session)
+        return self._refresh_session()
+
+    def _refresh_session(self) -> Dict[str, str]:
+        if not self.remember_token:
+            return self._login(None)
+
+        payload = {"login": self.username, "remember-me": "true", "remember-token": self.remember_token}
+        try:
+            return self._create_session(payload, {})
+        except ValidationError:
+            if not self.password:
+                raise
+            return self._login(None)
+
+    def _create_session(self, payload, headers) -> Dict[str, str]:
+        response = self.transport.post(f"{self.url}/sessions", headers=headers, data=payload)
 
         if response.status_code == 201:
             data = response.json()
-            self.session_token = data["data"]["session-token"]
-            self.remember_token = data["data"]["remember-token"]
-            self.user_data = data["data"]["user"]
-            self.token_timestamp = time.time()
+            self.apply_session(data, time.time())
             return data
         else:
             self._raise_validation_error(response)
 
+    def apply_session(self, data: Dict[str, str], token_timestamp: float):
+        """
+        Takes over a session created elsewhere.
+
+        Args:
+            data (dict): The response of the login that created the session.
+            token_timestamp (float): The time.time() of that login.
+        """
+        self.session_token = data["data"]["session-token"]
+        self.remember_token = data["data"]["remember-token"]
+        self.user_data = data["data"]["user"]
+        self.token_timestamp = token_timestamp
+        self.session_expiration = session_expiration(data)
+
     def validate_session(self) -> Dict[str, str]:
         """
         Validates the current session using the session token.
@@ -71,7 +148,7 @@ class TastytradeAuth:
             ValidationError: If the session is invalid or there's an error.
         """
         headers = {"Authorization": self.session_token}
-        response = requests.post(f"{self.url}/sessions/validate", headers=headers)
+        response = self.transport.post(f"{self.url}/sessions/validate", headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -87,12 +164,15 @@ class TastytradeAuth:
             ValidationError: If the session is invalid or there's an error.
         """
         headers = {"Authorization": self.session_token}
-        response = requests.delete(f"{self.url}/sessions", headers=headers)
+        response = self.transport.delete(f"{self.url}/sessions", headers=headers)
 
         if response.status_code == 204:
             self.session_token = None
             self.remember_token = None
             self.user_data = None
+            self.session_expiration = None
+            if self.session_store is not None:
+                self.session_store.delete(self.username)
         else:
             self._raise_validation_error(response)
 
@@ -107,11 +187,9 @@ class TastytradeAuth:
         Raises:
             ValidationError: If the session is invalid or there's an error.
         """
-        self.validate_session()
-
         url = f"{self.url}/quote-streamer-tokens"
         headers = {"Authorization": self.session_token}
-        response = requests.get(url, headers=headers)
+        response = self.transport.get(url, headers=headers)
 
         if response.status_code == 200:
             data = response.json()
@@ -151,14 +229,11 @@ class TastytradeAuth:
         }
 
         headers = {}
-        response = requests.post(f"{self.url}/sessions", headers=headers, json=payload)
+        response = self.transport.post(f"{self.url}/sessions", headers=headers, json=payload)
 
         if response.status_code == 201:
             data = response.json()
-            self.session_token = data["data"]["session-token"]
-            self.remember_token = data["data"]["remember-token"]
-            self.user_data = data["data"]["user"]
-            self.token_timestamp = time.time()
+            self.apply_session(data, time.time())
             return data
         else:
             self._raise_validation_error(response)
@@ -0,0 +1,84 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from urllib.parse import quote_plus
+
+from .pagination import submit_in_context
+
+# Keep query strings well below the 8 KB request-line limit common to proxies and load balancers.
+MAX_QUERY_LENGTH = 4000
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def chunk_symbols(symbols, key: str, max_query_length: int = MAX_QUERY_LENGTH, joined: bool = False):
+    """
+    Splits symbols into batches whose encoded query string stays under max_query_length.
+
+    Args:
+        symbols (list): The symbols to split.
+        key (str): The query parameter the symbols are sent in, e.g. "symbol[]".
+        max_query_length (int): Optional. The maximum length of the encoded query string of one batch.
+        joined (bool): Optional. True if the batch is sent as one comma-separated value (key=A,B,C)
+            rather than as a repeated key (key=A&key=B).
+
+    Returns:
+        list: A list of symbol lists, in input order.
+    """
+    batches = []
+    batch = []
+    length = len(quote_plus(key)) + 1 if joined else 0
+    base_length = length
+    for symbol in symbols:
+        if joined:
+            cost = len(quote_plus(symbol)) + (3 if batch else 0)  # an encoded comma is "%2C"
+        else:
+            cost = len(quote_plus(key)) + len(quote_plus(symbol)) + 2  # "key=value&"
+        if batch and length + cost > max_query_length:
+            batches.append(batch)
+            batch = []
+            length = base_length
+            cost = len(quote_plus(symbol)) if joined else cost
+        batch.append(symbol)
+        length += cost
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def fan_out(fetch, batches, max_workers: int = DEFAULT_MAX_WORKERS) -> list:
+    """
+    Calls fetch for every batch, at most max_workers at a time, and returns the results in batch order.
+    A single batch is fetched on the calling thread. The workers see the caller's deadline.
+    """
+    if len(batches) <= 1 or max_workers <= 1:
+        return [fetch(batch) for batch in batches]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(batches))) as executor:
+        futures = [submit_in_context(executor, fetch, batch) for batch in batches]
+        return [future.result() for future in futures]
+
+
+async def afan_out(fetch, batches, max_workers: int = DEFAULT_MAX_WORKERS) -> list:
+    """
+    Asyncio counterpart of fan_out. `fetch` is a coroutine function.
+    """
+    semaphore = asyncio.Semaphore(max(1, max_workers))
+
+    async def bounded(batch):
+        async with semaphore:
+            return await fetch(batch)
+
+    return await asyncio.gather(*(bounded(batch) for batch in batches))
+
+
+def merge_in_input_order(symbols, results, key: str = "symbol") -> list:
+    """
+    Flattens the per-batch item lists and orders the items like the requested symbols. Items whose
+    symbol was not requested verbatim keep their relative order at the end.
+    """
+    position = {}
+    for index, symbol in enumerate(symbols):
+        position.setdefault(symbol, index)
+    items = list(chain.from_iterable(results))
+    unmatched = len(position)
+    return sorted(items, key=lambda item: position.get(item.get(key), unmatched))
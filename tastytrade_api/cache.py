@@ -0,0 +1,305 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from urllib.parse import urlsplit
+
+import requests
+
+# Seconds a response of each reference-data endpoint stays fresh, keyed by a glob pattern over the URL path.
+DEFAULT_TTLS = {
+    "*/instruments/future-products": 24 * 3600,
+    "*/instruments/future-option-products": 24 * 3600,
+    "*/instruments/quantity-decimal-precisions": 24 * 3600,
+    "*/option-chains/*": 3600,
+    "*/market-metrics/historic-corporate-events/*": 6 * 3600,
+}
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheEntry:
+    """
+    A stored response, along with the validators used to revalidate it once it is stale.
+    """
+
+    def __init__(self, status_code: int, headers: dict, content: bytes, url: str, expires_at: float):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.expires_at = expires_at
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: float = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    def validators(self) -> dict:
+        """Returns the conditional request headers that revalidate this entry, if the server sent any validator."""
+        headers = {}
+        if self.headers.get("ETag"):
+            headers["If-None-Match"] = self.headers["ETag"]
+        if self.headers.get("Last-Modified"):
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+
+def _find_header(headers, name):
+    for key, value in headers.items():
+        if key.lower() == name.lower():
+            return value
+    return None
+
+
+class MemoryCacheBackend:
+    """
+    In-process cache storage that evicts the least recently used entries once the stored bodies exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry: CacheEntry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous.size
+            if entry.size > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self.size += entry.size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry.size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+class SQLiteCacheBackend:
+    """
+    On-disk cache storage in a SQLite database, so reference data survives restarts and can be shared
+    by several processes. The least recently used entries are evicted once the stored bodies exceed max_bytes.
+
+    Args:
+        path (str): The database file. ":memory:" keeps the database in memory.
+        max_bytes (int): Optional. The maximum total size of the stored bodies.
+    """
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " status_code INTEGER NOT NULL,"
+            " headers TEXT NOT NULL,"
+            " content BLOB NOT NULL,"
+            " url TEXT NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @staticmethod
+    def _key(key) -> str:
+        return json.dumps(key)
+
+    @property
+    def size(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, key):
+        key = self._key(key)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, url, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        status_code, headers, content, url, expires_at = row
+        return CacheEntry(status_code, json.loads(headers), bytes(content), url, expires_at)
+
+    def set(self, key, entry: CacheEntry):
+        key = self._key(key)
+        with self._lock:
+            if entry.size > self.max_bytes:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.status_code, json.dumps(entry.headers), entry.content, entry.url, entry.expires_at,
+                 entry.size, time.time()),
+            )
+            self._evict()
+
+    def _evict(self):
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall():
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.evictions += 1
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def delete(self, key):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses WHERE key = ?", (self._key(key),))
+
+    def clear(self):
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class ResponseCache:
+    """
+    Caches GET responses of endpoints that change rarely, such as product lists, option chains and
+    corporate events.
+
+    Only endpoints matching one of the TTL patterns are cached. Once an entry is older than its TTL, it is
+    revalidated with If-None-Match / If-Modified-Since when the server sent an ETag or Last-Modified
+    header, so an unchanged resource costs a 304 Not Modified instead of a full download.
+
+    Responses are keyed by method, URL and query parameters, not by session: only configure TTLs for
+    endpoints that return the same data to every user.
+
+    Can be given to a Transport or an AsyncTransport as `cache`.
+
+    Args:
+        backend: Optional. Where entries are stored, a MemoryCacheBackend (the default) or a SQLiteCacheBackend.
+        ttls (dict): Optional. Seconds each endpoint stays fresh, keyed by glob patterns matched against the
+            URL path. Defaults to DEFAULT_TTLS.
+    """
+
+    def __init__(self, backend=None, ttls=None):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def ttl_for(self, url: str) -> float:
+        """Returns the TTL of the endpoint of url, or 0 if it is not cached."""
+        path = urlsplit(url).path
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return 0
+
+    def lookup(self, key):
+        """
+        Returns the stored entry for key and whether it is still fresh; counts a hit for a fresh entry.
+        """
+        entry = self.backend.get(key)
+        if entry is None or not entry.is_fresh():
+            return entry, False
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += entry.size
+        return entry, True
+
+    def update(self, key, entry, response, ttl: float):
+        """
+        Records the response received for key, possibly to a conditional request made with entry's validators.
+
+        Returns:
+            CacheEntry: The entry to answer with, or None if the response is to be returned as it is.
+        """
+        if entry is not None and response.status_code == 304:
+            headers = dict(entry.headers)
+            for name in ("ETag", "Last-Modified", "Date"):
+                value = _find_header(response.headers, name)
+                if value:
+                    headers[name] = value
+            entry = CacheEntry(entry.status_code, headers, entry.content, entry.url, time.time() + ttl)
+            self.backend.set(key, entry)
+            with self._lock:
+                self.revalidations += 1
+                self.bytes_saved += entry.size
+            return entry
+
+        with self._lock:
+            self.misses += 1
+        cache_control = (_find_header(response.headers, "Cache-Control") or "").lower()
+        if response.status_code == 200 and "no-store" not in cache_control:
+            headers = {}
+            for name in ("Content-Type", "ETag", "Last-Modified", "Date"):
+                value = _find_header(response.headers, name)
+                if value:
+                    headers[name] = value
+            self.backend.set(key, CacheEntry(200, headers, response.content, response.url, time.time() + ttl))
+        return None
+
+    def clear(self):
+        self.backend.clear()
+
+    def metrics(self) -> dict:
+        """
+        Returns the number of fresh hits, successful revalidations and misses, the hit rate (hits and
+        revalidations over all lookups) and the number of body bytes that did not have to be downloaded.
+        """
+        with self._lock:
+            lookups = self.hits + self.revalidations + self.misses
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.revalidations) / lookups if lookups else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "size": self.backend.size,
+                "evictions": self.backend.evictions,
+            }
+
+
+def cached_response(entry: CacheEntry) -> requests.Response:
+    """Rebuilds a requests.Response from a cache entry."""
+    response = requests.Response()
+    response.status_code = entry.status_code
+    response.reason = "OK"
+    response.headers.update(entry.headers)
+    response._content = entry.content
+    response.url = entry.url
+    response.encoding = "utf-8"
+    return response
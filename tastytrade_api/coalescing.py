@@ -0,0 +1,163 @@
+import asyncio
+import threading
+
+from .deadline import DeadlineExceeded, remaining
+from .exceptions import TransportError
+
+COALESCED_METHODS = frozenset({"GET", "HEAD"})
+
+
+def request_key(method: str, url: str, params=None, headers=None) -> tuple:
+    """
+    Returns a hashable key identifying a request by method, URL, query parameters and per-call headers.
+
+    Parameters are normalized the way they are encoded on the wire: None values are dropped, order does
+    not matter and a list is the same as a tuple. Headers are part of the key so that calls made with
+    different session tokens are never merged.
+    """
+    normalized = []
+    for name, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = tuple(str(item) for item in value)
+        else:
+            value = str(value)
+        normalized.append((name, value))
+    return (
+        method.upper(),
+        url,
+        tuple(sorted(normalized)),
+        tuple(sorted((headers or {}).items())),
+    )
+
+
+def share_json(response):
+    """
+    Makes response.json() decode the body once and hand the same object to every caller sharing the
+    response. The decoded value must be treated as read-only.
+    """
+    decode = response.json
+    lock = threading.Lock()
+    decoded = []
+
+    def json(**kwargs):
+        if kwargs:
+            return decode(**kwargs)
+        with lock:
+            if not decoded:
+                decoded.append(decode())
+        return decoded[0]
+
+    response.json = json
+    return response
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent requests, so that callers asking for the same resource while a
+    request for it is in flight wait for that request and share its response instead of sending their own.
+
+    Only requests whose key is in flight at the same moment are merged; nothing is cached once the
+    request completes. Errors are shared the same way as responses.
+
+    Can be given to a Transport or an AsyncTransport as `coalescer`, and shared between them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self._async_calls = {}
+        self.hits = 0
+        self.misses = 0
+
+    def do(self, key, func):
+        """
+        Calls func, unless a call with the same key is already in flight on another thread, in which
+        case waits for it and returns its result.
+
+        Raises:
+            DeadlineExceeded: If the current deadline passed while waiting for the in-flight call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            if not call.done.wait(remaining()):
+                raise DeadlineExceeded("Deadline exceeded waiting for a coalesced request")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def do_async(self, key, func):
+        """
+        Asyncio counterpart of do. `func` is a coroutine function; calls are only merged within one event loop.
+        """
+        key = (id(asyncio.get_running_loop()), key)
+        with self._lock:
+            future = self._async_calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._async_calls[key] = asyncio.get_running_loop().create_future()
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not leader:
+            # Shield the shared future, so a cancelled waiter does not cancel it for everyone else.
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), remaining())
+            except asyncio.TimeoutError:
+                raise DeadlineExceeded("Deadline exceeded waiting for a coalesced request") from None
+
+        try:
+            result = await func()
+        except BaseException as exc:
+            if isinstance(exc, asyncio.CancelledError):
+                exc = TransportError("The coalesced request was cancelled")
+            future.set_exception(exc)
+            # Mark the exception as retrieved when nobody else was waiting for it.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_calls[key]
+
+    def metrics(self) -> dict:
+        """
+        Returns the number of calls that joined an in-flight request (hits), the number that sent their own
+        (misses) and the number of requests currently in flight.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "in_flight": len(self._calls) + len(self._async_calls),
+            }
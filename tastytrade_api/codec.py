@@ -0,0 +1,113 @@
+"""
+The JSON codec used for every request body, response body and streamer message of the package.
+
+orjson is used when it is installed (pip install tastytrade-api[fast]), the standard library json module
+otherwise. A different codec can be installed process-wide with set_codec.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+class StdlibCodec:
+    """JSON codec backed by the standard library json module."""
+    name = "json"
+
+    def loads(self, data):
+        return json.loads(data)
+
+    def dumps(self, obj) -> str:
+        return json.dumps(obj)
+
+    def dumps_bytes(self, obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+class OrjsonCodec:
+    """JSON codec backed by orjson. Its output is compact: it has no spaces after separators."""
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires orjson: pip install tastytrade-api[fast]")
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+    def dumps(self, obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj) -> bytes:
+        return orjson.dumps(obj)
+
+
+_codec = OrjsonCodec() if orjson is not None else StdlibCodec()
+
+
+def get_codec():
+    """Returns the codec currently in use."""
+    return _codec
+
+
+def set_codec(codec):
+    """
+    Installs the codec used by the whole package.
+
+    Args:
+        codec: A codec instance with loads, dumps and dumps_bytes methods, or the name of a built-in codec,
+            "json" or "orjson".
+
+    Returns:
+        The codec that was in use before.
+    """
+    global _codec
+    if isinstance(codec, str):
+        codec = {"json": StdlibCodec, "orjson": OrjsonCodec}[codec]()
+    previous, _codec = _codec, codec
+    return previous
+
+
+def loads(data):
+    """Decodes a JSON document from str or bytes."""
+    return _codec.loads(data)
+
+
+def dumps(obj) -> str:
+    """Encodes obj as a JSON string."""
+    return _codec.dumps(obj)
+
+
+def dumps_bytes(obj) -> bytes:
+    """Encodes obj as a UTF-8 JSON document."""
+    return _codec.dumps_bytes(obj)
+
+
+def decode_response(response):
+    """
+    Makes response.json() decode with the current codec. Keyword arguments of json() still go to the
+    standard library decoder.
+    """
+    def decode(**kwargs):
+        if kwargs:
+            return json.loads(response.content, **kwargs)
+        return _codec.loads(response.content)
+
+    response.json = decode
+    return response
+
+
+def encode_json_body(kwargs: dict):
+    """
+    Replaces the `json=` argument of a request with a body encoded by the current codec.
+    """
+    if kwargs.get("json") is None:
+        kwargs.pop("json", None)
+        return
+    kwargs["data"] = _codec.dumps_bytes(kwargs.pop("json"))
+    headers = dict(kwargs.get("headers") or {})
+    if not any(name.lower() == "content-type" for name in headers):
+        headers["Content-Type"] = "application/json"
+    kwargs["headers"] = headers
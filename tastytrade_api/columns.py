@@ -0,0 +1,209 @@
+"""
+Columnar results of list endpoints: one typed NumPy array per field instead of one dict per object.
+
+Clients return a Columns when called with output="columns". The columns are the fields of the endpoint's model
+(see tastytrade_api.models), named like its attributes: prices and numbers are float64 (NaN when missing),
+dates datetime64[D] and timestamps datetime64[us] in UTC (NaT when missing). Other fields are bool or int64
+when every value is one, float64 when the only other values are missing, and object arrays otherwise.
+
+Items are decoded into the columns one at a time, so with stream=True the objects of the response are never
+all held at once. This needs numpy (`pip install tastytrade-api[columns]`); to_arrow() also needs pyarrow and
+to_pandas() pandas.
+"""
+import sys
+from array import array
+from datetime import date, datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+from .models import _parse_field, to_date, to_datetime, to_decimal
+
+# The number of distinct values each column remembers the encoding of.
+MEMO_SIZE = 4096
+
+NAN = float("nan")
+NAT = -2 ** 63
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_float(value):
+    return NAN if value is None else float(value)
+
+
+def _to_days(value):
+    return NAT if value is None else date.fromisoformat(value).toordinal() - EPOCH_ORDINAL
+
+
+def _to_microseconds(value):
+    if value is None:
+        return NAT
+    timestamp = to_datetime(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    delta = timestamp - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+# How the values decoded by each model decoder are stored: (array typecode, encode, numpy dtype).
+_TYPED = {
+    to_decimal: ("d", _to_float, "float64"),
+    to_date: ("q", _to_days, "datetime64[D]"),
+    to_datetime: ("q", _to_microseconds, "datetime64[us]"),
+}
+
+
+def _column_specs(model, names=None) -> list:
+    """Returns the (name, key, typed) of each column of model, typed being None for a plain field."""
+    specs = []
+    for field in model.fields:
+        key, attribute, _, decode = _parse_field(field)
+        if decode is not None and decode not in _TYPED:
+            continue  # A list of nested models.
+        if names is None or attribute in names:
+            specs.append((attribute, key, _TYPED.get(decode)))
+    if names is not None:
+        unknown = set(names) - {spec[0] for spec in specs}
+        if unknown:
+            raise ValueError(f"Unknown {model.__name__} columns: {sorted(unknown)}")
+    return specs
+
+
+def _plain_array(values: list):
+    kinds = {type(value) for value in values}
+    if kinds == {bool}:
+        return np.array(values, dtype=bool)
+    if kinds == {int}:
+        return np.array(values, dtype=np.int64)
+    if kinds and kinds <= {int, float, type(None)} and kinds != {type(None)}:
+        return np.array([NAN if value is None else value for value in values], dtype=np.float64)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+class Columns:
+    """
+    Typed columns of a list of API objects, all of the same length.
+
+    Attributes:
+        arrays (dict): The NumPy array of each column, by name.
+    """
+
+    def __init__(self, arrays: dict):
+        self.arrays = arrays
+
+    @classmethod
+    def from_items(cls, items, model, names=None) -> "Columns":
+        """
+        Decodes API objects into the columns of model.
+
+        Args:
+            items (iterable): The API objects, consumed once.
+            model (type): The Model subclass whose fields are the columns.
+            names (iterable): Optional. The columns to keep. Defaults to every field of the model.
+
+        Returns:
+            Columns: The columns, in the order of the model fields.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If names contains a column model does not have.
+        """
+        if np is None:
+            raise ImportError("Columnar output requires numpy: pip install tastytrade-api[columns]")
+        specs = _column_specs(model, None if names is None else set(names))
+        buffers = [array(typed[0]) if typed is not None else [] for _, _, typed in specs]
+        # Prices, dates and timestamps repeat across objects, so each column remembers the values it encoded.
+        appends = [
+            (buffer.append, key, typed[1] if typed is not None else None, {})
+            for (_, key, typed), buffer in zip(specs, buffers)
+        ]
+        intern = sys.intern
+        for item in items:
+            get = item.get
+            for append, key, encode, encoded in appends:
+                value = get(key)
+                if encode is None:
+                    append(intern(value) if value.__class__ is str else value)
+                    continue
+                try:
+                    append(encoded[value])
+                except KeyError:
+                    code = encode(value)
+                    if len(encoded) < MEMO_SIZE:
+                        encoded[value] = code
+                    append(code)
+
+        arrays = {}
+        for (name, _, typed), buffer in zip(specs, buffers):
+            if typed is None:
+                arrays[name] = _plain_array(buffer)
+            else:
+                # The array module buffer is shared, not copied.
+                arrays[name] = np.frombuffer(buffer, dtype=np.dtype(typed[0])).view(typed[2])
+        return cls(arrays)
+
+    @property
+    def names(self) -> list:
+        return list(self.arrays)
+
+    def __getitem__(self, name):
+        return self.arrays[name]
+
+    def __contains__(self, name) -> bool:
+        return name in self.arrays
+
+    def __iter__(self):
+        return iter(self.arrays)
+
+    def __len__(self):
+        return len(next(iter(self.arrays.values()))) if self.arrays else 0
+
+    def __repr__(self):
+        return f"Columns({len(self)} rows, {self.names})"
+
+    def to_arrow(self):
+        """
+        Returns the columns as a pyarrow Table. Numeric, boolean and timestamp columns share the NumPy memory;
+        timestamps are typed as UTC.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        if pa is None:
+            raise ImportError("Arrow output requires pyarrow: pip install pyarrow")
+        columns = {}
+        for name, values in self.arrays.items():
+            if values.dtype.kind == "M" and np.datetime_data(values.dtype)[0] == "us":
+                columns[name] = pa.array(values, type=pa.timestamp("us", tz="UTC"))
+            elif values.dtype == object:
+                columns[name] = pa.array(values, from_pandas=True)
+            else:
+                columns[name] = pa.array(values)
+        return pa.table(columns)
+
+    def to_pandas(self):
+        """
+        Returns the columns as a pandas DataFrame. The numeric, boolean and datetime columns are not copied;
+        timestamps are naive UTC.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        if pd is None:
+            raise ImportError("The pandas adapter requires pandas: pip install pandas")
+        return pd.DataFrame(self.arrays, copy=False)
@@ -0,0 +1,133 @@
+import contextvars
+import functools
+import time
+from contextlib import contextmanager
+
+from .exceptions import TransportError
+
+# Absolute time.monotonic() value by which the current operation must finish, or None.
+_deadline = contextvars.ContextVar("tastytrade_api_deadline", default=None)
+
+
+class DeadlineExceeded(TransportError):
+    """The overall time budget of the call ran out before it could complete."""
+    retryable = False
+
+
+class Timeout:
+    """
+    Connect, read and overall timeouts of a request.
+
+    Can be given to a Transport or AsyncTransport as the default timeout, or passed per call as `timeout=`.
+
+    Args:
+        connect (float): Optional. Seconds to wait for the connection to be established.
+        read (float): Optional. Seconds to wait between two bytes of the response.
+        total (float): Optional. Overall budget of the call in seconds, including retries and backoff.
+    """
+
+    def __init__(self, connect: float = None, read: float = None, total: float = None):
+        self.connect = connect
+        self.read = read
+        self.total = total
+
+    @classmethod
+    def coerce(cls, value) -> "Timeout":
+        """
+        Converts the timeout forms accepted by requests (a number or a (connect, read) tuple) into a Timeout.
+        """
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, tuple):
+            connect, read = value
+            return cls(connect=connect, read=read)
+        return cls(connect=value, read=value)
+
+    def __repr__(self):
+        return f"Timeout(connect={self.connect}, read={self.read}, total={self.total})"
+
+
+def remaining():
+    """
+    Returns the number of seconds left before the current deadline, or None when no deadline is set.
+    """
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+@contextmanager
+def deadline(seconds: float = None):
+    """
+    Bounds every API call made inside the block, including its retries, to finish within `seconds`.
+
+    Deadlines nest: an inner deadline can only shorten the outer one. The deadline follows the calls into
+    the worker threads used for prefetching and batching, and into asyncio tasks. None disables the block.
+
+    Raises:
+        DeadlineExceeded: From the first API call attempted after the deadline has passed.
+    """
+    if seconds is None:
+        yield
+        return
+    with _deadline_at(time.monotonic() + seconds):
+        yield
+
+
+@contextmanager
+def _deadline_at(expires: float):
+    current = _deadline.get()
+    token = _deadline.set(expires if current is None else min(current, expires))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def bind_deadline(func, seconds: float = None):
+    """
+    Returns func wrapped so that every call runs under one deadline starting now. With seconds=None func
+    is returned unchanged.
+    """
+    if seconds is None:
+        return func
+    expires = time.monotonic() + seconds
+
+    @functools.wraps(func)
+    def bound(*args, **kwargs):
+        with _deadline_at(expires):
+            return func(*args, **kwargs)
+    return bound
+
+
+def abind_deadline(func, seconds: float = None):
+    """
+    Asyncio counterpart of bind_deadline. `func` returns an awaitable.
+    """
+    if seconds is None:
+        return func
+    expires = time.monotonic() + seconds
+
+    @functools.wraps(func)
+    async def bound(*args, **kwargs):
+        with _deadline_at(expires):
+            return await func(*args, **kwargs)
+    return bound
+
+
+def check_deadline(endpoint: str = None, needed: float = 0.0):
+    """
+    Raises DeadlineExceeded if less than `needed` seconds are left before the current deadline.
+    """
+    left = remaining()
+    if left is not None and left <= needed:
+        raise DeadlineExceeded(f"Deadline exceeded before {endpoint or 'the request'} could complete",
+                               endpoint=endpoint)
+
+
+def clamp(timeout: float, left):
+    """Returns timeout bounded by the `left` seconds of the deadline."""
+    if left is None:
+        return timeout
+    return left if timeout is None else min(timeout, left)
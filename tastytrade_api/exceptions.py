@@ -1,2 +1,125 @@
-class ValidationError(Exception):
-    pass
+class TastytradeError(Exception):
+    """
+    Base class of every error raised by this package.
+
+    Attributes:
+        status_code (int): The HTTP status code of the failed response, or None.
+        endpoint (str): The method and URL of the failed request, e.g. "GET https://...", or None.
+        retryable (bool): Whether sending the same request again may succeed.
+        response: The failed response, if there was one.
+    """
+    retryable = False
+
+    def __init__(self, message: str = "", status_code: int = None, endpoint: str = None, retryable: bool = None,
+                 response=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.endpoint = endpoint
+        self.response = response
+        if retryable is not None:
+            self.retryable = retryable
+
+
+class ApiError(TastytradeError):
+    """The API answered with an unexpected status code."""
+
+
+class ClientError(ApiError):
+    """The API rejected the request (4xx)."""
+
+
+class AuthenticationError(ClientError):
+    """The session is missing, expired or not allowed to access the resource (401/403)."""
+
+
+class NotFoundError(ClientError):
+    """The requested resource does not exist (404)."""
+
+
+class RateLimitError(ClientError):
+    """Too many requests were sent (429)."""
+    retryable = True
+
+
+class ServerError(ApiError):
+    """The API failed to process the request (5xx)."""
+    retryable = True
+
+
+class TransportError(TastytradeError):
+    """The request could not be sent or its response could not be read, e.g. a connection reset or timeout."""
+    retryable = True
+
+
+class ValidationError(ApiError):
+    """Authentication or session validation failed."""
+
+
+class SubscriptionError(TastytradeError):
+    """The quote streamer rejected a subscription, or did not acknowledge it in time."""
+
+
+_STATUS_ERRORS = {
+    401: AuthenticationError,
+    403: AuthenticationError,
+    404: NotFoundError,
+    429: RateLimitError,
+}
+
+_combined_errors = {}
+
+
+def error_class_for_status(status_code: int, base=ApiError):
+    """
+    Returns the exception class for an unexpected status code.
+
+    When `base` is a domain error such as AccountError, the returned class derives from both `base` and
+    the status-specific class, so it can be caught as either, e.g. as AccountError or as ServerError.
+    """
+    if status_code in _STATUS_ERRORS:
+        cls = _STATUS_ERRORS[status_code]
+    elif status_code is not None and status_code >= 500:
+        cls = ServerError
+    elif status_code is not None and status_code >= 400:
+        cls = ClientError
+    else:
+        cls = ApiError
+    if issubclass(cls, base):
+        return cls
+    if issubclass(base, cls):
+        return base
+    key = (base, cls)
+    if key not in _combined_errors:
+        name = base.__name__[:-len("Error")] + cls.__name__ if base.__name__.endswith("Error") else base.__name__
+        _combined_errors[key] = type(name, (base, cls), {"__module__": base.__module__})
+    return _combined_errors[key]
+
+
+def response_endpoint(response) -> str:
+    """Returns the "METHOD url" of the request that produced response."""
+    request = getattr(response, "request", None)
+    method = getattr(response, "method", None) or getattr(request, "method", None)
+    return f"{method} {response.url}" if method else response.url
+
+
+def api_error(response, message: str, base=ApiError) -> ApiError:
+    """
+    Builds the typed error for an unexpected response. The message is used verbatim.
+    """
+    cls = error_class_for_status(response.status_code, base)
+    return cls(message, status_code=response.status_code, endpoint=response_endpoint(response), response=response)
+
+
+def raise_api_error(response, message: str, base=ApiError):
+    """
+    Raises the typed error for an unexpected response, formatted as "{message}: {status} - {content}".
+
+    Args:
+        response: The requests.Response or AsyncResponse that was not expected.
+        message (str): What the call was doing, e.g. "Error getting positions".
+        base (type): Optional. The domain error the raised class must derive from. Default is ApiError.
+
+    Raises:
+        ApiError: Always; a subclass chosen from the status code.
+    """
+    raise api_error(response, f"{message}: {response.status_code} - {response.content}", base)
@@ -0,0 +1,208 @@
+"""
+Concurrent loading of the option chains of many underlyings, e.g. every symbol of a watchlist.
+"""
+import asyncio
+import gzip
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ..codec import dumps_bytes, loads
+from ..exceptions import TastytradeError
+from ..pagination import submit_in_context
+from ..scheduler import Priority
+
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Watchlist entries of these instrument types have equity option chains.
+CHAIN_INSTRUMENT_TYPES = ("Equity", "Index")
+
+
+class ChainLoad:
+    """
+    The option chains of several underlyings. A chain whose request failed is missing from `chains` and its
+    error is kept in `errors`.
+
+    Attributes:
+        chains (dict): The nested chains of each underlying, as returned by get_option_chains, in the order the
+            underlyings were given.
+        errors (dict): The TastytradeError raised for each failed underlying.
+        latencies (dict): The time each request took, in seconds.
+        wall_time (float): How long loading took, in seconds.
+    """
+
+    def __init__(self, chains: dict, errors: dict, latencies: dict, wall_time: float):
+        self.chains = chains
+        self.errors = errors
+        self.latencies = latencies
+        self.wall_time = wall_time
+
+    def __getitem__(self, symbol) -> list:
+        return self.chains[symbol]
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self.chains
+
+    def __len__(self):
+        return len(self.chains)
+
+    @property
+    def failed(self) -> list:
+        """The underlyings whose chain could not be loaded."""
+        return list(self.errors)
+
+    def option_chain(self, symbol: str):
+        """Returns the chain of an underlying as an OptionChain, see tastytrade_api.market_data.option_chain."""
+        from .option_chain import OptionChain
+        return OptionChain.from_nested(self.chains[symbol])
+
+    def slowest(self, n: int = 10) -> list:
+        """Returns the n slowest (symbol, seconds) requests, slowest first."""
+        return sorted(self.latencies.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def save(self, path):
+        """
+        Saves the chains to a gzip-compressed JSON snapshot, replacing the file atomically. See load_snapshot.
+        """
+        content = gzip.compress(dumps_bytes({"saved-at": time.time(), "chains": self.chains}))
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            file.write(content)
+        os.replace(temporary, path)
+
+    def __repr__(self):
+        return f"ChainLoad({len(self.chains)} chains, {len(self.errors)} failed, {self.wall_time:.2f}s)"
+
+
+def load_snapshot(path) -> ChainLoad:
+    """
+    Reads the chains saved by ChainLoad.save. The result has no errors or latencies, and its wall_time is the
+    age of the snapshot in seconds.
+    """
+    with open(path, "rb") as file:
+        snapshot = loads(gzip.decompress(file.read()))
+    return ChainLoad(snapshot["chains"], {}, {}, time.time() - snapshot["saved-at"])
+
+
+def watchlist_symbols(watchlists, name: str) -> list:
+    """
+    Returns the symbols of a watchlist that have equity option chains, see CHAIN_INSTRUMENT_TYPES.
+
+    Args:
+        watchlists (TastytradeWatchlist): The client the watchlist is read with.
+        name (str): The name of the watchlist.
+
+    Raises:
+        ApiError: If the watchlist could not be read.
+    """
+    return _chain_symbols(watchlists.get_account_watchlists(name))
+
+
+def _chain_symbols(response_data: dict) -> list:
+    entries = response_data["data"].get("watchlist-entries") or []
+    return [
+        entry["symbol"] for entry in entries
+        if entry.get("instrument-type") in CHAIN_INSTRUMENT_TYPES + (None,)
+    ]
+
+
+def _symbols(symbols, watchlist, watchlists) -> list:
+    if (symbols is None) == (watchlist is None):
+        raise ValueError("Give either symbols or a watchlist")
+    if watchlist is not None:
+        if watchlists is None:
+            raise ValueError("Loading the chains of a watchlist needs the watchlists client")
+        return watchlist_symbols(watchlists, watchlist)
+    return list(dict.fromkeys(symbols))
+
+
+def load_chains(instruments, symbols=None, watchlist: str = None, watchlists=None,
+                max_concurrency: int = DEFAULT_MAX_CONCURRENCY, scheduler=None, path=None) -> ChainLoad:
+    """
+    Fetches the option chains of many underlyings concurrently.
+
+    Every chain is requested on its own worker thread, at most max_concurrency at a time, with the caller's
+    deadline. Requests are rate limited by the RequestScheduler of the instruments transport; scheduler is only
+    used when the transport has none, so that no request is paced twice. An error only fails its own underlying:
+    it is recorded in `errors` and the other chains are still loaded. Give the transport a pool of at least
+    max_concurrency connections.
+
+    Args:
+        instruments (TastytradeInstruments): The client the chains are fetched with.
+        symbols (list): The underlying symbols. Either symbols or watchlist must be given.
+        watchlist (str): The name of a watchlist whose underlyings are loaded, see watchlist_symbols.
+        watchlists (TastytradeWatchlist): The client the watchlist is read with.
+        max_concurrency (int): Optional. The maximum number of requests in flight.
+        scheduler (RequestScheduler): Optional. Paces the requests on the bulk lane, for a transport without a
+            scheduler; ignored when the transport has one.
+        path (str): Optional. A file the chains are saved to, see ChainLoad.save.
+
+    Returns:
+        ChainLoad: The chains, errors and per-symbol latencies.
+
+    Raises:
+        ValueError: If neither or both of symbols and watchlist were given.
+        ApiError: If the watchlist could not be read.
+    """
+    started = time.perf_counter()
+    symbols = _symbols(symbols, watchlist, watchlists)
+    chains, errors, latencies = {}, {}, {}
+    if getattr(getattr(instruments, "transport", None), "scheduler", None) is not None:
+        scheduler = None
+
+    def fetch(symbol):
+        if scheduler is not None:
+            scheduler.acquire(Priority.BULK)
+        call_started = time.perf_counter()
+        try:
+            chains[symbol] = instruments.get_option_chains(symbol)
+        except TastytradeError as exc:
+            errors[symbol] = exc
+        latencies[symbol] = time.perf_counter() - call_started
+
+    if symbols:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(symbols)))) as executor:
+            for future in [submit_in_context(executor, fetch, symbol) for symbol in symbols]:
+                future.result()
+    result = _in_order(symbols, chains, errors, latencies, time.perf_counter() - started)
+    if path is not None:
+        result.save(path)
+    return result
+
+
+async def aload_chains(instruments, symbols=None, watchlist: str = None, watchlists=None,
+                       max_concurrency: int = DEFAULT_MAX_CONCURRENCY, path=None) -> ChainLoad:
+    """
+    Asyncio counterpart of load_chains, for AsyncTastytradeInstruments and AsyncTastytradeWatchlist. Requests are
+    rate limited by the scheduler of the async transport.
+    """
+    started = time.perf_counter()
+    if watchlist is not None and watchlists is not None:
+        symbols, watchlist = _chain_symbols(await watchlists.get_account_watchlists(watchlist)), None
+    symbols = _symbols(symbols, watchlist, watchlists)
+    chains, errors, latencies = {}, {}, {}
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(symbol):
+        async with semaphore:
+            call_started = time.perf_counter()
+            try:
+                chains[symbol] = await instruments.get_option_chains(symbol)
+            except TastytradeError as exc:
+                errors[symbol] = exc
+            latencies[symbol] = time.perf_counter() - call_started
+
+    await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+    result = _in_order(symbols, chains, errors, latencies, time.perf_counter() - started)
+    if path is not None:
+        await asyncio.to_thread(result.save, path)
+    return result
+
+
+def _in_order(symbols, chains, errors, latencies, wall_time) -> ChainLoad:
+    return ChainLoad(
+        {symbol: chains[symbol] for symbol in symbols if symbol in chains},
+        {symbol: errors[symbol] for symbol in symbols if symbol in errors},
+        {symbol: latencies[symbol] for symbol in symbols if symbol in latencies},
+        wall_time,
+    )
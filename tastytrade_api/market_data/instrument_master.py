@@ -0,0 +1,329 @@
+"""
+A local instrument master: the equities, equity options and futures the application trades, kept in SQLite and
+indexed in memory so that symbols are resolved without a request.
+"""
+import logging
+import sqlite3
+import threading
+import time
+from datetime import date
+
+from ..batching import DEFAULT_MAX_WORKERS, fan_out
+from ..codec import dumps, loads
+from ..exceptions import TastytradeError
+from ..models import Equity, EquityOption, Future, to_date, to_decimal
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two background refreshes.
+DEFAULT_SYNC_INTERVAL = 6 * 3600
+
+# Instrument kinds, in the order they are synced.
+KINDS = ("equities", "options", "futures")
+
+MODELS = {"equities": Equity, "options": EquityOption, "futures": Future}
+
+
+def chain_options(chain: dict):
+    """
+    Yields the equity options of a nested option chain (see TastytradeInstruments.get_option_chains), in the
+    format of /instruments/equity-options. days-to-expiration is left out, as it would change every day.
+    """
+    common = {
+        "instrument-type": "Equity Option",
+        "active": True,
+        "root-symbol": chain.get("root-symbol"),
+        "underlying-symbol": chain.get("underlying-symbol"),
+        "option-chain-type": chain.get("option-chain-type"),
+        "shares-per-contract": chain.get("shares-per-contract"),
+    }
+    for expiration in chain.get("expirations", ()):
+        for strike in expiration.get("strikes", ()):
+            for option_type, side in (("C", "call"), ("P", "put")):
+                symbol = strike.get(side)
+                if symbol is None:
+                    continue
+                yield {
+                    "symbol": symbol,
+                    **common,
+                    "strike-price": strike.get("strike-price"),
+                    "expiration-date": expiration.get("expiration-date"),
+                    "expiration-type": expiration.get("expiration-type"),
+                    "settlement-type": expiration.get("settlement-type"),
+                    "option-type": option_type,
+                    "streamer-symbol": strike.get(f"{side}-streamer-symbol"),
+                }
+
+
+class _Index:
+    """The in-memory lookup tables of the active instruments. Never modified once built."""
+
+    def __init__(self, records: dict):
+        self.by_symbol = {}
+        self.options = {}
+        self.futures = {}
+        for symbol, (kind, model) in records.items():
+            self.by_symbol[symbol] = model
+            if kind == "options":
+                expirations = self.options.setdefault(model.underlying_symbol, {})
+                expirations.setdefault(model.expiration_date, {})[(model.strike_price, model.option_type)] = model
+            elif kind == "futures":
+                self.futures.setdefault(model.product_code, []).append(model)
+        for futures in self.futures.values():
+            futures.sort(key=lambda future: future.expiration_date or date.max)
+        self.expirations = {underlying: sorted(expirations) for underlying, expirations in self.options.items()}
+        self.strikes = {
+            (underlying, expiration): sorted({strike for strike, _ in options})
+            for underlying, expirations in self.options.items()
+            for expiration, options in expirations.items()
+        }
+
+
+class InstrumentMaster:
+    """
+    Keeps the instruments of TastytradeInstruments in a SQLite database and answers lookups by symbol,
+    underlying, expiration, strike and product code from in-memory indexes, without network access.
+
+    sync() loads every active equity, the option chains of `underlyings` and the futures of `product_codes`.
+    Later syncs fetch them again and only write what changed: new listings are added, changed instruments
+    updated, and instruments no longer listed or past their expiration deactivated. Deactivated instruments stay
+    in the database but are left out of lookups. The indexes are rebuilt and swapped after a sync, so lookups
+    never wait for it. A database that was synced before is usable right away, without a sync.
+
+    Lookups return the models of tastytrade_api.models: Equity, EquityOption and Future.
+
+    Args:
+        instruments (TastytradeInstruments): The client the instruments are fetched with.
+        path (str): Optional. The database file. ":memory:" keeps the database in memory.
+        underlyings (list): Optional. The underlying symbols whose equity options are kept.
+        product_codes (list): Optional. The product codes of the futures to keep. Defaults to every future.
+        kinds (tuple): Optional. The instrument kinds synced, a subset of KINDS.
+        interval (float): Optional. Seconds between two background refreshes, see start().
+        max_workers (int): Optional. The maximum number of option chains fetched concurrently.
+        background (bool): Optional. Whether to start the background refresh thread right away.
+    """
+
+    def __init__(self, instruments, path: str = ":memory:", underlyings=(), product_codes=None, kinds=KINDS,
+                 interval: float = DEFAULT_SYNC_INTERVAL, max_workers: int = DEFAULT_MAX_WORKERS,
+                 background: bool = False):
+        unknown = set(kinds) - set(KINDS)
+        if unknown:
+            raise ValueError(f"Unknown instrument kinds: {sorted(unknown)}")
+        self.instruments = instruments
+        self.path = path
+        self.underlyings = list(underlyings)
+        self.product_codes = list(product_codes) if product_codes else None
+        self.kinds = tuple(kind for kind in KINDS if kind in kinds)
+        self.interval = interval
+        self.max_workers = max_workers
+        self.last_sync = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS instruments ("
+            " symbol TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " scope TEXT NOT NULL,"
+            " expiration TEXT,"
+            " active INTEGER NOT NULL,"
+            " data TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._connection.execute("CREATE INDEX IF NOT EXISTS instruments_scope ON instruments (kind, scope)")
+        self._records = {
+            symbol: (kind, MODELS[kind].from_dict(loads(data)))
+            for symbol, kind, data in self._connection.execute(
+                "SELECT symbol, kind, data FROM instruments WHERE active = 1"
+            )
+        }
+        self._index = _Index(self._records)
+        if background:
+            self.start()
+
+    def _fetch(self, kind: str) -> dict:
+        """Returns the fetched instruments of kind, by scope: the underlying for options, else the kind."""
+        if kind == "equities":
+            return {"equities": list(self.instruments.iter_active_equities())}
+        if kind == "futures":
+            return {"futures": self.instruments.get_futures(product_codes=self.product_codes)}
+
+        def fetch(underlying):
+            return [option for chain in self.instruments.get_option_chains(underlying)
+                    for option in chain_options(chain)]
+        return dict(zip(self.underlyings, fan_out(fetch, self.underlyings, self.max_workers)))
+
+    def _write(self, records: dict, kind: str, scope: str, items: list, now: float, today: str, changes: dict):
+        stored = dict(self._connection.execute(
+            "SELECT symbol, data FROM instruments WHERE kind = ? AND scope = ? AND active = 1", (kind, scope)
+        ).fetchall())
+        model = MODELS[kind]
+        for item in items:
+            expiration = item.get("expiration-date")
+            if expiration is not None and expiration < today:
+                continue
+            symbol = item["symbol"]
+            data = dumps(item)
+            previous = stored.pop(symbol, None)
+            if previous == data:
+                continue
+            changes["added" if previous is None else "updated"] += 1
+            self._connection.execute(
+                "INSERT OR REPLACE INTO instruments VALUES (?, ?, ?, ?, 1, ?, ?)",
+                (symbol, kind, scope, expiration, data, now),
+            )
+            records[symbol] = (kind, model.from_dict(item))
+        for symbol in stored:
+            self._deactivate(records, symbol, now)
+            changes["deactivated"] += 1
+
+    def _deactivate(self, records: dict, symbol: str, now: float):
+        self._connection.execute(
+            "UPDATE instruments SET active = 0, updated_at = ? WHERE symbol = ?", (now, symbol)
+        )
+        records.pop(symbol, None)
+
+    def sync(self, kinds=None) -> dict:
+        """
+        Fetches the instruments and writes the changes to the database and the indexes. Options and futures past
+        their expiration date are deactivated even when they are still listed.
+
+        Args:
+            kinds (tuple): Optional. The instrument kinds to sync. Defaults to the kinds of the master.
+
+        Returns:
+            dict: The number of instruments "added", "updated" and "deactivated" for each kind synced.
+
+        Raises:
+            TastytradeError: If the instruments could not be fetched. Nothing is written then.
+        """
+        kinds = self.kinds if kinds is None else tuple(kind for kind in KINDS if kind in kinds)
+        with self._lock:
+            fetched = {kind: self._fetch(kind) for kind in kinds}
+            now = time.time()
+            today = date.today().isoformat()
+            report = {}
+            # Changes are made to a copy, which replaces the records once they are committed.
+            records = dict(self._records)
+            self._connection.execute("BEGIN")
+            try:
+                for kind, scopes in fetched.items():
+                    changes = report[kind] = {"added": 0, "updated": 0, "deactivated": 0}
+                    for scope, items in scopes.items():
+                        self._write(records, kind, scope, items, now, today, changes)
+                    for (symbol,) in self._connection.execute(
+                        "SELECT symbol FROM instruments WHERE kind = ? AND active = 1 AND expiration < ?",
+                        (kind, today),
+                    ).fetchall():
+                        self._deactivate(records, symbol, now)
+                        changes["deactivated"] += 1
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._records = records
+            self._index = _Index(records)
+            self.last_sync = now
+        logger.debug("Instrument master synced: %s", report)
+        return report
+
+    def get(self, symbol: str):
+        """Returns the active instrument with the given symbol, or None."""
+        return self._index.by_symbol.get(symbol)
+
+    def __contains__(self, symbol) -> bool:
+        return symbol in self._index.by_symbol
+
+    def __len__(self):
+        return len(self._index.by_symbol)
+
+    def expirations(self, underlying: str) -> list:
+        """Returns the expiration dates of the options of underlying, in ascending order."""
+        return list(self._index.expirations.get(underlying, ()))
+
+    def strikes(self, underlying: str, expiration) -> list:
+        """Returns the strike prices of the options of underlying expiring on expiration, in ascending order."""
+        return list(self._index.strikes.get((underlying, _as_date(expiration)), ()))
+
+    def option(self, underlying: str, expiration, strike, option_type: str):
+        """
+        Returns the option of underlying with the given expiration, strike and type, or None.
+
+        Args:
+            underlying (str): The underlying symbol.
+            expiration (date or str): The expiration date, or its YYYY-MM-DD string.
+            strike (Decimal, float, int or str): The strike price.
+            option_type (str): "C" or "P".
+        """
+        expirations = self._index.options.get(underlying)
+        if expirations is None:
+            return None
+        options = expirations.get(_as_date(expiration))
+        if options is None:
+            return None
+        return options.get((to_decimal(strike), option_type))
+
+    def options(self, underlying: str, expiration=None, strike=None, option_type: str = None) -> list:
+        """
+        Returns the options of underlying, optionally only those with the given expiration, strike or type,
+        ordered by expiration, strike and type.
+        """
+        expirations = self._index.options.get(underlying, {})
+        if expiration is not None:
+            expiration = _as_date(expiration)
+            expirations = {expiration: expirations[expiration]} if expiration in expirations else {}
+        strike = to_decimal(strike) if strike is not None else None
+        found = []
+        for day in sorted(expirations):
+            for (price, kind), model in sorted(expirations[day].items(), key=lambda entry: entry[0]):
+                if (strike is None or price == strike) and (option_type is None or kind == option_type):
+                    found.append(model)
+        return found
+
+    def futures(self, product_code: str) -> list:
+        """Returns the futures of a product code, ordered by expiration."""
+        return list(self._index.futures.get(product_code, ()))
+
+    def start(self):
+        """
+        Starts a daemon thread that syncs every `interval` seconds, beginning with an immediate sync when the
+        database has never been synced by this master. Failed syncs are logged and retried at the next interval.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="tastytrade-instrument-master", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        delay = 0.0 if self.last_sync is None else self.interval
+        while not self._stopped.wait(delay):
+            try:
+                self.sync()
+            except TastytradeError as exc:
+                logger.warning("Syncing the instrument master failed: %s", exc)
+            delay = self.interval
+
+    def stop(self):
+        """Stops the background refresh thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def close(self):
+        """Stops the background refresh and closes the database."""
+        self.stop()
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _as_date(value):
+    return to_date(value) if isinstance(value, str) else value
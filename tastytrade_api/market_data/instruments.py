@@ -1,17 +1,78 @@
-import requests
-import json
+from ..exceptions import raise_api_error
+from ..transport import get_default_transport
+from ..scheduler import Priority
+from ..pagination import iter_items
+from ..batching import DEFAULT_MAX_WORKERS, chunk_symbols, fan_out, merge_in_input_order
+from ..streaming import iter_response_items
+from ..models import Equity, EquityOption, Future, NestedOptionChain, convert
+from itertools import chain
 from typing import List, Dict, Any
-import urllib
 
 
 class TastytradeInstruments:
     """
     Implements the Tastytrade Instruments API - https://developer.tastytrade.com/open-api-spec/instruments/
+
+    Methods taking a list of symbols accept collections of any size: the symbols are split into batches
+    that keep each URL short enough, the batches are fetched concurrently by up to `max_workers` threads
+    and the results are merged back in input order.
+
+    Methods taking `stream=True` return an iterator that decodes the items one at a time while the
+    response is received, which keeps memory bounded by the size of one item on very large responses.
+
+    Methods taking `output="models"` return compact typed models (see tastytrade_api.models) instead of dicts.
     """
 
-    def __init__(self, session_token: str, api_url: str):
+    def __init__(self, session_token: str, api_url: str, transport=None, max_workers: int = DEFAULT_MAX_WORKERS):
         self.session_token = session_token
         self.api_url = api_url
+        self.transport = transport or get_default_transport()
+        self.max_workers = max_workers
+
+    def _get_items_in_batches(self, url: str, params: dict, key: str, symbols, error_message: str,
+                              stream: bool = False) -> List[dict]:
+        """
+        GETs the items of a list endpoint, sending `symbols` in the `key` query parameter in as many
+        batches as needed, and returns the merged items in input order.
+
+        With stream=True, returns an iterator instead: the batches are requested one after the other as
+        the items are consumed, and the items come in the order of the responses.
+        """
+        if stream:
+            batches = chunk_symbols(list(symbols), key) if symbols else [None]
+            return chain.from_iterable(
+                self._stream_items(url, params if batch is None else {**params, key: batch}, error_message)
+                for batch in batches
+            )
+
+        headers = {"Authorization": f"{self.session_token}"}
+
+        def fetch(batch):
+            batch_params = dict(params)
+            if batch is not None:
+                batch_params[key] = batch
+            response = self.transport.get(url, headers=headers, params=batch_params, priority=Priority.BULK)
+            if response.status_code == 200:
+                response_data = response.json()
+                return response_data["data"]["items"]
+            else:
+                raise_api_error(response, error_message)
+
+        if not symbols:
+            return fetch(None)
+        symbols = list(symbols)
+        results = fan_out(fetch, chunk_symbols(symbols, key), self.max_workers)
+        return merge_in_input_order(symbols, results)
+
+    def _stream_items(self, url: str, params: dict, error_message: str):
+        """
+        GETs a list endpoint with a streamed body and returns an iterator over its items.
+        """
+        headers = {"Authorization": f"{self.session_token}"}
+        response = self.transport.get(url, headers=headers, params=params, priority=Priority.BULK, stream=True)
+        if response.status_code != 200:
+            raise_api_error(response, error_message)
+        return iter_response_items(response)
 
     def get_cryptocurrencies(self, symbols: List[str] = None) -> List[dict]:
         """
@@ -23,26 +84,11 @@ class TastytradeInstruments:
         :return: A list of dictionaries, where each dictionary represents a cryptocurrency.
         :rtype: List[dict]
 
-        :raises: Exception if there was an error in the GET request or if the status code is not 200 OK.
+        :raises: ApiError if there was an error in the GET request or if the status code is not 200 OK.
         """
-        headers = {"Authorization": f"{self.session_token}"}
-
-        if symbols:
-            symbol_params = "&".join([f"symbol[]={s}" for s in symbols])
-            url = f"{self.api_url}/instruments/cryptocurrencies?{symbol_params}"
-        else:
-            url = f"{self.api_url}/instruments/cryptocurrencies"
-
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            response_data = json.loads(response.content)
-            cryptocurrencies = response_data["data"]["items"]
-            return cryptocurrencies
-        else:
-            raise Exception(
-                f"Error getting cryptocurrencies: {response.status_code} - {response.content}"
-            )
-
+        return self._get_items_in_batches(
+            f"{self.api_url}/instruments/cryptocurrencies", {}, "symbol[]", symbols, "Error getting cryptocurrencies"
+        )
     def get_cryptocurrency_by_symbol(self, symbol: str) -> dict:
         """
         Returns the cryptocurrency object for the given symbol.
@@ -54,18 +100,17 @@ class TastytradeInstruments:
         """
         headers = {"Authorization": f"{self.session_token}"}
 
-        response = requests.get(
-            f"{self.api_url}/instruments/cryptocurrencies/{symbol}", headers=headers
+        response = self.transport.get(
+            f"{self.api_url}/instruments/cryptocurrencies/{symbol}", headers=headers, priority=Priority.BULK
         )
         if response.status_code == 200:
             return response.json()
         else:
-            raise Exception(
-                f"Error getting cryptocurrency '{symbol}': {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, f"Error getting cryptocurrency '{symbol}'")
 
     def get_active_equities(
-        self, per_page: int = 1000, page_offset: int = 0, lendability: str = None
+        self, per_page: int = 1000, page_offset: int = 0, lendability: str = None, stream: bool = False,
+        output: str = "dicts"
     ) -> List[dict]:
         """
         Returns a list of all active equities in a paginated fashion.
@@ -77,6 +122,13 @@ class TastytradeInstruments:
         :param lendability: Optional. The lendability type of the equities. Valid options are "Easy To Borrow",
                             "Locate Required", and "Preborrow". Default is None, which returns all lendability types.
         :type lendability: str
+        :param stream: Optional. If True, return an iterator decoding the equities of the page one at a time
+                       instead of the whole response. Default is False.
+        :type stream: bool
+        :param output: Optional. "models" to return the equities of the page as a list of Equity models, or
+                       "columns" as typed arrays (see tastytrade_api.columns), instead of the whole response.
+                       Default is "dicts".
+        :type output: str
         :return: A list of dictionaries, where each dictionary represents an equity.
         :rtype: List[dict]
         """
@@ -85,19 +137,51 @@ class TastytradeInstruments:
         params = {"per-page": per_page, "page-offset": page_offset}
         if lendability:
             params["lendability"] = lendability
+        if stream:
+            return convert(self._stream_items(
+                f"{self.api_url}/instruments/equities/active", params, "Error getting active equities"
+            ), Equity, output)
 
-        response = requests.get(
+        response = self.transport.get(
             f"{self.api_url}/instruments/equities/active",
             headers=headers,
             params=params,
+            priority=Priority.BULK,
         )
         if response.status_code != 200:
-            raise Exception(
-                f"Error getting active equities with status {response.status_code} - {response.content}"
-            )
-        return response.json()
+            raise_api_error(response, "Error getting active equities")
+        if output == "dicts":
+            return response.json()
+        return convert(response.json()["data"]["items"], Equity, output)
 
-    def get_equities(self, symbols=None, lendability=None, is_index=None, is_etf=None):
+    def iter_active_equities(self, per_page: int = 1000, lendability: str = None, prefetch: int = 2,
+                             timeout: float = None, output: str = "dicts"):
+        """
+        Yields every active equity across all pages of /instruments/equities/active.
+
+        The next `prefetch` pages are fetched concurrently while the current page is being consumed.
+
+        :param per_page: Optional. The number of equities to request per page. Default is 1000.
+        :type per_page: int
+        :param lendability: Optional. The lendability type of the equities, see get_active_equities.
+        :type lendability: str
+        :param prefetch: Optional. The number of pages fetched ahead of the consumer. Default is 2.
+        :type prefetch: int
+        :param timeout: Optional. Overall budget in seconds for fetching every page. Default is None.
+        :type timeout: float
+        :param output: Optional. "models" to yield Equity models instead of dictionaries, or "columns" to return
+                       the fields of every equity as typed arrays. Default is "dicts".
+        :type output: str
+        :return: An iterator of dictionaries, where each dictionary represents an equity.
+        :rtype: Iterator[dict]
+        """
+        return convert(iter_items(
+            lambda offset: self.get_active_equities(per_page=per_page, page_offset=offset, lendability=lendability),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Equity, output)
+
+    def get_equities(self, symbols=None, lendability=None, is_index=None, is_etf=None, output="dicts"):
         """
         Makes a GET request to the /instruments/equities API endpoint for the specified equity symbols,
         and returns a list of equity objects.
@@ -105,54 +189,39 @@ class TastytradeInstruments:
         Args:
             symbols (Union[str, List[str]]): A single equity symbol or a list of equity symbols. If a single symbol is
                 passed, the /instruments/equities/{symbol} endpoint will be used. If a list is passed, the
-                /instruments/equities/ endpoint will be used.
+                /instruments/equities/ endpoint will be used, in as many batches as needed.
             lendability (str): Optional. The lendability type of the equities. Valid options are "Easy To Borrow",
                             "Locate Required", and "Preborrow". Default is None, which returns all lendability types.
             is_index (bool): Optional. Flag indicating if equity is an index instrument. Default is None, which means
                             the filter is not applied.
             is_etf (bool): Optional. Flag indicating if equity is an ETF instrument. Default is None, which means
                             the filter is not applied.
+            output (str): Optional. "models" to return Equity models, or "columns" to return their fields as typed
+                arrays (see tastytrade_api.columns), instead of dicts. Default is "dicts".
 
         Returns:
-            list: List of equity objects, as returned by the API.
+            list: List of equity objects, as returned by the API, in the order of the requested symbols.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        headers = {"Authorization": f"{self.session_token}"}
-
         if isinstance(symbols, str):
-            params = {"symbol": symbols}
-            response = requests.get(
-                f"{self.api_url}/instruments/equities/", headers=headers, params=params
-            )
-        else:
-            params = {}
-            if symbols:
-                params["symbol[]"] = symbols
-            if lendability:
-                params["lendability"] = lendability
-            if is_index is not None:
-                params["is-index"] = is_index
-            if is_etf is not None:
-                params["is-etf"] = is_etf
-
-            url = f"{self.api_url}/instruments/equities"
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-
-            response = requests.get(full_url, headers=headers, params=params)
+            return convert(self._get_items_in_batches(
+                f"{self.api_url}/instruments/equities/", {"symbol": symbols}, "symbol", None, "Error getting equities"
+            ), Equity, output)
 
-        if response.status_code == 200:
-            response_data = json.loads(response.content)
-            equities = response_data["data"]["items"]
-            return equities
-        else:
-            raise Exception(
-                f"Error getting equities: {response.status_code} - {response.content}"
-            )
-
-    def get_equity_options(self, symbols=None, active=None, with_expired=None):
+        params = {}
+        if lendability:
+            params["lendability"] = lendability
+        if is_index is not None:
+            params["is-index"] = is_index
+        if is_etf is not None:
+            params["is-etf"] = is_etf
+
+        return convert(self._get_items_in_batches(
+            f"{self.api_url}/instruments/equities", params, "symbol[]", symbols, "Error getting equities"
+        ), Equity, output)
+    def get_equity_options(self, symbols=None, active=None, with_expired=None, stream=False, output="dicts"):
         """
         Makes a GET request to the /instruments/equity-options API endpoint for the specified equity option symbols,
         and returns a list of equity option objects.
@@ -160,100 +229,68 @@ class TastytradeInstruments:
         Args:
             symbols (Union[str, List[str]]): A single equity option symbol or a list of equity option symbols. If a single symbol is
                 passed, the /instruments/equity-options/{symbol} endpoint will be used. If a list is passed, the
-                /instruments/equity-options/ endpoint will be used.
+                /instruments/equity-options/ endpoint will be used, in as many batches as needed.
             active (bool): Optional. Flag indicating if equity option is currently available for trading with the broker.
                             Default is None, which means the filter is not applied.
             with_expired (bool): Optional. Flag indicating if expired equity options should be included in the response.
                                 Default is None, which means the filter is not applied.
+            stream (bool): Optional. If True, return an iterator decoding the equity options one at a time, in
+                           the order of the responses. Default is False.
+            output (str): Optional. "models" to return EquityOption models, or "columns" to return their fields as typed
+                arrays (see tastytrade_api.columns), instead of dicts. Default is "dicts".
 
         Returns:
-            list: List of equity option objects, as returned by the API.
+            list: List of equity option objects, as returned by the API, in the order of the requested symbols.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        headers = {"Authorization": f"{self.session_token}"}
-
         if isinstance(symbols, str):
-            params = {"symbol": symbols}
-            response = requests.get(
-                f"{self.api_url}/instruments/equity-options/",
-                headers=headers,
-                params=params,
-            )
-        else:
-            params = {}
-            if symbols:
-                params["symbol[]"] = symbols
-            if active is not None:
-                params["active"] = active
-            if with_expired is not None:
-                params["with-expired"] = with_expired
-
-            url = f"{self.api_url}/instruments/equity-options"
-            query_string = urllib.parse.urlencode(params)
-            full_url = f"{url}?{query_string}"
-
-            response = requests.get(full_url, headers=headers)
-
-        if response.status_code == 200:
-            response_data = json.loads(response.content)
-            equity_options = response_data["data"]["items"]
-            return equity_options
-        else:
-            raise Exception(
-                f"Error getting equity options: {response.status_code} - {response.content}"
-            )
-
-    def get_futures(self, symbols=None, product_codes=None):
+            return convert(self._get_items_in_batches(
+                f"{self.api_url}/instruments/equity-options/", {"symbol": symbols}, "symbol", None,
+                "Error getting equity options", stream
+            ), EquityOption, output)
+
+        params = {}
+        if active is not None:
+            params["active"] = active
+        if with_expired is not None:
+            params["with-expired"] = with_expired
+
+        return convert(self._get_items_in_batches(
+            f"{self.api_url}/instruments/equity-options", params, "symbol[]", symbols, "Error getting equity options",
+            stream
+        ), EquityOption, output)
+    def get_futures(self, symbols=None, product_codes=None, output="dicts"):
         """
         Makes a GET request to the /instruments/futures API endpoint for the specified futures symbols or product codes,
         and returns a list of future objects.
 
         Args:
-            symbols (Union[str, List[str]]): A single future symbol or a list of future symbols. If a single symbol is
-                passed, the /instruments/futures/{symbol} endpoint will be used. If a list is passed, the
-                /instruments/futures/ endpoint will be used.
+            symbols (Union[str, List[str]]): A single future symbol or a list of future symbols. Lists of any size are
+                sent in as many batches as needed.
             product_codes (Union[str, List[str]]): A single product code or a list of product codes. If a single product code is
                 passed, the /instruments/futures?product-code={product_code} endpoint will be used. If a list is passed, the
                 /instruments/futures/ endpoint will be used.
+            output (str): Optional. "models" to return Future models, or "columns" to return their fields as typed
+                arrays (see tastytrade_api.columns), instead of dicts. Default is "dicts".
 
         Returns:
-            list: List of future objects, as returned by the API.
+            list: List of future objects, as returned by the API, in the order of the requested symbols.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
-        headers = {"Authorization": f"{self.session_token}"}
-
         if isinstance(symbols, str):
-            params = {"symbol[]": symbols}
-        elif isinstance(symbols, list):
-            params = {"symbol[]": symbols}
-        else:
-            params = {}
+            symbols = [symbols]
 
-        if isinstance(product_codes, str):
+        params = {}
+        if product_codes:
             params["product-code[]"] = product_codes
-        elif isinstance(product_codes, list):
-            params["product-code[]"] = product_codes
-
-        url = f"{self.api_url}/instruments/futures"
-        query_string = urllib.parse.urlencode(params, doseq=True)
-        full_url = f"{url}?{query_string}"
-        print(full_url)
-
-        response = requests.get(full_url, headers=headers)
-
-        if response.status_code == 200:
-            response_data = json.loads(response.content)
-            futures = response_data["data"]["items"]
-            return futures
-        else:
-            raise Exception(
-                f"Error getting futures: {response.status_code} - {response.content}"
-            )
 
+        return convert(self._get_items_in_batches(
+            f"{self.api_url}/instruments/futures", params, "symbol[]", symbols, "Error getting futures"
+        ), Future, output)
     def get_future_option_products(self):
         """
         Makes a GET request to the /instruments/future-option-products API endpoint and returns metadata for all supported
@@ -263,22 +300,20 @@ class TastytradeInstruments:
             list: List of future option product objects, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
 
-        response = requests.get(
-            f"{self.api_url}/instruments/future-option-products", headers=headers
+        response = self.transport.get(
+            f"{self.api_url}/instruments/future-option-products", headers=headers, priority=Priority.BULK
         )
 
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             future_option_products = response_data["data"]["items"]
             return future_option_products
         else:
-            raise Exception(
-                f"Error getting future option products: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting future option products")
 
     """
     TBD: Get a future option product by exchange and root symbol 
@@ -304,22 +339,20 @@ class TastytradeInstruments:
             list: List of future product objects, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
 
-        response = requests.get(
-            f"{self.api_url}/instruments/future-products", headers=headers
+        response = self.transport.get(
+            f"{self.api_url}/instruments/future-products", headers=headers, priority=Priority.BULK
         )
 
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             future_products = response_data["data"]["items"]
             return future_products
         else:
-            raise Exception(
-                f"Error getting future products: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting future products")
 
     def get_quantity_decimal_precisions(self):
         """
@@ -331,22 +364,20 @@ class TastytradeInstruments:
             the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
 
-        response = requests.get(
-            f"{self.api_url}/instruments/quantity-decimal-precisions", headers=headers
+        response = self.transport.get(
+            f"{self.api_url}/instruments/quantity-decimal-precisions", headers=headers, priority=Priority.BULK
         )
 
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             quantity_decimal_precisions = response_data["data"]
             return quantity_decimal_precisions
         else:
-            raise Exception(
-                f"Error getting quantity decimal precisions: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, "Error getting quantity decimal precisions")
 
     """
     TBD: /instruments/warrants and /instruments/warrants/{symbol}
@@ -357,26 +388,32 @@ class TastytradeInstruments:
     TBD: Future options chanins and option chains implementation
     """
 
-    def get_option_chains(self, symbol: str):
+    def get_option_chains(self, symbol: str, stream: bool = False, output: str = "dicts"):
         """
         Returns an option chain given an underlying symbol,
 
         Args:
             symbol (str):
+            stream (bool): Optional. If True, return an iterator decoding one chain (one per root symbol) at a
+                           time. Default is False.
+            output (str): Optional. "models" to return NestedOptionChain models, or "columns" to return their fields as typed
+                arrays (see tastytrade_api.columns), instead of dicts. Default is "dicts".
         """
         headers = {"Authorization": f"{self.session_token}"}
-        response = requests.get(
-            f"{self.api_url}/option-chains/{symbol}/nested", headers=headers
+        if stream:
+            return convert(self._stream_items(
+                f"{self.api_url}/option-chains/{symbol}/nested", {}, f"Error getting symbol data for {symbol}"
+            ), NestedOptionChain, output)
+        response = self.transport.get(
+            f"{self.api_url}/option-chains/{symbol}/nested", headers=headers, priority=Priority.BULK
         )
 
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             option_chain = response_data["data"]["items"]
-            return option_chain
+            return convert(option_chain, NestedOptionChain, output)
         else:
-            raise Exception(
-                f"Error getting symbol data for {symbol}: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, f"Error getting symbol data for {symbol}")
 
     def get_symbol_data(self, symbol: str) -> List[Dict[str, Any]]:
         """
@@ -389,19 +426,17 @@ class TastytradeInstruments:
             list: List of symbol objects, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {"Authorization": f"{self.session_token}"}
 
-        response = requests.get(
-            f"{self.api_url}/symbols/search/{symbol}", headers=headers
+        response = self.transport.get(
+            f"{self.api_url}/symbols/search/{symbol}", headers=headers, priority=Priority.BULK
         )
 
         if response.status_code == 200:
-            response_data = json.loads(response.content)
+            response_data = response.json()
             symbol_data = response_data["data"]["items"]
             return symbol_data
         else:
-            raise Exception(
-                f"Error getting symbol data for {symbol}: {response.status_code} - {response.content}"
-            )
+            raise_api_error(response, f"Error getting symbol data for {symbol}")
@@ -1,4 +1,8 @@
-import requests
+from ..exceptions import raise_api_error
+from ..transport import get_default_transport
+from ..scheduler import Priority
+from ..batching import DEFAULT_MAX_WORKERS, chunk_symbols, fan_out, merge_in_input_order
+from ..models import MarketMetric, convert
 from typing import List
 
 class MarketMetrics():
@@ -8,42 +12,65 @@ class MarketMetrics():
     Args:
         session_token (str): The session token used to authenticate API requests.
         api_url (str): The base URL of the API.
+        transport (Transport): Optional. The pooled transport to send requests through.
+        max_workers (int): Optional. The maximum number of symbol batches fetched concurrently by get_metrics.
 
     Returns:
         None
     """
-    def __init__(self, session_token, api_url):
+    def __init__(self, session_token, api_url, transport=None, max_workers=DEFAULT_MAX_WORKERS):
         self.session_token = session_token
         self.api_url = api_url
+        self.transport = transport or get_default_transport()
+        self.max_workers = max_workers
 
-    def get_metrics(self, symbols: List[str]) -> dict:
+    def get_metrics(self, symbols: List[str], output: str = "dicts") -> dict:
         """
         Returns an array of volatility data for given symbols.
 
         Makes a GET request to the /market-metrics endpoint with the specified symbols as a query parameter, and returns the response as a JSON object.
+        Symbol lists of any size are split into batches that keep each URL short enough; the batches are fetched
+        concurrently and their items are merged in the order of the requested symbols.
 
         Args:
             symbols (list): List of symbols to query.
+            output (str): Optional. "models" to return the items as MarketMetric models, or "columns" to return
+                their fields as typed arrays (see tastytrade_api.columns), instead of the whole response.
+                Defaults to "dicts".
 
         Returns:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {
             "Authorization": f"{self.session_token}"
         }
-        params = {
-            "symbols": ",".join(symbols)
-        }
-        response = requests.get(f"{self.api_url}/market-metrics", headers=headers, params=params)
-        if response.status_code == 200:
-            response_data = response.json()
-            return response_data
-        else:
-            raise Exception(f"Error getting market metrics: {response.status_code} - {response.content}")
-    
+
+        def fetch(batch):
+            params = {
+                "symbols": ",".join(batch)
+            }
+            response = self.transport.get(f"{self.api_url}/market-metrics", headers=headers, params=params, priority=Priority.BULK)
+            if response.status_code == 200:
+                response_data = response.json()
+                return response_data
+            else:
+                raise_api_error(response, "Error getting market metrics")
+
+        symbols = list(symbols)
+        batches = chunk_symbols(symbols, "symbols", joined=True) or [[]]
+        responses = fan_out(fetch, batches, self.max_workers)
+        if output != "dicts":
+            return convert(merge_in_input_order(symbols, (r["data"]["items"] for r in responses)), MarketMetric, output)
+        if len(responses) == 1:
+            return responses[0]
+        # Build a new document rather than updating the first batch, whose decoded JSON may be shared.
+        merged = dict(responses[0])
+        merged["data"] = dict(merged["data"], items=merge_in_input_order(symbols, (r["data"]["items"] for r in responses)))
+        return merged
+
     def get_dividend_data(self, symbol):
         """
         Get historical dividend data
@@ -58,17 +85,17 @@ class MarketMetrics():
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {
             "Authorization": f"{self.session_token}"
         }
-        response = requests.get(f"{self.api_url}/market-metrics/historic-corporate-events/dividends/{symbol}", headers=headers)
+        response = self.transport.get(f"{self.api_url}/market-metrics/historic-corporate-events/dividends/{symbol}", headers=headers, priority=Priority.BULK)
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting dividend data for symbol {symbol}: {response.status_code} - {response.content}")
+            raise_api_error(response, f"Error getting dividend data for symbol {symbol}")
 
 
     def get_earnings_data(self, symbol: str, start_date: str = None) -> dict:
@@ -84,18 +111,17 @@ class MarketMetrics():
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         headers = {
             "Authorization": f"{self.session_token}"
         }
         url = f"{self.api_url}/market-metrics/historic-corporate-events/earnings-reports/{symbol}"
-        if start_date:
-            url += f"?start-date={start_date}"
-        response = requests.get(url, headers=headers)
+        params = {"start-date": start_date}
+        response = self.transport.get(url, headers=headers, params=params, priority=Priority.BULK)
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting earnings data for {symbol}: {response.status_code} - {response.content}")
+            raise_api_error(response, f"Error getting earnings data for {symbol}")
 
@@ -0,0 +1,260 @@
+"""
+Option chains in sorted arrays, for range queries over expirations, strikes and deltas without walking the
+nested JSON of /option-chains/{symbol}/nested.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _day(value):
+    """Returns a date, a YYYY-MM-DD string or a datetime64 as a datetime64[D]."""
+    return np.datetime64(value, "D")
+
+
+def _day_number(value) -> int:
+    """Returns a date, a YYYY-MM-DD string or a datetime64 as a number of days since 1970-01-01."""
+    if isinstance(value, str):
+        value = date.fromisoformat(value)
+    if isinstance(value, date):
+        return value.toordinal() - EPOCH_ORDINAL
+    return int(_day(value).astype(np.int64))
+
+
+class OptionChain:
+    """
+    The option chain of an underlying, with every root symbol (e.g. SPX and SPXW) in one structure.
+
+    The chain is a list of expirations, one per (expiration date, root symbol), sorted by date and then root,
+    and a list of rows, one per strike of an expiration, grouped by expiration and sorted by strike. The rows of
+    expiration e are offsets[e]:offsets[e + 1]. Queries return expiration or row indices as NumPy arrays, to
+    index the attributes with:
+
+        rows = chain.nearest("2024-01-19", price=4780, n=10)
+        chain.strikes[rows], chain.calls[rows], chain.puts[rows]
+
+    Where several roots expire on the same date, an expiration given by its date alone is the first root in
+    alphabetical order; pass root to choose another.
+
+    Attributes:
+        underlying (str): The underlying symbol.
+        expirations (np.ndarray): The expiration dates, datetime64[D].
+        roots (np.ndarray): The root symbol of each expiration.
+        expiration_types (np.ndarray): The expiration type of each expiration, e.g. "Regular" or "Weekly".
+        settlement_types (np.ndarray): The settlement type of each expiration, "AM" or "PM".
+        offsets (np.ndarray): The first row of each expiration, followed by the number of rows.
+        strikes (np.ndarray): The strike price of each row, float64.
+        calls, puts (np.ndarray): The call and put symbol of each row, None where there is none.
+        call_streamer_symbols, put_streamer_symbols (np.ndarray): The streamer symbols of each row.
+        call_deltas, put_deltas (np.ndarray): The deltas of each row, NaN until attach_greeks() is called.
+    """
+
+    def __init__(self, underlying, expirations, roots, expiration_types, settlement_types, offsets, strikes,
+                 calls, puts, call_streamer_symbols, put_streamer_symbols):
+        if np is None:
+            raise ImportError("OptionChain requires numpy: pip install tastytrade-api[columns]")
+        self.underlying = underlying
+        self.expirations = expirations
+        self.roots = roots
+        self.expiration_types = expiration_types
+        self.settlement_types = settlement_types
+        self.offsets = offsets
+        self.strikes = strikes
+        self.calls = calls
+        self.puts = puts
+        self.call_streamer_symbols = call_streamer_symbols
+        self.put_streamer_symbols = put_streamer_symbols
+        self.call_deltas = np.full(len(strikes), np.nan)
+        self.put_deltas = np.full(len(strikes), np.nan)
+        # Single lookups bisect plain lists, which is several times faster than NumPy calls on scalars.
+        self._days = expirations.astype(np.int64).tolist()
+        self._offsets = offsets.tolist()
+        self._strikes = strikes.tolist()
+        self._roots = roots.tolist()
+        self._rows_by_symbol = None
+
+    @classmethod
+    def from_nested(cls, chains: list) -> "OptionChain":
+        """
+        Builds the chain from the items of /option-chains/{symbol}/nested, as returned by
+        TastytradeInstruments.get_option_chains.
+
+        Raises:
+            ImportError: If numpy is not installed.
+            ValueError: If chains is empty.
+        """
+        if np is None:
+            raise ImportError("OptionChain requires numpy: pip install tastytrade-api[columns]")
+        if not chains:
+            raise ValueError("An option chain needs at least one root symbol")
+        slices = []
+        for chain in chains:
+            root = chain.get("root-symbol")
+            for expiration in chain.get("expirations", ()):
+                strikes = sorted(expiration.get("strikes", ()), key=lambda strike: float(strike["strike-price"]))
+                slices.append((expiration["expiration-date"], root or "", expiration, strikes))
+        slices.sort(key=lambda entry: entry[:2])
+
+        rows = [strike for *_, strikes in slices for strike in strikes]
+        offsets = np.zeros(len(slices) + 1, dtype=np.int64)
+        np.cumsum([len(strikes) for *_, strikes in slices], out=offsets[1:])
+
+        def objects(values):
+            array = np.empty(len(values), dtype=object)
+            array[:] = values
+            return array
+
+        return cls(
+            underlying=chains[0].get("underlying-symbol"),
+            expirations=np.array([day for day, *_ in slices], dtype="datetime64[D]"),
+            roots=objects([root for _, root, *_ in slices]),
+            expiration_types=objects([expiration.get("expiration-type") for _, _, expiration, _ in slices]),
+            settlement_types=objects([expiration.get("settlement-type") for _, _, expiration, _ in slices]),
+            offsets=offsets,
+            strikes=np.array([float(strike["strike-price"]) for strike in rows], dtype=np.float64),
+            calls=objects([strike.get("call") for strike in rows]),
+            puts=objects([strike.get("put") for strike in rows]),
+            call_streamer_symbols=objects([strike.get("call-streamer-symbol") for strike in rows]),
+            put_streamer_symbols=objects([strike.get("put-streamer-symbol") for strike in rows]),
+        )
+
+    def __len__(self):
+        return len(self.strikes)
+
+    def __repr__(self):
+        return f"OptionChain({self.underlying!r}, {len(self.expirations)} expirations, {len(self)} strikes)"
+
+    def days_to_expiration(self, as_of=None) -> "np.ndarray":
+        """Returns the number of days from as_of (defaults to today) to each expiration."""
+        return (self.expirations - _day(as_of or date.today())).astype(np.int64)
+
+    def expirations_between(self, min_dte: int = 0, max_dte: int = None, as_of=None, root: str = None):
+        """
+        Returns the indices of the expirations between min_dte and max_dte days (both included) after as_of.
+
+        Args:
+            min_dte (int): Optional. The minimum number of days to expiration.
+            max_dte (int): Optional. The maximum number of days to expiration. Defaults to no limit.
+            as_of (date): Optional. The date the days are counted from. Defaults to today.
+            root (str): Optional. Only keep the expirations of this root symbol.
+        """
+        start = _day_number(as_of or date.today())
+        first = bisect_left(self._days, start + min_dte)
+        last = len(self._days) if max_dte is None else bisect_right(self._days, start + max_dte)
+        indices = np.arange(first, max(first, last))
+        if root is not None:
+            indices = indices[self.roots[indices] == root]
+        return indices
+
+    def expiration_index(self, expiration, root: str = None) -> int:
+        """
+        Returns the index of an expiration given by date and optionally root.
+
+        Raises:
+            KeyError: If the chain has no such expiration.
+        """
+        day = _day_number(expiration)
+        index = bisect_left(self._days, day)
+        while index < len(self._days) and self._days[index] == day:
+            if root is None or self._roots[index] == root:
+                return index
+            index += 1
+        raise KeyError(f"No {root or self.underlying} expiration on {expiration}")
+
+    def rows(self, expiration, root: str = None) -> "np.ndarray":
+        """Returns the rows of an expiration, in ascending strike order."""
+        index = self.expiration_index(expiration, root)
+        return np.arange(self.offsets[index], self.offsets[index + 1])
+
+    def nearest(self, expiration, price: float, n: int = 10, root: str = None) -> "np.ndarray":
+        """
+        Returns the rows of the n strikes of an expiration closest to price, in ascending strike order.
+        """
+        index = self.expiration_index(expiration, root)
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        strikes = self._strikes
+        # Only the n strikes on either side of the insertion point can be among the n closest.
+        middle = bisect_left(strikes, price, start, stop)
+        window = range(max(start, middle - n), min(stop, middle + n))
+        closest = sorted(window, key=lambda row: abs(strikes[row] - price))[:n]
+        return np.array(sorted(closest), dtype=np.int64)
+
+    def symbol(self, expiration, strike: float, option_type: str, root: str = None):
+        """Returns the symbol of the call ("C") or put ("P") of an expiration and strike, or None."""
+        row = self._row(expiration, strike, root)
+        if row is None:
+            return None
+        return (self.calls if option_type == "C" else self.puts)[row]
+
+    def streamer_symbol(self, expiration, strike: float, option_type: str, root: str = None):
+        """Returns the streamer symbol of the call ("C") or put ("P") of an expiration and strike, or None."""
+        row = self._row(expiration, strike, root)
+        if row is None:
+            return None
+        return (self.call_streamer_symbols if option_type == "C" else self.put_streamer_symbols)[row]
+
+    def _row(self, expiration, strike, root):
+        try:
+            index = self.expiration_index(expiration, root)
+        except KeyError:
+            return None
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        strike = float(strike)
+        row = bisect_left(self._strikes, strike, start, stop)
+        if row < stop and self._strikes[row] == strike:
+            return row
+        return None
+
+    def find(self, symbol: str):
+        """
+        Returns the (row, option type) of an option or streamer symbol, or None if it is not in the chain.
+        """
+        if self._rows_by_symbol is None:
+            rows = {}
+            for option_type, *columns in (("C", self.calls, self.call_streamer_symbols),
+                                          ("P", self.puts, self.put_streamer_symbols)):
+                for column in columns:
+                    for row, value in enumerate(column.tolist()):
+                        if value is not None:
+                            rows[value] = (row, option_type)
+            self._rows_by_symbol = rows
+        return self._rows_by_symbol.get(symbol)
+
+    def attach_greeks(self, greeks):
+        """
+        Sets the deltas of the options from Greeks events.
+
+        Args:
+            greeks (dict or iterable): The delta of each option, either as a mapping of option or streamer
+                symbol to delta, or as (symbol, delta) pairs, such as eventSymbol and delta of dxFeed Greeks.
+
+        Returns:
+            int: The number of options of the chain that were updated.
+        """
+        items = greeks.items() if hasattr(greeks, "items") else greeks
+        updated = 0
+        for symbol, delta in items:
+            found = self.find(symbol)
+            if found is None:
+                continue
+            row, option_type = found
+            (self.call_deltas if option_type == "C" else self.put_deltas)[row] = delta
+            updated += 1
+        return updated
+
+    def delta_range(self, expiration, low: float, high: float, option_type: str = "C", root: str = None):
+        """
+        Returns the rows of an expiration whose call ("C") or put ("P") delta is between low and high (both
+        included), in ascending strike order. Put deltas are negative. Rows without a delta are left out.
+        """
+        index = self.expiration_index(expiration, root)
+        start, stop = self.offsets[index], self.offsets[index + 1]
+        deltas = (self.call_deltas if option_type == "C" else self.put_deltas)[start:stop]
+        return start + np.flatnonzero((deltas >= low) & (deltas <= high))
@@ -0,0 +1,296 @@
+"""
+Compact typed models of the main API resources.
+
+A model keeps the values of the fields it knows in __slots__, as they were received, instead of a dict per
+object, and interns its strings so that the values repeated across objects (types, dates, root symbols...) are
+stored once. This takes several times less memory when hundreds of thousands of instruments or orders are held.
+Numbers, prices and timestamps are decoded to Decimal, date and datetime when the attribute is read; nested
+lists of resources, such as the legs of an order, are models themselves. Keys a model does not declare are
+dropped.
+
+Clients return models when called with output="models", and the fields of a list of objects as typed arrays
+with output="columns" (see tastytrade_api.columns):
+
+    positions = client.get_positions(account_number, output="models")
+    positions[0].quantity  # Decimal("100")
+"""
+import sys
+from datetime import date, datetime
+from decimal import Decimal
+
+OUTPUTS = ("dicts", "models", "columns")
+
+
+def to_decimal(value):
+    if value is None or isinstance(value, Decimal):
+        return value
+    return Decimal(value if isinstance(value, (str, int)) else str(value))
+
+
+def to_date(value):
+    return None if value is None else date.fromisoformat(value)
+
+
+def to_datetime(value):
+    if value is None:
+        return None
+    # datetime.fromisoformat only accepts the Z suffix from Python 3.11.
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _parse_field(field):
+    """Returns the (key, attribute, slot, decode) of a field declared as "key" or ("key", decode)."""
+    key, decode = (field, None) if isinstance(field, str) else field
+    attribute = key.replace("-", "_")
+    slot = attribute if decode is None or _is_model(decode) else f"_{attribute}"
+    return key, attribute, slot, decode
+
+
+def _is_model(decode) -> bool:
+    return isinstance(decode, type) and issubclass(decode, Model)
+
+
+def field_slots(fields) -> tuple:
+    """Returns the __slots__ of a model declaring fields."""
+    return tuple(_parse_field(field)[2] for field in fields)
+
+
+def _reader(get_raw, decode):
+    def read(self):
+        return decode(get_raw(self))
+    return read
+
+
+class Model:
+    """
+    Base class of the models. A subclass declares `fields`, the API keys it keeps, each either a key or a
+    (key, decode) pair where decode is a function applied when the attribute is read or a Model class the
+    value is a list of, and sets `__slots__ = field_slots(fields)`. Attributes are the keys with "-" replaced
+    by "_".
+    """
+
+    __slots__ = ()
+    fields = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        setters = []
+        for field in cls.fields:
+            key, attribute, slot, decode = _parse_field(field)
+            member = cls.__dict__[slot]
+            nested = decode if _is_model(decode) else None
+            if decode is not None and nested is None:
+                setattr(cls, attribute, property(_reader(member.__get__, decode), doc=f"The decoded {key}."))
+            setters.append((member.__set__, member.__get__, key, nested))
+        cls._setters = tuple(setters)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Model":
+        """Builds the model of one API object."""
+        self = object.__new__(cls)
+        get = data.get
+        intern = sys.intern
+        for set_value, _, key, nested in cls._setters:
+            value = get(key)
+            if value.__class__ is str:
+                value = intern(value)
+            elif nested is not None and value is not None:
+                value = [nested.from_dict(item) for item in value]
+            set_value(self, value)
+        return self
+
+    def to_dict(self) -> dict:
+        """Returns the API object the model was built from, without the keys the model does not declare."""
+        data = {}
+        for _, get_value, key, nested in self._setters:
+            value = get_value(self)
+            if value is None:
+                continue
+            data[key] = [item.to_dict() for item in value] if nested is not None else value
+        return data
+
+    def _values(self) -> tuple:
+        return tuple(get_value(self) for _, get_value, _, _ in self._setters)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self):
+        _, get_value, key, _ = self._setters[0]
+        return f"{type(self).__name__}({key}={get_value(self)!r})"
+
+
+class Position(Model):
+    fields = (
+        "account-number", "symbol", "instrument-type", "underlying-symbol", ("quantity", to_decimal),
+        "quantity-direction", ("close-price", to_decimal), ("average-open-price", to_decimal),
+        ("average-yearly-market-close-price", to_decimal), ("average-daily-market-close-price", to_decimal),
+        ("mark", to_decimal), ("mark-price", to_decimal), ("multiplier", to_decimal), "cost-effect",
+        "is-suppressed", "is-frozen", ("restricted-quantity", to_decimal), ("expires-at", to_datetime),
+        ("realized-day-gain", to_decimal), "realized-day-gain-effect", ("realized-day-gain-date", to_date),
+        ("realized-today", to_decimal), "realized-today-effect", ("realized-today-date", to_date),
+        ("created-at", to_datetime), ("updated-at", to_datetime),
+    )
+    __slots__ = field_slots(fields)
+
+
+class AccountBalance(Model):
+    fields = (
+        "account-number", ("cash-balance", to_decimal), ("long-equity-value", to_decimal),
+        ("short-equity-value", to_decimal), ("long-derivative-value", to_decimal),
+        ("short-derivative-value", to_decimal), ("long-futures-value", to_decimal),
+        ("short-futures-value", to_decimal), ("long-futures-derivative-value", to_decimal),
+        ("short-futures-derivative-value", to_decimal), ("long-margineable-value", to_decimal),
+        ("short-margineable-value", to_decimal), ("margin-equity", to_decimal), ("equity-buying-power", to_decimal),
+        ("derivative-buying-power", to_decimal), ("day-trading-buying-power", to_decimal),
+        ("futures-margin-requirement", to_decimal), ("available-trading-funds", to_decimal),
+        ("maintenance-requirement", to_decimal), ("maintenance-call-value", to_decimal),
+        ("reg-t-call-value", to_decimal), ("day-trading-call-value", to_decimal), ("day-equity-call-value", to_decimal),
+        ("net-liquidating-value", to_decimal), ("cash-available-to-withdraw", to_decimal),
+        ("day-trade-excess", to_decimal), ("pending-cash", to_decimal), "pending-cash-effect",
+        ("long-cryptocurrency-value", to_decimal), ("short-cryptocurrency-value", to_decimal),
+        ("cryptocurrency-margin-requirement", to_decimal), ("closed-loop-available-balance", to_decimal),
+        ("equity-offering-margin-requirement", to_decimal), ("long-bond-value", to_decimal),
+        ("bond-margin-requirement", to_decimal), ("maintenance-excess", to_decimal),
+        ("pending-margin-interest", to_decimal), ("snapshot-date", to_date), "time-of-day",
+        ("updated-at", to_datetime),
+    )
+    __slots__ = field_slots(fields)
+
+
+class OrderLeg(Model):
+    fields = (
+        "symbol", "instrument-type", "action", ("quantity", to_decimal), ("remaining-quantity", to_decimal), "fills",
+    )
+    __slots__ = field_slots(fields)
+
+
+class Order(Model):
+    fields = (
+        "id", "account-number", "time-in-force", ("gtc-date", to_date), "order-type", ("size", to_decimal),
+        "underlying-symbol", "underlying-instrument-type", ("price", to_decimal), "price-effect",
+        ("value", to_decimal), "value-effect", ("stop-trigger", to_decimal), "status", "contingent-status",
+        "confirmation-status", "cancellable", "editable", "edited", ("cancelled-at", to_datetime),
+        "replacing-order-id", "replaces-order-id", ("received-at", to_datetime), "updated-at",
+        ("live-at", to_datetime), ("terminal-at", to_datetime), "reject-reason", "complex-order-id",
+        "complex-order-tag", "preflight-id", "source", ("legs", OrderLeg),
+    )
+    __slots__ = field_slots(fields)
+
+
+class Equity(Model):
+    fields = (
+        "symbol", "id", "instrument-type", "cusip", "short-description", "description", "is-index", "is-etf",
+        "listed-market", "lendability", ("borrow-rate", to_decimal), ("halted-at", to_datetime),
+        ("stops-trading-at", to_datetime), "market-time-instrument-collection", "is-closing-only",
+        "is-options-closing-only", "active", "is-fractional-quantity-eligible", "is-illiquid", "streamer-symbol",
+        "tick-sizes", "option-tick-sizes",
+    )
+    __slots__ = field_slots(fields)
+
+
+class EquityOption(Model):
+    fields = (
+        "symbol", "instrument-type", "active", "listed-market", ("strike-price", to_decimal), "root-symbol",
+        "underlying-symbol", ("expiration-date", to_date), "exercise-style", "shares-per-contract", "option-type",
+        "option-chain-type", "expiration-type", "settlement-type", ("stops-trading-at", to_datetime),
+        "market-time-instrument-collection", "days-to-expiration", ("expires-at", to_datetime), "is-closing-only",
+        "streamer-symbol",
+    )
+    __slots__ = field_slots(fields)
+
+
+class Future(Model):
+    fields = (
+        "symbol", "product-code", ("contract-size", to_decimal), ("tick-size", to_decimal),
+        ("notional-multiplier", to_decimal), ("main-fraction", to_decimal), ("sub-fraction", to_decimal),
+        ("display-factor", to_decimal), ("last-trade-date", to_date), ("expiration-date", to_date),
+        ("closing-only-date", to_date), "active", "active-month", "next-active-month", "is-closing-only",
+        ("stops-trading-at", to_datetime), ("expires-at", to_datetime), "product-group", "exchange",
+        "roll-target-symbol", "streamer-exchange-code", "streamer-symbol", "back-month-first-calendar-symbol",
+        "is-tradeable", "future-product", "tick-sizes", "option-tick-sizes", "spread-tick-sizes",
+    )
+    __slots__ = field_slots(fields)
+
+
+class MarketMetric(Model):
+    fields = (
+        "symbol", ("implied-volatility-index", to_decimal), ("implied-volatility-index-5-day-change", to_decimal),
+        ("implied-volatility-index-rank", to_decimal), ("tos-implied-volatility-index-rank", to_decimal),
+        ("tw-implied-volatility-index-rank", to_decimal), ("implied-volatility-percentile", to_decimal),
+        ("implied-volatility-30-day", to_decimal), ("historical-volatility-30-day", to_decimal),
+        ("historical-volatility-60-day", to_decimal), ("historical-volatility-90-day", to_decimal),
+        ("iv-hv-30-day-difference", to_decimal), ("liquidity-value", to_decimal), ("liquidity-rank", to_decimal),
+        "liquidity-rating", ("beta", to_decimal), ("corr-spy-3month", to_decimal), ("market-cap", to_decimal),
+        ("price-earnings-ratio", to_decimal), ("earnings-per-share", to_decimal), ("dividend-yield", to_decimal),
+        ("borrow-rate", to_decimal), "lendability", ("updated-at", to_datetime),
+    )
+    __slots__ = field_slots(fields)
+
+
+class Strike(Model):
+    fields = (("strike-price", to_decimal), "call", "call-streamer-symbol", "put", "put-streamer-symbol")
+    __slots__ = field_slots(fields)
+
+
+class ChainExpiration(Model):
+    fields = (
+        ("expiration-date", to_date), "expiration-type", "days-to-expiration", "settlement-type", ("strikes", Strike),
+    )
+    __slots__ = field_slots(fields)
+
+
+class NestedOptionChain(Model):
+    fields = (
+        "root-symbol", "underlying-symbol", "option-chain-type", "shares-per-contract", "tick-sizes", "deliverables",
+        ("expirations", ChainExpiration),
+    )
+    __slots__ = field_slots(fields)
+
+
+def convert(items, model, output: str = "dicts"):
+    """
+    Returns the API objects in the requested output: as they are for "dicts", as instances of model for
+    "models", or as the Columns of the model fields for "columns". For "models", a list gives a list and any
+    other iterable a lazy iterator; "columns" consumes the iterable.
+
+    Raises:
+        ValueError: If output is not one of OUTPUTS.
+    """
+    if output == "dicts":
+        return items
+    if output == "models":
+        if isinstance(items, list):
+            return [model.from_dict(item) for item in items]
+        return map(model.from_dict, items)
+    if output == "columns":
+        from .columns import Columns
+        return Columns.from_items(items, model)
+    raise ValueError(f"output must be one of {OUTPUTS}, not {output!r}")
+
+
+def convert_one(item: dict, model, output: str = "dicts"):
+    """Same as convert, for a single API object, which has no "columns" output."""
+    if output == "columns":
+        raise ValueError("output='columns' is only available for lists of objects")
+    return convert([item], model, output)[0]
+
+
+def aconvert(items, model, output: str = "dicts"):
+    """Same as convert, for an async iterator of API objects, which has no "columns" output."""
+    if output == "dicts":
+        return items
+    if output == "models":
+        return _aconvert(items, model)
+    raise ValueError(f"output must be 'dicts' or 'models' for an async iterator, not {output!r}")
+
+
+async def _aconvert(items, model):
+    async for item in items:
+        yield model.from_dict(item)
@@ -0,0 +1,128 @@
+import asyncio
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .deadline import abind_deadline, bind_deadline
+
+
+def total_pages(response_data: dict):
+    """
+    Returns the total number of pages reported by a paginated response, or None when the response
+    carries no pagination metadata.
+    """
+    pagination = response_data.get("pagination") or {}
+    pages = pagination.get("total-pages")
+    return int(pages) if pages is not None else None
+
+
+def page_items(response_data: dict) -> list:
+    return response_data["data"]["items"]
+
+
+def submit_in_context(executor, func, *args):
+    """
+    Submits func to executor so that it runs with a copy of the caller's context variables, e.g. the
+    current deadline.
+    """
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+
+def iter_pages(fetch_page, page_offset: int = 0, prefetch: int = 2, timeout: float = None):
+    """
+    Yields every page of a paginated endpoint, starting at page_offset.
+
+    The first page is fetched to read the "total-pages" pagination metadata. While a page is being
+    consumed, up to `prefetch` following pages are fetched concurrently on worker threads, so at most
+    `prefetch` pages are held in memory ahead of the consumer.
+
+    Args:
+        fetch_page (callable): Called with a page offset, returns the decoded response of that page.
+        page_offset (int): Optional. The page to start from. Default is 0.
+        prefetch (int): Optional. The number of pages fetched ahead of the consumer. Default is 2.
+        timeout (float): Optional. Overall budget in seconds for fetching every page, starting when
+            iteration starts. A deadline already set by the caller also applies.
+
+    Yields:
+        dict: The decoded response of each page, in page order.
+
+    Raises:
+        DeadlineExceeded: If the pages could not all be fetched in time.
+    """
+    fetch_page = bind_deadline(fetch_page, timeout)
+    first = fetch_page(page_offset)
+    yield first
+
+    pages = total_pages(first)
+    if pages is None or page_offset + 1 >= pages:
+        return
+
+    next_offsets = iter(range(page_offset + 1, pages))
+    window = max(1, prefetch)
+    executor = ThreadPoolExecutor(max_workers=window)
+    pending = deque()
+    try:
+        for offset in next_offsets:
+            pending.append(submit_in_context(executor, fetch_page, offset))
+            if len(pending) >= window:
+                break
+        while pending:
+            page = pending.popleft().result()
+            for offset in next_offsets:
+                pending.append(submit_in_context(executor, fetch_page, offset))
+                break
+            yield page
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def iter_items(fetch_page, page_offset: int = 0, prefetch: int = 2, timeout: float = None):
+    """
+    Yields the individual items of every page of a paginated endpoint. See iter_pages.
+    """
+    for page in iter_pages(fetch_page, page_offset, prefetch, timeout):
+        yield from page_items(page)
+
+
+async def aiter_pages(fetch_page, page_offset: int = 0, prefetch: int = 2, timeout: float = None):
+    """
+    Asyncio counterpart of iter_pages. `fetch_page` is a coroutine function and the following pages
+    are prefetched as tasks on the running event loop.
+    """
+    fetch_page = abind_deadline(fetch_page, timeout)
+    first = await fetch_page(page_offset)
+    yield first
+
+    pages = total_pages(first)
+    if pages is None or page_offset + 1 >= pages:
+        return
+
+    next_offsets = iter(range(page_offset + 1, pages))
+    window = max(1, prefetch)
+    pending = deque()
+    try:
+        for offset in next_offsets:
+            pending.append(asyncio.ensure_future(fetch_page(offset)))
+            if len(pending) >= window:
+                break
+        while pending:
+            page = await pending.popleft()
+            for offset in next_offsets:
+                pending.append(asyncio.ensure_future(fetch_page(offset)))
+                break
+            yield page
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def aiter_items(fetch_page, page_offset: int = 0, prefetch: int = 2, timeout: float = None):
+    """
+    Asyncio counterpart of iter_items.
+    """
+    async for page in aiter_pages(fetch_page, page_offset, prefetch, timeout):
+        for item in page_items(page):
+            yield item
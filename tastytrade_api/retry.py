@@ -0,0 +1,48 @@
+import random
+
+from .scheduler import parse_retry_after
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+RETRYABLE_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are sent again and how long to wait in between.
+
+    Only idempotent methods are retried, so an order is never submitted twice. Delays follow exponential
+    backoff with full jitter: attempt n waits a random time between 0 and min(max_backoff, backoff * 2**n),
+    or at least the Retry-After delay the server asked for.
+
+    Args:
+        max_attempts (int): Optional. Total number of attempts, including the first one. Default is 3.
+        backoff (float): Optional. Base delay in seconds. Default is 0.2.
+        max_backoff (float): Optional. Upper bound of a single delay in seconds. Default is 5.
+        methods (iterable): Optional. HTTP methods that may be retried. Default is GET, HEAD and OPTIONS.
+        statuses (iterable): Optional. Status codes that are retried. Default is 429, 500, 502, 503 and 504.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.2, max_backoff: float = 5.0,
+                 methods=IDEMPOTENT_METHODS, statuses=RETRYABLE_STATUSES):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = frozenset(method.upper() for method in methods)
+        self.statuses = frozenset(statuses)
+
+    def can_retry(self, method: str, attempt: int) -> bool:
+        """Returns True if a request that failed on its `attempt`-th try (counting from 1) may be sent again."""
+        return method.upper() in self.methods and attempt < self.max_attempts
+
+    def should_retry_response(self, method: str, response, attempt: int) -> bool:
+        return response.status_code in self.statuses and self.can_retry(method, attempt)
+
+    def delay(self, attempt: int, response=None) -> float:
+        """Returns how long to wait before attempt number `attempt + 1`."""
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+        if response is not None and "Retry-After" in response.headers:
+            delay = max(delay, parse_retry_after(response.headers["Retry-After"]))
+        return delay
+
+
+DEFAULT_RETRY = RetryPolicy()
@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from .deadline import DeadlineExceeded, remaining
+
+
+class Priority:
+    """
+    Scheduler lanes, from highest to lowest priority.
+
+    ORDERS is used for order entry, replacement and cancellation, BULK for market data, instrument and
+    history fetches, and DEFAULT for everything else.
+    """
+    ORDERS = "orders"
+    DEFAULT = "default"
+    BULK = "bulk"
+
+
+LANES = (Priority.ORDERS, Priority.DEFAULT, Priority.BULK)
+
+# How long a waiter sleeps before re-checking when a higher-priority lane is ahead of it.
+_POLL_INTERVAL = 0.005
+
+
+def parse_retry_after(value, default: float = 1.0) -> float:
+    """
+    Returns the number of seconds to wait according to a Retry-After header, which is either a number
+    of seconds or an HTTP date.
+    """
+    if value is None:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class LaneMetrics:
+    """
+    Queue-depth and wait-time counters of one scheduler lane.
+    """
+
+    def __init__(self):
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.requests = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "requests": self.requests,
+            "total_wait": self.total_wait,
+            "mean_wait": self.total_wait / self.requests if self.requests else 0.0,
+            "max_wait": self.max_wait,
+            "throttled": self.throttled,
+        }
+
+
+class RequestScheduler:
+    """
+    Client-side rate limiter shared by the blocking and asyncio transports.
+
+    Requests take a token from a token bucket refilled at `rate` tokens per second, holding at most
+    `burst` tokens. When several lanes are waiting, a token always goes to the highest-priority lane,
+    so orders are never queued behind bulk fetches. A 429 response pauses every lane for the duration
+    given by its Retry-After header.
+
+    Args:
+        rate (float): Optional. Sustained requests per second. Default is 10.
+        burst (int): Optional. Maximum number of requests sent back to back. Default is 10.
+        max_throttle_retries (int): Optional. How many times the transport resends a request answered
+            with 429 Too Many Requests. Default is 3.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 10, max_throttle_retries: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self.max_throttle_retries = max_throttle_retries
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._metrics = {lane: LaneMetrics() for lane in LANES}
+
+    def _lane(self, lane):
+        if lane not in self._metrics:
+            raise ValueError(f"Unknown scheduler lane: {lane}")
+        return self._metrics[lane]
+
+    def _try_acquire(self, lane) -> float:
+        """
+        Takes a token for lane if one is available. Must be called with the lock held.
+
+        Returns:
+            float: 0 if a token was taken, otherwise how long to wait before trying again.
+        """
+        now = time.monotonic()
+        if now < self._paused_until:
+            return self._paused_until - now
+        self._tokens = min(self.burst, self._tokens + max(0.0, now - self._updated) * self.rate)
+        self._updated = now
+        for higher in LANES[:LANES.index(lane)]:
+            if self._metrics[higher].queue_depth:
+                return _POLL_INTERVAL
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+    def _bounded(self, wait: float, lane) -> float:
+        """
+        Returns wait shortened to the current deadline (see tastytrade_api.deadline).
+
+        Raises:
+            DeadlineExceeded: If the next token or the end of the pause comes after the deadline.
+        """
+        left = remaining()
+        if left is None:
+            return wait
+        if wait > left:
+            raise DeadlineExceeded(f"Deadline exceeded while waiting for the {lane} rate limit")
+        return wait
+
+    def _enqueue(self, metrics):
+        metrics.queue_depth += 1
+        metrics.max_queue_depth = max(metrics.max_queue_depth, metrics.queue_depth)
+
+    def _dequeue(self, metrics, waited):
+        metrics.queue_depth -= 1
+        metrics.requests += 1
+        metrics.total_wait += waited
+        metrics.max_wait = max(metrics.max_wait, waited)
+
+    def acquire(self, lane: str = Priority.DEFAULT) -> float:
+        """
+        Blocks until a request in lane may be sent.
+
+        Returns:
+            float: The number of seconds spent waiting.
+
+        Raises:
+            DeadlineExceeded: If the request could not be sent before the current deadline.
+        """
+        start = time.monotonic()
+        with self._condition:
+            metrics = self._lane(lane)
+            self._enqueue(metrics)
+            try:
+                while True:
+                    wait = self._try_acquire(lane)
+                    if not wait:
+                        break
+                    self._condition.wait(self._bounded(wait, lane))
+            except BaseException:
+                metrics.queue_depth -= 1
+                raise
+            waited = time.monotonic() - start
+            self._dequeue(metrics, waited)
+            self._condition.notify_all()
+        return waited
+
+    async def acquire_async(self, lane: str = Priority.DEFAULT) -> float:
+        """
+        Asyncio counterpart of acquire; waits on the event loop instead of blocking the thread.
+        """
+        start = time.monotonic()
+        with self._lock:
+            metrics = self._lane(lane)
+            self._enqueue(metrics)
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(lane)
+                if not wait:
+                    break
+                await asyncio.sleep(self._bounded(wait, lane))
+        except BaseException:
+            with self._lock:
+                metrics.queue_depth -= 1
+            raise
+        with self._condition:
+            waited = time.monotonic() - start
+            self._dequeue(metrics, waited)
+            self._condition.notify_all()
+        return waited
+
+    def throttled(self, lane: str = Priority.DEFAULT, retry_after=None):
+        """
+        Records a 429 Too Many Requests response and pauses every lane until the Retry-After delay has elapsed.
+
+        Args:
+            lane (str): The lane of the throttled request.
+            retry_after (str): Optional. The value of the Retry-After response header.
+        """
+        delay = parse_retry_after(retry_after)
+        with self._condition:
+            self._lane(lane).throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            # Start refilling from an empty bucket once the pause is over.
+            self._tokens = 0.0
+            self._updated = self._paused_until
+            self._condition.notify_all()
+
+    def metrics(self) -> dict:
+        """
+        Returns a snapshot of the per-lane metrics, keyed by lane name.
+        """
+        with self._lock:
+            return {lane: metrics.as_dict() for lane, metrics in self._metrics.items()}
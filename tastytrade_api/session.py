@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import threading
+import time
+
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+# Tastytrade session tokens are valid for 24 hours after login; assumed when a login reports no expiration.
+DEFAULT_SESSION_LIFETIME = 24 * 60 * 60
+DEFAULT_REFRESH_MARGIN = 15 * 60
+# Longest delay before the background thread tries again after a failed refresh.
+REFRESH_RETRY_INTERVAL = 30.0
+DEFAULT_REFRESH_BACKOFF = RetryPolicy(backoff=1.0, max_backoff=REFRESH_RETRY_INTERVAL)
+
+
+class SessionManager:
+    """
+    Keeps the session of a TastytradeAuth alive and hands its current token to the transports.
+
+    The session expires at the session-expiration reported by the login, or lifetime seconds after the login
+    when none was reported, and is replaced with the remember token shortly before that, either by a background
+    thread or by the first call that needs a token once it is due. A transport given the manager sends that token with every API request instead of the one
+    a client was created with, and re-logs in once when a request is rejected with 401 Unauthorized. No
+    /sessions/validate round trip is needed on the way.
+
+    Token reads are lock-free; refreshes are serialized, so concurrent callers that find the token stale, or
+    get a 401 with the same token, cause a single login.
+
+    Args:
+        auth (TastytradeAuth): The authentication object whose session is managed. If it is not logged in yet,
+            the first token request logs in.
+        lifetime (float): Optional. How long a session token stays valid, in seconds, for logins that do not
+            report a session-expiration.
+        refresh_margin (float): Optional. How long before the expiry the session is refreshed, in seconds.
+        background (bool): Optional. Whether to start the background refresh thread right away, see start().
+        refresh_backoff (RetryPolicy): Optional. Spaces the retries of failed background refreshes. Defaults to
+            DEFAULT_REFRESH_BACKOFF, up to REFRESH_RETRY_INTERVAL seconds.
+
+    Raises:
+        ValueError: If refresh_margin is not shorter than lifetime.
+    """
+
+    def __init__(self, auth, lifetime: float = DEFAULT_SESSION_LIFETIME,
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN, background: bool = False,
+                 refresh_backoff: RetryPolicy = None):
+        if refresh_margin >= lifetime:
+            raise ValueError("refresh_margin must be shorter than the session lifetime")
+        self.auth = auth
+        self.lifetime = lifetime
+        self.refresh_margin = refresh_margin
+        self.refresh_backoff = refresh_backoff or DEFAULT_REFRESH_BACKOFF
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        if auth.session_token and auth.token_timestamp is None:
+            # A token set from outside, e.g. restored from a previous run; count its age from now.
+            auth.token_timestamp = time.time()
+        if background:
+            self.start()
+
+    @property
+    def expires_at(self):
+        """The time.time() at which the current session token expires, or None before the first login."""
+        if self.auth.session_token is None:
+            return None
+        if self.auth.session_expiration is not None:
+            return self.auth.session_expiration
+        if self.auth.token_timestamp is None:
+            return None
+        return self.auth.token_timestamp + self.lifetime
+
+    def _refresh_at(self):
+        expires_at = self.expires_at
+        return None if expires_at is None else expires_at - self.refresh_margin
+
+    def _due(self) -> bool:
+        refresh_at = self._refresh_at()
+        return refresh_at is None or time.time() >= refresh_at
+
+    def authorizes(self, url: str) -> bool:
+        """
+        Returns whether requests to url should carry the managed token: every API endpoint except the
+        /sessions ones, which authenticate on their own.
+        """
+        base = self.auth.url.rstrip("/")
+        return url.startswith(base + "/") and not url.startswith(base + "/sessions")
+
+    def token(self) -> str:
+        """
+        Returns the current session token, logging in or refreshing the session first when it is due.
+
+        Raises:
+            ValidationError: If a new session was needed and could not be created.
+        """
+        if not self._due():
+            return self.auth.session_token
+        with self._lock:
+            # Another caller may have refreshed while we waited for the lock.
+            if self._due():
+                self._refresh()
+            return self.auth.session_token
+
+    def renew(self, rejected_token: str) -> str:
+        """
+        Handles a 401 response: creates a new session unless the token that was rejected has already been
+        replaced, and returns the token to send the request again with.
+
+        Args:
+            rejected_token (str): The token the rejected request was sent with.
+
+        Raises:
+            ValidationError: If no new session could be created.
+        """
+        with self._lock:
+            if self.auth.session_token == rejected_token:
+                self._refresh()
+            return self.auth.session_token
+
+    async def token_async(self) -> str:
+        """Coroutine version of token(); a refresh runs on a worker thread."""
+        if not self._due():
+            return self.auth.session_token
+        return await asyncio.to_thread(self.token)
+
+    async def renew_async(self, rejected_token: str) -> str:
+        """Coroutine version of renew(); the login runs on a worker thread."""
+        return await asyncio.to_thread(self.renew, rejected_token)
+
+    def _refresh(self):
+        if self.auth.session_token is None:
+            self.auth.login()
+        else:
+            self.auth.refresh_session()
+        logger.debug("Tastytrade session refreshed, valid until %s", self.expires_at)
+
+    def start(self):
+        """
+        Starts a daemon thread that refreshes the session refresh_margin seconds before it expires, so API
+        calls never wait for a login. A failed refresh, whatever it raised, is retried after a jittered
+        exponential backoff of up to REFRESH_RETRY_INTERVAL seconds.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="tastytrade-session-refresh", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        delay = 0.0
+        failures = 0
+        while not self._stopped.wait(delay):
+            try:
+                self.token()
+            except Exception as exc:
+                # Any error is retried: ending the thread would leave every caller with an expiring token.
+                failures += 1
+                delay = self.refresh_backoff.delay(failures)
+                logger.warning("Refreshing the Tastytrade session failed, retrying in %.1f s: %r", delay, exc)
+                continue
+            failures = 0
+            delay = max(0.0, self._refresh_at() - time.time())
+
+    def stop(self):
+        """Stops the background refresh thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,171 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+except ImportError:  # pragma: no cover - optional dependency
+    Fernet = None
+    InvalidToken = ValueError
+
+from .authentication import session_expiration
+from .codec import dumps_bytes, loads
+from .session import DEFAULT_REFRESH_MARGIN, DEFAULT_SESSION_LIFETIME
+
+logger = logging.getLogger(__name__)
+
+
+class FileSessionStore:
+    """
+    Shares Tastytrade sessions between processes through files in a directory, one per username.
+
+    A TastytradeAuth given the store first looks for a session saved by another process and only logs in when
+    there is none that stays valid for longer than refresh_margin. The lookup, the login and the save happen
+    under an exclusive file lock, so N processes starting together produce one login, and the others reuse
+    its session and remember token. Session refreshes are coordinated the same way.
+
+    Sessions are encrypted with Fernet, which needs the `secure` extra (`pip install tastytrade-api[secure]`),
+    and files are only readable by their owner. Storing the tokens unencrypted has to be asked for with
+    insecure_plaintext=True.
+
+    Args:
+        path (str or Path): The directory the sessions are stored in. It is created if needed.
+        key (bytes or str): A Fernet key, see generate_key(). A session saved with another key is ignored, as if
+            there was none.
+        lifetime (float): Optional. How long a session token stays valid, in seconds, for logins that do not
+            report a session-expiration.
+        refresh_margin (float): Optional. A saved session expiring sooner than this is not reused, in seconds.
+        insecure_plaintext (bool): Optional. Store the sessions unencrypted when no key is given. Default is
+            False.
+
+    Raises:
+        ValueError: If neither a key nor insecure_plaintext=True was given.
+    """
+
+    def __init__(self, path, key=None, lifetime: float = DEFAULT_SESSION_LIFETIME,
+                 refresh_margin: float = DEFAULT_REFRESH_MARGIN, insecure_plaintext: bool = False):
+        if key is None and not insecure_plaintext:
+            raise ValueError("FileSessionStore needs a Fernet key to encrypt the sessions, see generate_key(); "
+                             "pass insecure_plaintext=True to store them unencrypted")
+        if key is not None and Fernet is None:
+            raise ImportError("Encrypting sessions requires cryptography: pip install tastytrade-api[secure]")
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.fernet = Fernet(key) if key is not None else None
+        self.lifetime = lifetime
+        self.refresh_margin = refresh_margin
+
+    @staticmethod
+    def generate_key() -> bytes:
+        """Returns a new random Fernet key."""
+        if Fernet is None:
+            raise ImportError("Encrypting sessions requires cryptography: pip install tastytrade-api[secure]")
+        return Fernet.generate_key()
+
+    def _file(self, username: str, suffix: str) -> Path:
+        # Hashed so that any username is a valid file name and the directory listing does not reveal it.
+        name = hashlib.sha256(username.encode("utf-8")).hexdigest()
+        return self.path / f"{name}{suffix}"
+
+    @contextmanager
+    def lock(self, username: str):
+        """Holds the exclusive cross-process lock of the session of username."""
+        fd = os.open(self._file(username, ".lock"), os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+            os.close(fd)
+
+    def load(self, username: str):
+        """
+        Returns the session saved for username, as a dict with the `data` of the login response and the
+        `token-timestamp` of the login, or None if there is none that can be read.
+        """
+        try:
+            content = self._file(username, ".session").read_bytes()
+        except FileNotFoundError:
+            return None
+        try:
+            if self.fernet is not None:
+                content = self.fernet.decrypt(content)
+            return loads(content)
+        except (InvalidToken, ValueError):
+            logger.warning("Ignoring the unreadable saved session of %s", username)
+            return None
+
+    def save(self, username: str, data: dict, token_timestamp: float):
+        """Saves the login response data of username, replacing the file atomically."""
+        content = dumps_bytes({"data": data, "token-timestamp": token_timestamp})
+        if self.fernet is not None:
+            content = self.fernet.encrypt(content)
+        target = self._file(username, ".session")
+        temporary = self._file(username, f".{os.getpid()}.{threading.get_ident()}.tmp")
+        fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as file:
+            file.write(content)
+        os.replace(temporary, target)
+
+    def delete(self, username: str):
+        """Forgets the session saved for username."""
+        try:
+            self._file(username, ".session").unlink()
+        except FileNotFoundError:
+            pass
+
+    def _reusable(self, record, auth) -> bool:
+        # A record from an older version or a damaged file is treated as missing.
+        if not isinstance(record, dict) or not isinstance(record.get("data"), dict):
+            return False
+        timestamp = record.get("token-timestamp")
+        if not isinstance(timestamp, (int, float)):
+            return False
+        try:
+            expires_at = session_expiration(record)
+        except (TypeError, ValueError):
+            return False
+        if expires_at is None:
+            expires_at = timestamp + self.lifetime
+        if time.time() >= expires_at - self.refresh_margin:
+            return False
+        # Only a session newer than the one auth already holds replaces it.
+        return auth.token_timestamp is None or timestamp > auth.token_timestamp
+
+    def share(self, auth, create):
+        """
+        Gives auth the saved session if it can be reused, or else calls create() to create a new one and saves
+        it for the other processes. Both happen under the lock of auth.username.
+
+        Args:
+            auth (TastytradeAuth): The authentication object to update.
+            create (callable): Creates the session and returns the login response, e.g. a login.
+
+        Returns:
+            dict: The login response, saved or new.
+        """
+        with self.lock(auth.username):
+            record = self.load(auth.username)
+            if self._reusable(record, auth):
+                data = {"data": record["data"]}
+                auth.apply_session(data, record["token-timestamp"])
+                return data
+            data = create()
+            self.save(auth.username, data["data"], auth.token_timestamp)
+            return data
@@ -0,0 +1,216 @@
+"""
+Bounded data queues for CometdWebsocketClient, for consumers that cannot always keep up with the stream.
+
+The client awaits data_queue.put() for every /service/data message (the data field, e.g.
+["Quote", ["SPY", 1.0, ...]] or [["Quote", ["eventSymbol", ...]], [...]] when it carries the field header) and for
+the Disconnected and Reconnected events of run_forever. These queues bound what piles up in between:
+
+    BlockingQueue      holds up to maxsize messages; put waits for room, which stops the client from reading
+                       the websocket, so the server sees the backpressure.
+    DropOldestQueue    holds up to maxsize messages; a new message replaces the oldest one.
+    ConflatingQueue    keeps only the latest event of each (event type, symbol), so a slow consumer gets
+                       every symbol's current value instead of a backlog of old ones.
+
+Connection events are never dropped or conflated. Every queue reports what it did with metrics().
+"""
+import asyncio
+import time
+from collections import deque
+
+POLICIES = ("block", "drop-oldest", "conflate")
+DEFAULT_MAXSIZE = 10000
+
+
+def delivery_queue(policy: str = "block", maxsize: int = DEFAULT_MAXSIZE):
+    """
+    Returns a data queue for a CometdWebsocketClient.
+
+    Args:
+        policy (str): Optional. "block", "drop-oldest" or "conflate", see the module docstring. Default is "block".
+        maxsize (int): Optional. The maximum number of queued messages of "block" and "drop-oldest". The size
+            of a conflating queue is bounded by the number of subscribed symbols instead.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+    if policy == "block":
+        return BlockingQueue(maxsize)
+    if policy == "drop-oldest":
+        return DropOldestQueue(maxsize)
+    if policy == "conflate":
+        return ConflatingQueue()
+    raise ValueError(f"Unknown delivery policy {policy!r}, expected one of {', '.join(POLICIES)}")
+
+
+def _is_data(item) -> bool:
+    return isinstance(item, list)
+
+
+class BlockingQueue(asyncio.Queue):
+    """
+    An asyncio.Queue of at most maxsize messages that counts how often and how long put had to wait.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        super().__init__(maxsize)
+        self.blocked = 0
+        self.blocked_time = 0.0
+        self.max_depth = 0
+
+    async def put(self, item):
+        if self.full():
+            self.blocked += 1
+            started = time.monotonic()
+            await super().put(item)
+            self.blocked_time += time.monotonic() - started
+        else:
+            super().put_nowait(item)
+        self.max_depth = max(self.max_depth, self.qsize())
+
+    def metrics(self) -> dict:
+        return {
+            "queued": self.qsize(),
+            "max_depth": self.max_depth,
+            "blocked": self.blocked,
+            "blocked_time": self.blocked_time,
+        }
+
+
+class _DeliveryQueue:
+    """
+    The part of the asyncio.Queue interface the client and its consumers use: put, put_nowait, get, get_nowait,
+    qsize and empty. put never waits.
+    """
+
+    def __init__(self):
+        self._ready = asyncio.Event()
+        self.delivered = 0
+
+    async def put(self, item):
+        self.put_nowait(item)
+
+    def put_nowait(self, item):
+        self._push(item)
+        self._ready.set()
+
+    async def get(self):
+        while not self.qsize():
+            self._ready.clear()
+            await self._ready.wait()
+        return self.get_nowait()
+
+    def get_nowait(self):
+        if not self.qsize():
+            raise asyncio.QueueEmpty
+        self.delivered += 1
+        return self._pop()
+
+    def empty(self) -> bool:
+        return not self.qsize()
+
+
+class DropOldestQueue(_DeliveryQueue):
+    """
+    Holds at most maxsize data messages; putting another one drops the oldest.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        super().__init__()
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._items = deque()
+        self._data = 0
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def _push(self, item):
+        if _is_data(item):
+            if self._data >= self.maxsize:
+                self._drop_oldest()
+            self._data += 1
+        self._items.append(item)
+
+    def _drop_oldest(self):
+        for index, queued in enumerate(self._items):
+            if _is_data(queued):
+                del self._items[index]
+                self._data -= 1
+                self.dropped += 1
+                return
+
+    def _pop(self):
+        item = self._items.popleft()
+        if _is_data(item):
+            self._data -= 1
+        return item
+
+    def metrics(self) -> dict:
+        return {"queued": self.qsize(), "delivered": self.delivered, "dropped": self.dropped}
+
+
+class ConflatingQueue(_DeliveryQueue):
+    """
+    Keeps the latest event of each (event type, symbol) until it is delivered.
+
+    Messages are split into events with the field header the server sends in the first message of each event
+    type. A get returns all pending events of one event type as one message, in the same format, carrying the
+    header its events arrived with, if any. Events queued before a connection event are delivered before it, so
+    an event is never moved across a Disconnected or Reconnected.
+    Messages of an event type whose header was not seen are delivered unchanged.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.conflated = 0
+        self._fields = {}
+        # Pending deliveries in order: connection events and raw messages as they are, and (event type, header,
+        # dict of symbol to latest event) per event type that is still being filled. The header is the one the
+        # slot's events were sent with, or None if the server sent none since the previous slot of the type.
+        self._slots = deque()
+        self._open = {}
+
+    def qsize(self) -> int:
+        return len(self._slots)
+
+    def _push(self, item):
+        if not _is_data(item) or len(item) < 2:
+            self._slots.append(item)
+            self._open.clear()
+            return
+        event_type, values = item[0], item[1]
+        header = None
+        if isinstance(event_type, list):
+            event_type, header = event_type[0], event_type[1]
+            self._fields[event_type] = (len(header), header.index("eventSymbol") if "eventSymbol" in header else 0)
+            # Rows of the new header go into a new delivery, which carries the header.
+            self._open.pop(event_type, None)
+        if event_type not in self._fields:
+            self._slots.append(item)
+            return
+        size, symbol_index = self._fields[event_type]
+        latest = self._open.get(event_type)
+        if latest is None:
+            latest = self._open[event_type] = {}
+            self._slots.append((event_type, header, latest))
+        for start in range(0, len(values) - size + 1, size):
+            row = values[start:start + size]
+            symbol = row[symbol_index]
+            if symbol in latest:
+                self.conflated += 1
+            latest[symbol] = row
+
+    def _pop(self):
+        slot = self._slots.popleft()
+        if not isinstance(slot, tuple):
+            return slot
+        event_type, header, latest = slot
+        if self._open.get(event_type) is latest:
+            del self._open[event_type]
+        values = [value for row in latest.values() for value in row]
+        if header is not None:
+            return [[event_type, header], values]
+        return [event_type, values]
+
+    def metrics(self) -> dict:
+        return {"queued": self.qsize(), "delivered": self.delivered, "conflated": self.conflated}
@@ -1,25 +1,82 @@
 import asyncio
-import json
+import time
 import websockets
 import logging
 
+from ..codec import dumps, loads
+from ..exceptions import SubscriptionError, TransportError
+from .reconnect import DEFAULT_RECONNECT_BACKOFF, Disconnected, ReconnectMetrics, Reconnected
+from .subscriptions import SubscriptionRegistry
+
 logger = logging.getLogger(__name__)
 
+# CometD servers accept websocket messages of up to 64 KiB by default; stay under it with room for the envelope.
+MAX_MESSAGE_BYTES = 60000
+DEFAULT_ACK_TIMEOUT = 10.0
+
+
+def chunk_subscriptions(subscriptions, max_bytes=MAX_MESSAGE_BYTES):
+    """
+    Splits a map of event type to symbols into as few maps as possible whose JSON encoding stays under
+    max_bytes, keeping the order of the symbols.
+
+    :param subscriptions: A dict of event type (e.g. "Quote") to a list of symbols.
+    :param max_bytes: Optional. The maximum encoded size of the symbols of one map.
+    :return: A list of dicts of event type to symbols.
+    """
+    chunks, chunk, size = [], {}, 0
+    for event_type, symbols in subscriptions.items():
+        overhead = len(event_type) + 6
+        for symbol in symbols:
+            cost = len(symbol.encode()) + 3
+            if chunk and size + cost + (0 if event_type in chunk else overhead) > max_bytes:
+                chunks.append(chunk)
+                chunk, size = {}, 0
+            if event_type not in chunk:
+                chunk[event_type] = []
+                size += overhead
+            chunk[event_type].append(symbol)
+            size += cost
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
 class CometdWebsocketClient:
-    def __init__(self, url, auth_token, data_queue, on_handshake_success=None):
+    def __init__(self, url, auth_token, data_queue, on_handshake_success=None, token_provider=None):
         """
         Initialize a new instance of the class.
 
-        :param url: The URL to connect to.
-        :param auth_token: The authentication token to use.
-        :param data_queue: The queue to put data into.
+        :param url: The URL to connect to. With a token_provider, the streamer URL reported with the token is used
+            instead when there is one.
+        :param auth_token: The authentication token to use. Ignored when a token_provider is given.
+        :param data_queue: The queue to put data into. See tastytrade_api.streamer.delivery for bounded queues that
+            block, drop the oldest messages or conflate them per symbol when the consumer falls behind.
         :param on_handshake_success: Optional function to call on successful handshake.
+        :param token_provider: Optional StreamerTokenCache the token is taken from on every connect, so
+            reconnecting does not wait for a REST request. A token rejected in the handshake is dropped from it.
          """
         self.url = url
         self.auth_token = auth_token
+        self.token_provider = token_provider
+        self._streamer_token = None
         self.on_handshake_success = on_handshake_success
         self.message_id = 0
         self.data_queue = data_queue
+        self.websocket = None
+        self.client_id = None
+        # What the consumers of this client subscribed to with add_subscriptions, replayed after every handshake.
+        self.subscriptions = SubscriptionRegistry()
+        # The acknowledgement task of the last replay, see subscribe.
+        self.replayed = None
+        # Futures of the /service/sub messages waiting for their acknowledgement, by message id.
+        self._pending_acks = {}
+        # State of run_forever: when the connection dropped, and the connection attempts since.
+        self._supervised = False
+        self._disconnected_at = None
+        self._attempts = 0
+        self._attempt_started = None
+        self._metrics = ReconnectMetrics()
     
     def next_id(self):
         self.message_id += 1
@@ -28,8 +85,9 @@ class CometdWebsocketClient:
     async def connect(self):
         """
         Connect to the websocket server using the URL and authorization token provided
-        during initialization. 
+        during initialization, or those of the token provider's current token.
         """
+        await self.refresh_auth_token()
         headers = {
             'Authorization': 'Bearer ' + self.auth_token,
             'User-Agent': 'My Python App'
@@ -44,16 +102,88 @@ class CometdWebsocketClient:
             await self.send_handshake(websocket)
             heartbeat = asyncio.create_task(self.send_heartbeat(websocket))
 
-            # Process data messages from the listen method
-            async for message_data in self.listen(websocket):
-             #   print("Received data:", message_data)
-                await self.data_queue.put(message_data)
+            try:
+                # Process data messages from the listen method
+                async for message_data in self.listen(websocket):
+                 #   print("Received data:", message_data)
+                    await self.data_queue.put(message_data)
+            finally:
+                # Make sure the heartbeat task is canceled
+                heartbeat.cancel()
+                await asyncio.gather(heartbeat, return_exceptions=True)
+                self.client_id = None
+                self._fail_pending_acks("The connection was closed before the subscription was acknowledged")
+
+
+    async def run_forever(self, backoff=None, max_attempts: int = None):
+        """
+        Keeps the client connected: whenever the connection drops or cannot be opened, connects again after a
+        jittered exponential backoff, with a fresh token from the token provider when the cached one expired or
+        was rejected, and subscribes again to the registry (see add_subscriptions).
+
+        A dropped connection puts a Disconnected event on the data queue, and the next successful handshake a
+        Reconnected event with the downtime, so consumers know which data may be stale or missing. metrics()
+        reports the reconnect counts and latencies. Cancel the task running it to stop.
+
+        :param backoff: Optional. A RetryPolicy whose delay() spaces the attempts. Defaults to
+            DEFAULT_RECONNECT_BACKOFF, up to 30 seconds.
+        :param max_attempts: Optional. Give up after this many consecutive failed attempts. None never gives up.
+        :raises TransportError: If max_attempts attempts in a row failed.
+        """
+        backoff = backoff or DEFAULT_RECONNECT_BACKOFF
+        self._supervised = True
+        try:
+            while True:
+                connects = self._metrics.connects
+                self._attempt_started = time.monotonic()
+                try:
+                    await self.connect()
+                    error = None
+                except asyncio.CancelledError:
+                    # An Exception before Python 3.8; cancelling stops the loop rather than reconnecting.
+                    raise
+                except Exception as exc:
+                    error = exc
+                if self._metrics.connects > connects:
+                    self._attempts = 0
+                self._attempts += 1
+                await self._connection_lost(error, connected=self._metrics.connects > connects)
+                if max_attempts is not None and self._attempts >= max_attempts:
+                    raise TransportError(f"The streamer failed to connect {self._attempts} times in a row") from error
+                delay = backoff.delay(self._attempts)
+                logger.warning(f"Streamer connection lost ({error!r}), reconnecting in {delay:.2f} s")
+                await asyncio.sleep(delay)
+        finally:
+            self._supervised = False
+
+    def metrics(self) -> dict:
+        """
+        Returns the number of connects, disconnects, reconnects and failed attempts of run_forever, the downtime
+        of the reconnects and how long the last connection took to open and handshake.
+        """
+        return self._metrics.as_dict()
 
+    async def _connection_lost(self, error, connected):
+        if connected:
+            self._disconnected_at = time.time()
+            self._metrics.disconnects += 1
+            await self._put_event(Disconnected(self._disconnected_at, error))
+        else:
+            self._metrics.failed_attempts += 1
 
-            # Make sure the heartbeat task is canceled
-            heartbeat.cancel()
-            await asyncio.gather(heartbeat, return_exceptions=True)
+    async def _put_event(self, event):
+        if self.data_queue is not None:
+            await self.data_queue.put(event)
 
+    async def refresh_auth_token(self):
+        """
+        Takes the current token, and the streamer URL reported with it, from the token provider, if any. The
+        provider only makes a request when its cached token is missing or about to expire.
+        """
+        if self.token_provider is not None:
+            self._streamer_token = await self.token_provider.get_async()
+            self.auth_token = self._streamer_token.token
+            self.url = self._streamer_token.cometd_url or self.url
 
     async def send_handshake(self, websocket):
         """
@@ -96,12 +226,13 @@ class CometdWebsocketClient:
                 "interval":0
             }
         }
-        handshake_str = json.dumps([handshake_message])
+        handshake_str = dumps([handshake_message])
         await websocket.send(handshake_str)
 
     async def send_subscription_message(self, websocket, event_type, symbol, on_subscription_success=None):
         """
         Sends a subscription message to the specified websocket for the specified event type and symbol.
+        Use subscribe to subscribe to many symbols in a few messages.
         :param websocket: The websocket to send the subscription message to.
         :param event_type: The event type to subscribe to.
         :param symbol: The symbol to subscribe to.
@@ -119,9 +250,120 @@ class CometdWebsocketClient:
                 }
             }
         }
-        subscription_str = json.dumps([subscription_message])
+        subscription_str = dumps([subscription_message])
         await websocket.send(subscription_str)
 
+    async def subscribe(self, subscriptions, websocket=None, timeout=DEFAULT_ACK_TIMEOUT):
+        """
+        Subscribes to many symbols at once. The symbols are sent in as few /service/sub messages as fit the
+        server's message size limit (see chunk_subscriptions), instead of one message per symbol.
+
+        Returns once the messages are sent, with a task that completes when the server has acknowledged all of
+        them. The acknowledgements are read by the listen loop, so do not await the task in on_handshake_success
+        or anything else the loop is waiting on:
+
+            acknowledged = await client.subscribe({"Quote": symbols, "Greeks": symbols})
+            ...
+            await acknowledged  # in another task
+
+        :param subscriptions: A dict of event type (e.g. "Quote", "Trade", "Greeks") to a list of symbols.
+        :param websocket: Optional. The websocket to send on. Defaults to the connected one.
+        :param timeout: Optional. Seconds to wait for the acknowledgements. None waits forever.
+        :return: An asyncio.Task that raises SubscriptionError if a message was rejected, was not acknowledged
+            within timeout, or the connection closed first.
+        """
+        return await self._send_subscriptions("add", subscriptions, websocket, timeout)
+
+    async def unsubscribe(self, subscriptions, websocket=None, timeout=DEFAULT_ACK_TIMEOUT):
+        """
+        Removes many subscriptions at once; the counterpart of subscribe, with the same arguments and result.
+        """
+        return await self._send_subscriptions("remove", subscriptions, websocket, timeout)
+
+    async def add_subscriptions(self, subscriptions, timeout=DEFAULT_ACK_TIMEOUT):
+        """
+        Adds a consumer's interest in subscriptions to the registry (see SubscriptionRegistry) and subscribes to
+        the pairs nobody was subscribed to yet. The registry is replayed in bulk after every handshake, so
+        subscriptions added while disconnected are sent on the next connect, and none are lost on a reconnect.
+
+        :param subscriptions: A dict of event type to a list of symbols.
+        :param timeout: Optional. Seconds to wait for the acknowledgements, see subscribe.
+        :return: The acknowledgement task of subscribe, or None if nothing had to be sent.
+        """
+        added = self.subscriptions.add(subscriptions)
+        if added and self.client_id is not None:
+            return await self.subscribe(added, timeout=timeout)
+        return None
+
+    async def remove_subscriptions(self, subscriptions, timeout=DEFAULT_ACK_TIMEOUT):
+        """
+        Removes a consumer's interest in subscriptions, and unsubscribes from the pairs no other consumer needs;
+        the counterpart of add_subscriptions.
+        """
+        removed = self.subscriptions.remove(subscriptions)
+        if removed and self.client_id is not None:
+            return await self.unsubscribe(removed, timeout=timeout)
+        return None
+
+    @property
+    def pending_acks(self) -> int:
+        """The number of /service/sub messages sent and not acknowledged yet."""
+        return len(self._pending_acks)
+
+    async def _send_subscriptions(self, action, subscriptions, websocket, timeout):
+        websocket = websocket or self.websocket
+        loop = asyncio.get_running_loop()
+        acks = []
+        for chunk in chunk_subscriptions(subscriptions):
+            message_id = self.next_id()
+            ack = self._pending_acks[message_id] = loop.create_future()
+            acks.append(ack)
+            message = {
+                "id": message_id,
+                "channel": "/service/sub",
+                "clientId": self.client_id,
+                "data": {"reset": False, action: chunk},
+            }
+            try:
+                await websocket.send(dumps([message]))
+            except Exception:
+                self._pending_acks.pop(message_id, None)
+                ack.cancel()
+                raise
+        return asyncio.create_task(self._wait_for_acks(acks, timeout))
+
+    async def _wait_for_acks(self, acks, timeout):
+        if not acks:
+            return
+        _, missing = await asyncio.wait(acks, timeout=timeout)
+        if missing:
+            for message_id, ack in list(self._pending_acks.items()):
+                if ack in missing:
+                    del self._pending_acks[message_id]
+                    ack.cancel()
+            raise SubscriptionError(f"{len(missing)} subscription messages were not acknowledged within "
+                                    f"{timeout} seconds")
+        errors = [ack.exception() for ack in acks if ack.exception() is not None]
+        if errors:
+            raise errors[0]
+
+    def _acknowledge(self, message):
+        ack = self._pending_acks.pop(message.get("id"), None)
+        if message.get("successful", False):
+            logger.debug("Subscription successful")
+            if ack is not None and not ack.done():
+                ack.set_result(True)
+        else:
+            logger.warning(f"Subscription failed: {message.get('error')}")
+            if ack is not None and not ack.done():
+                ack.set_exception(SubscriptionError(f"Subscription failed: {message.get('error')}"))
+
+    def _fail_pending_acks(self, reason):
+        pending, self._pending_acks = self._pending_acks, {}
+        for ack in pending.values():
+            if not ack.done():
+                ack.set_exception(SubscriptionError(reason))
+
     async def listen(self, websocket):
         """
         Continuously listens for messages from the given WebSocket and yields
@@ -154,26 +396,25 @@ class CometdWebsocketClient:
         Returns:
             None.
         """
-        data = json.loads(message)
+        data = loads(message)
         # logger.debug(f"Received message: {data}")
 
         if data and isinstance(data, list) and "channel" in data[0]:
-            channel = data[0]["channel"]
-
-            if channel == "/meta/handshake":
-                await self.process_handshake(data[0])
-
-            elif channel == "/service/sub":
-                if data[0].get("successful", False):
-                    logger.debug("Subscription successful")
-                else:
-                    logger.warning("Subscription failed")
-            
-            elif channel == "/service/data":
-                if data[0].get("data"):
-                    yield data[0]['data']
-                else:
-                    logger.warning("Data message has no data field")
+            # The server may batch several messages, e.g. the acknowledgements of a bulk subscription, in a frame.
+            for item in data:
+                channel = item.get("channel")
+
+                if channel == "/meta/handshake":
+                    await self.process_handshake(item)
+
+                elif channel == "/service/sub":
+                    self._acknowledge(item)
+
+                elif channel == "/service/data":
+                    if item.get("data"):
+                        yield item['data']
+                    else:
+                        logger.warning("Data message has no data field")
 
         else:
             logger.warning(f"Unexpected message format: {message}")
@@ -184,8 +425,9 @@ class CometdWebsocketClient:
         Process the handshake data received from the server.
 
         If the handshake is successful and contains a client ID, update the client ID
-        of this WebSocket client and log a debug message. If an on_handshake_success
-        callback was provided, call it with this WebSocket client as argument.
+        of this WebSocket client and log a debug message. The subscriptions of the registry
+        are then sent again in bulk, and if an on_handshake_success callback was provided,
+        it is called with this WebSocket client as argument.
 
         :param handshake_data: A dictionary containing the handshake data.
         :type handshake_data: dict
@@ -193,10 +435,30 @@ class CometdWebsocketClient:
         if "successful" in handshake_data and handshake_data["successful"] and "clientId" in handshake_data:
             self.client_id = handshake_data["clientId"]
             logger.debug(f"Handshake successful, client ID: {self.client_id}")
+            self._metrics.connects += 1
+            if self._attempt_started is not None:
+                self._metrics.last_connect_latency = time.monotonic() - self._attempt_started
+            if self.subscriptions:
+                self.replayed = await self.subscribe(self.subscriptions.snapshot())
+            if self._disconnected_at is not None:
+                gap = Reconnected(self._disconnected_at, time.time(), self._attempts)
+                self._disconnected_at = None
+                self._metrics.reconnects += 1
+                self._metrics.last_downtime = gap.downtime
+                self._metrics.total_downtime += gap.downtime
+                self._metrics.max_downtime = max(self._metrics.max_downtime, gap.downtime)
+                await self._put_event(gap)
 
                     # Call the on_handshake_success callback if provided
             if self.on_handshake_success:
                 await self.on_handshake_success(self)
+        elif self.token_provider is not None:
+            # The token may have been revoked; make the next connect fetch a new one.
+            logger.warning(f"Handshake failed: {handshake_data.get('error')}")
+            self.token_provider.invalidate(self._streamer_token)
+        if not handshake_data.get("successful") and self._supervised:
+            # Without a session the connection is useless; make run_forever connect again.
+            raise TransportError(f"Streamer handshake failed: {handshake_data.get('error')}")
 
 
     async def send_connect_message(self, websocket):
@@ -212,7 +474,7 @@ class CometdWebsocketClient:
             "clientId": self.client_id,
             "connectionType": "websocket"
         }
-        connect_str = json.dumps([connect_message])
+        connect_str = dumps([connect_message])
         await websocket.send(connect_str)
         
     async def send_heartbeat(self, websocket):
@@ -224,4 +486,4 @@ class CometdWebsocketClient:
                 "clientId": self.client_id,
                 "connectionType": "websocket"
             }
-            await websocket.send(json.dumps([heartbeat_message]))
\ No newline at end of file
+            await websocket.send(dumps([heartbeat_message]))
\ No newline at end of file
@@ -0,0 +1,80 @@
+"""
+Connection events and metrics of a supervised quote-streamer connection, see CometdWebsocketClient.run_forever.
+"""
+from ..retry import RetryPolicy
+
+# Full-jitter exponential backoff between reconnect attempts: up to 0.5 s, 1 s, 2 s, ... and at most 30 s.
+DEFAULT_RECONNECT_BACKOFF = RetryPolicy(backoff=0.5, max_backoff=30.0)
+
+
+class Disconnected:
+    """
+    Put on the data queue when the connection drops. Data received before it may be stale until the matching
+    Reconnected event.
+
+    Attributes:
+        at (float): The time.time() the connection dropped.
+        error (Exception): Why it dropped, or None if the server closed it.
+    """
+
+    def __init__(self, at: float, error: Exception = None):
+        self.at = at
+        self.error = error
+
+    def __repr__(self):
+        return f"Disconnected(at={self.at!r}, error={self.error!r})"
+
+
+class Reconnected:
+    """
+    Put on the data queue once the connection is back and the subscriptions were sent again. No data was
+    received between started_at and ended_at: events of that gap are lost, so consumers should refresh any
+    state built from them.
+
+    Attributes:
+        started_at (float): The time.time() the connection dropped.
+        ended_at (float): The time.time() the new handshake succeeded.
+        attempts (int): The number of connection attempts it took.
+    """
+
+    def __init__(self, started_at: float, ended_at: float, attempts: int):
+        self.started_at = started_at
+        self.ended_at = ended_at
+        self.attempts = attempts
+
+    @property
+    def downtime(self) -> float:
+        """Seconds without a connection."""
+        return self.ended_at - self.started_at
+
+    def __repr__(self):
+        return f"Reconnected(downtime={self.downtime:.3f}, attempts={self.attempts})"
+
+
+class ReconnectMetrics:
+    """
+    Connection counters of a supervised streamer.
+    """
+
+    def __init__(self):
+        self.connects = 0
+        self.disconnects = 0
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.total_downtime = 0.0
+        self.max_downtime = 0.0
+        self.last_downtime = 0.0
+        self.last_connect_latency = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "connects": self.connects,
+            "disconnects": self.disconnects,
+            "reconnects": self.reconnects,
+            "failed_attempts": self.failed_attempts,
+            "total_downtime": self.total_downtime,
+            "mean_downtime": self.total_downtime / self.reconnects if self.reconnects else 0.0,
+            "max_downtime": self.max_downtime,
+            "last_downtime": self.last_downtime,
+            "last_connect_latency": self.last_connect_latency,
+        }
@@ -1,4 +1,3 @@
-import json
 import logging
 import time
 from websocket import WebSocketApp
@@ -6,6 +5,8 @@ import threading
 
 import functools
 
+from ..codec import dumps, loads
+
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,7 @@ class TastytradeStreamer:
 
     def on_message(self, ws, message):
         """Default callback function for handling received messages."""
-        data = json.loads(message)
+        data = loads(message)
         logger.info("Received message: %s", data)
 
     def on_error(self, ws, error):
@@ -59,7 +60,7 @@ class TastytradeStreamer:
 
     def send_heartbeat(self):
         """Sends a heartbeat message to the server."""
-        heartbeat_message = json.dumps({"auth-token": self.session_token,"action": "heartbeat", "value": ""})
+        heartbeat_message = dumps({"auth-token": self.session_token,"action": "heartbeat", "value": ""})
         self.ws.send(heartbeat_message)
         logger.info("Sent heartbeat message")
 
@@ -69,7 +70,7 @@ class TastytradeStreamer:
         Args:
             account_numbers (list): A list of account numbers to subscribe to.
         """
-        connect_message = json.dumps({"action": "connect", "value": account_numbers})
+        connect_message = dumps({"action": "connect", "value": account_numbers})
         self.ws.send(connect_message)
         logger.info("Sent connect message for accounts: %s", account_numbers)
         
@@ -79,7 +80,7 @@ class TastytradeStreamer:
         Args:
             account_numbers (list): A list of account numbers to subscribe to.
         """
-        account_subscribe_message = json.dumps({"auth-token": self.session_token, "action": "account-subscribe", "value": account_numbers})
+        account_subscribe_message = dumps({"auth-token": self.session_token, "action": "account-subscribe", "value": account_numbers})
         self.ws.send(account_subscribe_message)
         logger.warning("Sent account-subscribe message for accounts: %s. This method may be deprecated in the future, consider using 'connect_account' instead.", account_numbers)
 
@@ -105,13 +106,13 @@ class TastytradeStreamer:
 
     def public_watchlists_subscribe(self):
         """Sends a message to subscribe to public watchlist updates."""
-        subscribe_message = json.dumps({"auth-token": self.session_token, "action": "public-watchlists-subscribe", "value": ""})
+        subscribe_message = dumps({"auth-token": self.session_token, "action": "public-watchlists-subscribe", "value": ""})
         self.ws.send(subscribe_message)
         logger.info("Sent public-watchlists-subscribe message")
 
     def quote_alerts_subscribe(self):
         """Sends a message to subscribe to quote alert messages."""
-        subscribe_message = json.dumps({"auth-token": self.session_token, "action": "quote-alerts-subscribe", "value": ""})
+        subscribe_message = dumps({"auth-token": self.session_token, "action": "quote-alerts-subscribe", "value": ""})
         self.ws.send(subscribe_message)
         logger.info("Sent quote-alerts-subscribe message")
 
@@ -121,7 +122,7 @@ class TastytradeStreamer:
         Args:
             user_external_id (str): The user's external-id returned in the POST /sessions response.
         """
-        subscribe_message = json.dumps({"auth-token": self.session_token, "action": "user-message-subscribe", "value": user_external_id})
+        subscribe_message = dumps({"auth-token": self.session_token, "action": "user-message-subscribe", "value": user_external_id})
         self.ws.send(subscribe_message)
         logger.info("Sent user-message-subscribe message for user_external_id: %s", user_external_id)
     
@@ -0,0 +1,73 @@
+"""
+Reference-counted record of the quote-streamer subscriptions that the consumers of one connection need.
+"""
+
+
+class SubscriptionRegistry:
+    """
+    Counts the interests in every (event type, symbol) pair, so that several consumers can subscribe to
+    overlapping sets: a pair is subscribed when its first consumer adds it and unsubscribed when its last
+    consumer removes it. add and remove return only that net change, which is what has to be sent.
+
+    Subscriptions are given and returned as dicts of event type (e.g. "Quote") to a list of symbols, the
+    format of CometdWebsocketClient.subscribe.
+    """
+
+    def __init__(self):
+        self._counts = {}
+
+    def add(self, subscriptions) -> dict:
+        """
+        Adds one interest in every pair of subscriptions.
+
+        :param subscriptions: A dict of event type to a list of symbols.
+        :return: The pairs that nobody was interested in before, as a dict of event type to symbols.
+        """
+        added = {}
+        for event_type, symbols in subscriptions.items():
+            for symbol in symbols:
+                key = (event_type, symbol)
+                count = self._counts.get(key, 0)
+                if not count:
+                    added.setdefault(event_type, []).append(symbol)
+                self._counts[key] = count + 1
+        return added
+
+    def remove(self, subscriptions) -> dict:
+        """
+        Removes one interest in every pair of subscriptions. Pairs without interests are ignored.
+
+        :param subscriptions: A dict of event type to a list of symbols.
+        :return: The pairs that nobody is interested in any more, as a dict of event type to symbols.
+        """
+        removed = {}
+        for event_type, symbols in subscriptions.items():
+            for symbol in symbols:
+                key = (event_type, symbol)
+                count = self._counts.get(key, 0)
+                if count == 1:
+                    del self._counts[key]
+                    removed.setdefault(event_type, []).append(symbol)
+                elif count:
+                    self._counts[key] = count - 1
+        return removed
+
+    def count(self, event_type: str, symbol: str) -> int:
+        """Returns the number of interests in a pair."""
+        return self._counts.get((event_type, symbol), 0)
+
+    def snapshot(self) -> dict:
+        """Returns every subscribed pair, as a dict of event type to symbols, e.g. to subscribe again."""
+        subscriptions = {}
+        for event_type, symbol in self._counts:
+            subscriptions.setdefault(event_type, []).append(symbol)
+        return subscriptions
+
+    def clear(self):
+        self._counts.clear()
+
+    def __contains__(self, pair) -> bool:
+        return pair in self._counts
+
+    def __len__(self):
+        return len(self._counts)
@@ -0,0 +1,172 @@
+import asyncio
+import logging
+import threading
+import time
+
+from ..exceptions import TastytradeError
+from ..models import to_datetime
+
+logger = logging.getLogger(__name__)
+
+# Used when the response has no expires-at; quote-streamer tokens are valid for 24 hours.
+DEFAULT_TOKEN_LIFETIME = 24 * 60 * 60
+DEFAULT_REFRESH_MARGIN = 60 * 60
+# Delay before the background thread tries again after a failed refresh.
+REFRESH_RETRY_INTERVAL = 30.0
+
+
+class StreamerToken:
+    """
+    A quote-streamer token with the URLs it is valid for and its expiry.
+
+    Args:
+        token (str): The token sent in the streamer handshake.
+        expires_at (float): The time.time() at which the token expires.
+        websocket_url (str): Optional. The CometD websocket URL reported with the token.
+        dxlink_url (str): Optional. The DXLink websocket URL reported with the token.
+        level (str): Optional. The market data level the token grants.
+    """
+
+    def __init__(self, token: str, expires_at: float, websocket_url: str = None, dxlink_url: str = None,
+                 level: str = None):
+        self.token = token
+        self.expires_at = expires_at
+        self.websocket_url = websocket_url
+        self.dxlink_url = dxlink_url
+        self.level = level
+
+    @classmethod
+    def from_response(cls, data: dict, fetched_at: float = None) -> "StreamerToken":
+        """
+        Builds a token from the /quote-streamer-tokens response. The expiry is read from expires-at, or
+        counted from fetched_at when the server did not report it.
+        """
+        item = data["data"]
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        expires_at = item.get("expires-at")
+        if expires_at:
+            expires_at = to_datetime(expires_at).timestamp()
+        else:
+            expires_at = fetched_at + DEFAULT_TOKEN_LIFETIME
+        return cls(item["token"], expires_at, websocket_url=item.get("websocket-url"),
+                   dxlink_url=item.get("dxlink-url"), level=item.get("level"))
+
+    @property
+    def cometd_url(self) -> str:
+        """
+        The CometD endpoint of websocket_url, e.g. wss://tasty-live-web.dxfeed.com/live/cometd for
+        https://tasty-live-web.dxfeed.com/live, or None when no URL was reported with the token.
+        """
+        url = self.websocket_url
+        if not url:
+            return None
+        if url.startswith("https://"):
+            url = "wss://" + url[len("https://"):]
+        elif url.startswith("http://"):
+            url = "ws://" + url[len("http://"):]
+        url = url.rstrip("/")
+        return url if url.endswith("/cometd") else url + "/cometd"
+
+    def expires_in(self) -> float:
+        """Seconds left before the token expires."""
+        return self.expires_at - time.time()
+
+    def __repr__(self):
+        return f"StreamerToken(expires_at={self.expires_at!r}, websocket_url={self.websocket_url!r})"
+
+
+class StreamerTokenCache:
+    """
+    Caches the quote-streamer token so that reconnecting a streamer does not cost a REST round trip.
+
+    The token is fetched with TastytradeAuth.get_dxfeed_token on first use and again once it is within
+    refresh_margin of its expiry, either by the next caller or ahead of time by a background thread. Pass the
+    cache as the token_provider of a CometdWebsocketClient to have every (re)connect use it.
+
+    Args:
+        auth (TastytradeAuth): The logged-in authentication object the token is fetched with.
+        refresh_margin (float): Optional. How long before the expiry the token is replaced, in seconds.
+        background (bool): Optional. Whether to start the background refresh thread right away, see start().
+    """
+
+    def __init__(self, auth, refresh_margin: float = DEFAULT_REFRESH_MARGIN, background: bool = False):
+        self.auth = auth
+        self.refresh_margin = refresh_margin
+        self._token = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread = None
+        if background:
+            self.start()
+
+    def _due(self) -> bool:
+        token = self._token
+        return token is None or token.expires_in() <= self.refresh_margin
+
+    def get(self) -> StreamerToken:
+        """
+        Returns the cached token, fetching a new one first when it is missing or about to expire.
+
+        Raises:
+            ValidationError: If a new token was needed and could not be fetched.
+        """
+        if not self._due():
+            return self._token
+        with self._lock:
+            # Another caller may have fetched it while we waited for the lock.
+            if self._due():
+                self._token = StreamerToken.from_response(self.auth.get_dxfeed_token())
+                logger.debug("Quote-streamer token refreshed, valid until %s", self._token.expires_at)
+            return self._token
+
+    async def get_async(self) -> StreamerToken:
+        """Coroutine version of get(); a fetch runs on a worker thread."""
+        if not self._due():
+            return self._token
+        return await asyncio.to_thread(self.get)
+
+    def invalidate(self, token: StreamerToken = None):
+        """
+        Drops the cached token, e.g. after the streamer rejected it, so the next get() fetches a new one.
+
+        Args:
+            token (StreamerToken): Optional. Only drop the cache if it still holds this token.
+        """
+        with self._lock:
+            if token is None or self._token is token:
+                self._token = None
+
+    def start(self):
+        """
+        Starts a daemon thread that replaces the token refresh_margin seconds before it expires. Failed
+        refreshes are retried every REFRESH_RETRY_INTERVAL seconds.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="tastytrade-streamer-token", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        delay = 0.0
+        while not self._stopped.wait(delay):
+            try:
+                token = self.get()
+            except TastytradeError as exc:
+                logger.warning("Refreshing the quote-streamer token failed: %s", exc)
+                delay = REFRESH_RETRY_INTERVAL
+                continue
+            delay = max(REFRESH_RETRY_INTERVAL, token.expires_in() - self.refresh_margin)
+
+    def stop(self):
+        """Stops the background refresh thread."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
@@ -0,0 +1,204 @@
+"""
+Incremental parsing of large list responses.
+
+The items of a `{"data": {"items": [...]}}` document are decoded one at a time while the body is being
+received, so peak memory is bounded by the size of the largest item rather than by the size of the response.
+"""
+import codecs
+import json
+import re
+
+from .codec import loads
+
+ITEMS_PATH = ("data", "items")
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_TOKENS = re.compile(r'[{}\[\],:"]')
+_NON_SPACE = re.compile(r"\S")
+# A decoded value ending with one of these is complete; a number is only complete once a delimiter follows it,
+# since "-25" may be the start of "-2500.0".
+_SELF_DELIMITED = frozenset('}]"el')
+_DELIMITERS = frozenset(" \t\r\n,]")
+
+# Items are decoded by the C scanner of the json module, which also reports where each item ends.
+_decoder = json.JSONDecoder()
+
+
+def _string_end(buffer: str, start: int) -> int:
+    """Returns the index of the quote closing the string whose content starts at start, or -1 if not received yet."""
+    while True:
+        end = buffer.find('"', start)
+        if end < 0:
+            return -1
+        backslashes = 0
+        index = end - 1
+        while buffer[index] == "\\":
+            backslashes += 1
+            index -= 1
+        if backslashes % 2 == 0:
+            return end
+        start = end + 1
+
+
+class ItemParser:
+    """
+    Push parser that extracts the elements of the array found at `path` in a JSON document.
+
+    Only the text of the item being received is kept; everything outside the array is skipped without
+    being decoded.
+
+    Args:
+        path (tuple): Optional. The object keys leading to the array, ("data", "items") by default.
+    """
+
+    def __init__(self, path=ITEMS_PATH):
+        self.path = list(path)
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        # Enclosing containers outside the target array, as [opening character, current key] pairs.
+        self._stack = []
+        self._expect_key = False
+        self._in_items = False
+        # Length the pending item must reach before decoding it is attempted again.
+        self._retry_length = 0
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        """
+        Adds the next chunk of the document.
+
+        Returns:
+            list: The items completed by this chunk, in document order.
+        """
+        self._buffer += self._text.decode(chunk, final)
+        items = []
+        while True:
+            if self._in_items:
+                if not self._read_items(items, final):
+                    break
+            elif not self._skip_to_items():
+                break
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return items
+
+    def _read_items(self, items: list, final: bool) -> bool:
+        """Decodes the available items. Returns True once the end of the array is reached."""
+        buffer = self._buffer
+        pos = self._pos
+        try:
+            while True:
+                match = _NON_SPACE.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    return False
+                pos = match.start()
+                char = buffer[pos]
+                if char == ",":
+                    pos += 1
+                    continue
+                if char == "]":
+                    pos += 1
+                    self._in_items = False
+                    return True
+                if len(buffer) - pos < self._retry_length and not final:
+                    return False
+                try:
+                    item, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    # Most likely cut short by the end of the chunk: wait until it has doubled in size.
+                    self._retry_length = 2 * (len(buffer) - pos)
+                    return False
+                if not final and buffer[end - 1] not in _SELF_DELIMITED and (
+                        end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    return False
+                items.append(item)
+                self._retry_length = 0
+                pos = end
+        finally:
+            self._pos = pos
+
+    def _skip_to_items(self) -> bool:
+        """Skips the document up to the start of the target array. Returns True once it is reached."""
+        buffer = self._buffer
+        pos = self._pos
+        try:
+            while True:
+                match = _TOKENS.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    return False
+                index = match.start()
+                token = buffer[index]
+
+                if token == '"':
+                    end = _string_end(buffer, index + 1)
+                    if end < 0:
+                        pos = index
+                        return False
+                    if self._expect_key and self._stack[-1][0] == "{":
+                        self._stack[-1][1] = loads(buffer[index:end + 1])
+                    pos = end + 1
+                    continue
+                pos = index + 1
+
+                if token == "{":
+                    self._stack.append([token, None])
+                    self._expect_key = True
+                elif token == "[":
+                    self._expect_key = False
+                    if self._at_path():
+                        self._in_items = True
+                        return True
+                    self._stack.append([token, None])
+                elif token == "}" or token == "]":
+                    if self._stack:
+                        self._stack.pop()
+                    self._expect_key = False
+                elif token == ":":
+                    self._expect_key = False
+                else:
+                    self._expect_key = bool(self._stack) and self._stack[-1][0] == "{"
+        finally:
+            self._pos = pos
+
+    def _at_path(self) -> bool:
+        if len(self._stack) != len(self.path):
+            return False
+        return all(kind == "{" and key == expected for (kind, key), expected in zip(self._stack, self.path))
+
+    def close(self) -> list:
+        """
+        Ends the document and returns the items still pending.
+
+        Raises:
+            ValueError: If the document was truncated inside the array.
+        """
+        items = self.feed(b"", final=True)
+        if self._in_items:
+            raise ValueError("The JSON document ended before the end of the item array")
+        return items
+
+
+def iter_json_items(chunks, path=ITEMS_PATH):
+    """
+    Yields the elements of the array at path in a JSON document received as an iterable of byte chunks.
+    """
+    parser = ItemParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def iter_response_items(response, path=ITEMS_PATH, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Yields the elements of the array at path in the body of a requests.Response sent with stream=True,
+    then releases the connection.
+    """
+    try:
+        yield from iter_json_items(response.iter_content(chunk_size), path)
+    finally:
+        response.close()
@@ -1,10 +1,15 @@
-import requests
+from ..exceptions import raise_api_error
+from ..transport import get_default_transport
+from ..scheduler import Priority
+from ..pagination import iter_items
+from ..models import Order, convert, convert_one
 import json
 
 class TastytradeOrder:
-    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/accounts'):
+    def __init__(self, session_token: str = None, api_url: str = 'https://api.tastytrade.com/accounts', transport=None):
         self.api_url = api_url
         self.session_token = session_token
+        self.transport = transport or get_default_transport()
         self.headers = {
             "Authorization": f"{self.session_token}"
         }
@@ -24,16 +29,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the POST request or if the status code is not 201 Created.
+            ApiError: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/reconfirm"
-        response = requests.post(url, headers=self.headers)
+        response = self.transport.post(url, headers=self.headers, priority=Priority.ORDERS)
         
         if response.status_code == 201:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error reconfirming order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error reconfirming order")
     
     def dry_run_order(self, account_number, order_id, order_data):
         """
@@ -51,18 +56,18 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the POST request or if the status code is not 201 Created.
+            ApiError: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}/dry-run"
-        response = requests.post(url, headers=self.headers, json=order_data)
+        response = self.transport.post(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
         
         if response.status_code == 201:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error running dry run order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error running dry run order")
 
-    def get_order(self, account_number, order_id):
+    def get_order(self, account_number, order_id, output="dicts"):
         """
         Returns a single order based on the id
         
@@ -72,21 +77,25 @@ class TastytradeOrder:
         Args:
             account_number (int): The account number for the order to retrieve.
             order_id (int): The ID of the order to retrieve.
+            output (str): Optional. "models" to return the order as an Order model instead of the whole response.
+                Defaults to "dicts".
 
         Returns:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         
         if response.status_code == 200:
             response_data = response.json()
-            return response_data
+            if output == "dicts":
+                return response_data
+            return convert_one(response_data["data"], Order, output)
         else:
-            raise Exception(f"Error getting order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting order")
         
     def cancel_order(self, account_number, order_id):
         """
@@ -103,16 +112,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the DELETE request or if the status code is not 200 OK.
+            ApiError: If there was an error in the DELETE request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.delete(url, headers=self.headers)
+        response = self.transport.delete(url, headers=self.headers, priority=Priority.ORDERS)
         
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error cancelling order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error cancelling order")
         
     def replace_order(self, account_number, order_id, order_data):
         """
@@ -130,16 +139,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the PUT request or if the status code is not 200 OK.
+            ApiError: If there was an error in the PUT request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.put(url, headers=self.headers, json=order_data)
+        response = self.transport.put(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
         
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error replacing order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error replacing order")
 
     def edit_order(self, account_number, order_id, order_data):
         """
@@ -157,16 +166,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the PATCH request or if the status code is not 200 OK.
+            ApiError: If there was an error in the PATCH request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/{order_id}"
-        response = requests.patch(url, headers=self.headers, json=order_data)
+        response = self.transport.patch(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
         
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error editing order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error editing order")
         
     def get_live_orders(self, account_number):
         """
@@ -183,16 +192,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/live"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting live orders: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting live orders")
         
     def get_orders(self, account_number, per_page=10, page_offset=0, start_date=None, end_date=None, underlying_symbol=None, 
                    status=None, futures_symbol=None, underlying_instrument_type=None, sort='Desc', start_at=None, end_at=None):
@@ -221,7 +230,7 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders"
         params = {
@@ -237,13 +246,41 @@ class TastytradeOrder:
             "start-at": start_at,
             "end-at": end_at
         }
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params, priority=Priority.BULK)
         
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting orders: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error getting orders")
+
+    def iter_orders(self, account_number, per_page=100, prefetch=2, timeout=None, output="dicts", **filters):
+        """
+        Yields every order of the account across all pages of /accounts/{account_number}/orders.
+
+        The next `prefetch` pages are fetched concurrently while the current page is being consumed.
+
+        Args:
+            account_number (int): The account number for which to retrieve the orders.
+            per_page (int): The number of orders to request per page. Defaults to 100.
+            prefetch (int): The number of pages fetched ahead of the consumer. Defaults to 2.
+            timeout (float): Optional. Overall budget in seconds for fetching every page. Defaults to None.
+            output (str): Optional. "models" to yield Order models instead of dicts, or "columns" to return the
+                fields of every order as typed arrays (see tastytrade_api.columns). Defaults to "dicts".
+            **filters: Any other filter accepted by get_orders, e.g. start_date, status or sort.
+
+        Returns:
+            Iterator[dict]: The order objects, as returned by the API.
+
+        Raises:
+            ApiError: If there was an error in any of the GET requests or if a status code is not 200 OK.
+            DeadlineExceeded: If the pages could not all be fetched within timeout.
+        """
+        return convert(iter_items(
+            lambda offset: self.get_orders(account_number, per_page=per_page, page_offset=offset, **filters),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Order, output)
         
     def create_order(self, account_number, order):
         """
@@ -260,20 +297,20 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the POST request or if the status code is not 201 CREATED.
+            ApiError: If there was an error in the POST request or if the status code is not 201 CREATED.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders"
         headers = {
             "Authorization": f"{self.session_token}",
             "Content-Type": "application/json"
         }
-        response = requests.post(url, headers=headers, json=order)
+        response = self.transport.post(url, headers=headers, json=order, priority=Priority.ORDERS)
         
         if response.status_code == 201:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error creating order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error creating order")
         
     def dry_run_new_order(self, account_number, order_data):
         """
@@ -290,16 +327,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the POST request or if the status code is not 201 Created.
+            ApiError: If there was an error in the POST request or if the status code is not 201 Created.
         """
         url = f"{self.api_url}/accounts/{account_number}/orders/dry-run"
-        response = requests.post(url, headers=self.headers, json=order_data)
+        response = self.transport.post(url, headers=self.headers, json=order_data, priority=Priority.ORDERS)
         
         if response.status_code == 201:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error running dry run new order: {response.status_code} - {response.content}")
+            raise_api_error(response, "Error running dry run new order")
 
     def get_customer_live_orders(self, customer_id):
         """
@@ -315,16 +352,16 @@ class TastytradeOrder:
             dict: Dictionary containing the response data, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
         url = f"{self.api_url}/customers/{customer_id}/orders/live"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
 
         if response.status_code == 200:
             response_data = response.json()
             return response_data
         else:
-            raise Exception(f"Error getting live orders for customer {customer_id}: {response.status_code} - {response.content}")
+            raise_api_error(response, f"Error getting live orders for customer {customer_id}")
         
     def get_customer_orders(self, customer_id, per_page=10, page_offset=0, start_date=None, end_date=None,
                              underlying_symbol=None, status=None, futures_symbol=None, underlying_instrument_type=None,
@@ -354,8 +391,45 @@ class TastytradeOrder:
             list: List of order objects, as returned by the API.
 
         Raises:
-            Exception: If there was an error in the GET request or if the status code is not 200 OK.
+            ApiError: If there was an error in the GET request or if the status code is not 200 OK.
         """
+        response_data = self._get_customer_orders_page(
+            customer_id, per_page, page_offset, start_date, end_date, underlying_symbol, status, futures_symbol,
+            underlying_instrument_type, sort, start_at, end_at
+        )
+        return response_data["data"]["items"]
+
+    def iter_customer_orders(self, customer_id, per_page=100, prefetch=2, timeout=None, output="dicts", **filters):
+        """
+        Yields every order of the customer across all pages of /customers/{customer_id}/orders.
+
+        The next `prefetch` pages are fetched concurrently while the current page is being consumed.
+
+        Args:
+            customer_id (int): The ID of the customer whose orders to retrieve.
+            per_page (int): The number of orders to request per page. Defaults to 100.
+            prefetch (int): The number of pages fetched ahead of the consumer. Defaults to 2.
+            timeout (float): Optional. Overall budget in seconds for fetching every page. Defaults to None.
+            output (str): Optional. "models" to yield Order models instead of dicts, or "columns" to return the
+                fields of every order as typed arrays (see tastytrade_api.columns). Defaults to "dicts".
+            **filters: Any other filter accepted by get_customer_orders, e.g. start_date, status or sort.
+
+        Returns:
+            Iterator[dict]: The order objects, as returned by the API.
+
+        Raises:
+            ApiError: If there was an error in any of the GET requests or if a status code is not 200 OK.
+            DeadlineExceeded: If the pages could not all be fetched within timeout.
+        """
+        return convert(iter_items(
+            lambda offset: self._get_customer_orders_page(customer_id, per_page=per_page, page_offset=offset, **filters),
+            prefetch=prefetch,
+            timeout=timeout,
+        ), Order, output)
+
+    def _get_customer_orders_page(self, customer_id, per_page=10, page_offset=0, start_date=None, end_date=None,
+                                  underlying_symbol=None, status=None, futures_symbol=None, underlying_instrument_type=None,
+                                  sort='Desc', start_at=None, end_at=None):
         url = f"{self.api_url}/customers/{customer_id}/orders"
         params = {
             "per-page": per_page,
@@ -370,10 +444,8 @@ class TastytradeOrder:
             "start-at": start_at,
             "end-at": end_at
         }
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params, priority=Priority.BULK)
         if response.status_code == 200:
-            response_data = response.json()
-            orders = response_data["data"]["items"]
-            return orders
+            return response.json()
         else:
-            raise Exception(f"Error getting customer orders: {response.status_code} - {response.content}")
\ No newline at end of file
+            raise_api_error(response, "Error getting customer orders")
\ No newline at end of file
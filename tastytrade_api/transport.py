@@ -0,0 +1,257 @@
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import cached_response
+from .codec import decode_response, encode_json_body
+from .coalescing import COALESCED_METHODS, request_key, share_json
+from .deadline import DeadlineExceeded, Timeout, check_deadline, clamp, deadline, remaining
+from .exceptions import TransportError
+from .retry import DEFAULT_RETRY
+from .scheduler import Priority
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "tastytrade-api-python",
+}
+
+# (connect, read) timeout in seconds, as understood by requests. A Timeout also sets an overall budget.
+DEFAULT_TIMEOUT = (5.0, 30.0)
+
+
+class Transport:
+    """
+    Owns a keep-alive HTTP connection pool shared by the REST clients.
+
+    A single Transport can be handed to TastytradeAuth and to every client class, so the TCP/TLS
+    connection opened during login is reused by all subsequent API calls instead of paying for a
+    new handshake on each request.
+
+    Args:
+        headers (dict): Optional. Default headers sent with every request, merged over DEFAULT_HEADERS.
+        timeout (float, tuple or Timeout): Optional. Default timeout used when a call does not pass its own. A
+            Timeout with a `total` bounds each call, retries included.
+        pool_connections (int): Optional. Number of per-host connection pools to keep.
+        pool_maxsize (int): Optional. Maximum number of keep-alive connections per host.
+        scheduler (RequestScheduler): Optional. Rate limiter every request waits on before being sent.
+        retry (RetryPolicy): Optional. Which failed requests are sent again. Defaults to DEFAULT_RETRY, which
+            retries idempotent requests on connection errors and 429/5xx responses; None disables retries. With
+            a scheduler, 429 responses are only resent by the scheduler.
+        coalescer (SingleFlight): Optional. When given, identical GET requests made concurrently share one
+            request and its decoded response.
+        cache (ResponseCache): Optional. When given, GET responses of the endpoints it has a TTL for are
+            cached and revalidated once stale.
+        session_manager (SessionManager): Optional. When given, API requests are sent with its current session
+            token, and a request rejected with 401 is sent once more after a new login.
+    """
+
+    def __init__(self, headers=None, timeout=DEFAULT_TIMEOUT, pool_connections=10, pool_maxsize=10, scheduler=None,
+                 retry=DEFAULT_RETRY, coalescer=None, cache=None, session_manager=None):
+        self.timeout = timeout
+        self.session_manager = session_manager
+        self.scheduler = scheduler
+        self.retry = retry
+        self.coalescer = coalescer
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, priority: str = Priority.DEFAULT, **kwargs) -> requests.Response:
+        """
+        Sends a request through the pooled session.
+
+        When a scheduler is configured, the request first waits for its turn in the `priority` lane, and a
+        429 Too Many Requests response is resent once the scheduler's Retry-After pause is over. Requests the
+        retry policy allows are sent again after a jittered backoff on connection errors and retryable statuses.
+
+        The connect and read timeouts of every attempt are shortened to fit the current deadline (see
+        tastytrade_api.deadline), and no retry is attempted once the deadline cannot be met.
+
+        With stream=True the body is left unread for the caller to consume, see tastytrade_api.streaming;
+        such requests bypass the coalescer and the cache.
+
+        With a coalescer, a GET identical to one already in flight waits for it and returns the same
+        response, whose json() is decoded once for all callers. With a cache, a fresh cached response is
+        returned without any request, and a stale one is revalidated with a conditional request. With a
+        session manager, the Authorization header is replaced by the current session token.
+
+        Args:
+            method (str): The HTTP method, e.g. "GET".
+            url (str): The absolute URL of the request.
+            priority (str): Optional. The scheduler lane of the request, see Priority.
+            **kwargs: Any keyword argument accepted by requests.Session.request. `timeout` may also be a Timeout.
+
+        Returns:
+            requests.Response: The response returned by the server. Status codes are not checked here.
+
+        Raises:
+            DeadlineExceeded: If the deadline or the total timeout ran out.
+            TransportError: If the request could not be sent or its response could not be read.
+        """
+        encode_json_body(kwargs)
+        if kwargs.get("stream"):
+            # A streamed body can only be read once, so it is neither cached nor shared.
+            return self._request(method, url, priority, kwargs)
+        if self.cache is not None and method.upper() == "GET":
+            ttl = self.cache.ttl_for(url)
+            if ttl:
+                return self._cached_get(url, priority, kwargs, ttl)
+        return self._fetch(method, url, priority, kwargs)
+
+    def _cached_get(self, url, priority, kwargs, ttl) -> requests.Response:
+        key = request_key("GET", url, kwargs.get("params"))
+        entry, fresh = self.cache.lookup(key)
+        if fresh:
+            return decode_response(cached_response(entry))
+        if entry is not None:
+            kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        response = self._fetch("GET", url, priority, kwargs)
+        entry = self.cache.update(key, entry, response, ttl)
+        return response if entry is None else decode_response(cached_response(entry))
+
+    def _fetch(self, method, url, priority, kwargs) -> requests.Response:
+        if self.coalescer is not None and method.upper() in COALESCED_METHODS:
+            key = request_key(method, url, kwargs.get("params"), kwargs.get("headers"))
+            return self.coalescer.do(key, lambda: share_json(self._request(method, url, priority, kwargs)))
+        return self._request(method, url, priority, kwargs)
+
+    def _request(self, method, url, priority, kwargs) -> requests.Response:
+        timeout = kwargs.pop("timeout", self.timeout)
+        total = timeout.total if isinstance(timeout, Timeout) else None
+        endpoint = f"{method} {url}"
+        with deadline(total):
+            attempt = 1
+            while True:
+                try:
+                    response = self._send(method, url, priority, timeout, kwargs)
+                except requests.RequestException as exc:
+                    left = remaining()
+                    if left is not None and left <= 0:
+                        raise DeadlineExceeded(f"Deadline exceeded sending {endpoint}: {exc}",
+                                               endpoint=endpoint) from exc
+                    if self.retry is not None and self.retry.can_retry(method, attempt):
+                        delay = self.retry.delay(attempt)
+                        check_deadline(endpoint, needed=delay)
+                        time.sleep(delay)
+                        attempt += 1
+                        continue
+                    raise TransportError(f"Error sending {endpoint}: {exc}", endpoint=endpoint) from exc
+
+                if retries_response(self.retry, self.scheduler, method, response, attempt):
+                    delay = self.retry.delay(attempt, response)
+                    left = remaining()
+                    if left is not None and left <= delay:
+                        # Waiting would outlive the deadline; let the caller see the last response.
+                        return response
+                    response.close()
+                    time.sleep(delay)
+                    attempt += 1
+                    continue
+                return response
+
+    def _send(self, method, url, priority, timeout, kwargs) -> requests.Response:
+        if self.scheduler is None:
+            return self._send_once(method, url, timeout, kwargs)
+
+        for attempt in range(self.scheduler.max_throttle_retries + 1):
+            self.scheduler.acquire(priority)
+            response = self._send_once(method, url, timeout, kwargs)
+            if response.status_code != 429:
+                break
+            if attempt < self.scheduler.max_throttle_retries:
+                # Release the pooled connection of a streamed response before sending again.
+                response.close()
+            self.scheduler.throttled(priority, response.headers.get("Retry-After"))
+        return response
+
+    def _send_once(self, method, url, timeout, kwargs) -> requests.Response:
+        manager = self.session_manager
+        if manager is None or not manager.authorizes(url):
+            return self._send_authorized(method, url, timeout, kwargs)
+
+        token = manager.token()
+        response = self._send_authorized(method, url, timeout, with_token(kwargs, token))
+        if response.status_code == 401:
+            response.close()
+            response = self._send_authorized(method, url, timeout, with_token(kwargs, manager.renew(token)))
+        return response
+
+    def _send_authorized(self, method, url, timeout, kwargs) -> requests.Response:
+        check_deadline(f"{method} {url}")
+        response = self.session.request(method, url, timeout=requests_timeout(timeout), **kwargs)
+        return decode_response(response)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> requests.Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self):
+        """Closes every pooled connection."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def requests_timeout(timeout):
+    """
+    Returns the timeout argument for requests: a number or (connect, read) tuple, shortened to fit the
+    current deadline.
+    """
+    left = remaining()
+    if left is None and not isinstance(timeout, Timeout):
+        return timeout
+    timeout = Timeout.coerce(timeout)
+    return clamp(timeout.connect, left), clamp(timeout.read, left)
+
+
+def retries_response(retry, scheduler, method: str, response, attempt: int) -> bool:
+    """
+    Returns whether the retry policy sends a request again after its response. A 429 is left to the scheduler
+    when there is one, which already resent it after the Retry-After pause, so only one layer retries it.
+    """
+    if retry is None or (scheduler is not None and response.status_code == 429):
+        return False
+    return retry.should_retry_response(method, response, attempt)
+
+
+def with_token(kwargs: dict, token: str) -> dict:
+    """Returns a copy of the request keyword arguments whose Authorization header is token."""
+    return {**kwargs, "headers": {**(kwargs.get("headers") or {}), "Authorization": token}}
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def get_default_transport() -> Transport:
+    """
+    Returns the process-wide Transport used by clients that were not given one explicitly.
+    """
+    global _default_transport
+    with _default_transport_lock:
+        if _default_transport is None:
+            _default_transport = Transport()
+        return _default_transport
@@ -0,0 +1,22 @@
+"""Fakes and canned responses shared by several test modules."""
+from tastytrade_api.codec import loads
+
+
+def session_response(n, expiration=None):
+    """The requests_mock response of the n-th login to /sessions, reporting expiration as its session-expiration."""
+    data = {"session-token": f"st-{n}", "remember-token": f"rm-{n}", "user": {"username": "user"}}
+    if expiration is not None:
+        data["session-expiration"] = expiration
+    return {"json": {"data": data}, "status_code": 201}
+
+
+class FakeWebsocket:
+    """Stands in for a streamer connection; records every frame sent and its decoded messages."""
+
+    def __init__(self):
+        self.sent = []
+        self.frames = []
+
+    async def send(self, message):
+        self.frames.append(message)
+        self.sent.append(loads(message))
@@ -0,0 +1,259 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import threading
+import unittest
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+from tastytrade_api import AccountError, NotFoundError
+from tastytrade_api.pagination import aiter_pages
+
+
+class MockAuth:
+    def __init__(self, url):
+        self.session_token = "session_token"
+        self.url = url
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncClients(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        from tastytrade_api.aio import AsyncTransport
+
+        self.requests = []
+
+        async def requirements(request):
+            self.requests.append(request)
+            await asyncio.sleep(0.01)
+            account_number = request.match_info["account_number"]
+            if account_number == "bad":
+                return web.json_response({"error": "nope"}, status=400)
+            return web.json_response({"data": {"account-number": account_number}})
+
+        async def positions(request):
+            self.requests.append(request)
+            return web.json_response({"data": {"items": [{"symbol": "AAPL"}]}})
+
+        async def equities(request):
+            self.requests.append(request)
+            symbols = request.query.getall("symbol[]")
+            return web.json_response({"data": {"items": [{"symbol": s} for s in reversed(symbols)]}})
+
+        async def option_chains(request):
+            self.requests.append(request)
+            symbol = request.match_info["symbol"]
+            return web.json_response({"data": {"items": [{"underlying-symbol": symbol, "expirations": []}]}})
+
+        async def orders(request):
+            self.requests.append(request)
+            offset = int(request.query["page-offset"])
+            per_page = int(request.query["per-page"])
+            items = [{"id": offset * per_page + n} for n in range(per_page)]
+            return web.json_response({"data": {"items": items}, "pagination": {"total-pages": 3}})
+
+        async def create_order(request):
+            self.requests.append(request)
+            return web.json_response({"data": {"order": await request.json()}}, status=201)
+
+        async def cancel_order(request):
+            self.requests.append(request)
+            return web.json_response({"data": {"id": request.match_info["order_id"], "status": "Cancelled"}})
+
+        async def create_watchlist(request):
+            self.requests.append(request)
+            return web.json_response({"data": await request.json()}, status=201)
+
+        async def watchlist(request):
+            self.requests.append(request)
+            name = request.match_info["name"]
+            if name == "missing":
+                return web.json_response({"error": {"message": "not found"}}, status=404)
+            return web.json_response({"data": {"name": name, "watchlist-entries": [{"symbol": "SPY"}]}})
+
+        async def market_metrics(request):
+            self.requests.append(request)
+            symbols = request.query["symbols"].split(",")
+            return web.json_response({"data": {"items": [{"symbol": s, "implied-volatility-index": "0.2"}
+                                                         for s in symbols]}})
+
+        app = web.Application()
+        app.router.add_get("/margin/accounts/{account_number}/requirements", requirements)
+        app.router.add_get("/accounts/{account_number}/positions", positions)
+        app.router.add_get("/instruments/equities", equities)
+        app.router.add_get("/option-chains/{symbol}/nested", option_chains)
+        app.router.add_get("/accounts/{account_number}/orders", orders)
+        app.router.add_post("/accounts/{account_number}/orders", create_order)
+        app.router.add_delete("/accounts/{account_number}/orders/{order_id}", cancel_order)
+        app.router.add_post("/watchlists", create_watchlist)
+        app.router.add_get("/watchlists/{name}", watchlist)
+        app.router.add_get("/market-metrics", market_metrics)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.url = str(self.server.make_url("")).rstrip("/")
+        self.transport = AsyncTransport(limit=10)
+
+    async def asyncTearDown(self):
+        await self.transport.close()
+        await self.server.close()
+
+    async def test_concurrent_fan_out(self):
+        from tastytrade_api.aio import AsyncTastytradeAccount
+
+        account = AsyncTastytradeAccount(MockAuth(self.url), transport=self.transport)
+        numbers = [str(n) for n in range(50)]
+
+        reports = await asyncio.gather(*(account.get_margin_requirements(n) for n in numbers))
+
+        with self.subTest("Check every result is returned in order"):
+            self.assertEqual([r["account-number"] for r in reports], numbers)
+        with self.subTest("Check the session token is sent"):
+            self.assertEqual(self.requests[0].headers["Authorization"], "session_token")
+        with self.subTest("Check that a bad request results in an exception"):
+            with self.assertRaises(AccountError):
+                await account.get_margin_requirements("bad")
+
+    async def test_params_are_encoded_like_requests(self):
+        from tastytrade_api.aio import AsyncTastytradeAccountPositions
+
+        positions = AsyncTastytradeAccountPositions("session_token", self.url, transport=self.transport)
+        data = await positions.get_positions("123", underlying_symbol=["AAPL", "SPY"], include_marks=True)
+
+        query = self.requests[-1].query
+        with self.subTest("Check response data"):
+            self.assertEqual(data, [{"symbol": "AAPL"}])
+        with self.subTest("Check lists are sent as repeated keys"):
+            self.assertEqual(query.getall("underlying-symbol"), ["AAPL", "SPY"])
+        with self.subTest("Check None values are dropped and booleans are stringified"):
+            self.assertNotIn("symbol", query)
+            self.assertEqual(query["include-marks"], "True")
+
+
+    async def test_instruments(self):
+        from tastytrade_api.aio import AsyncTastytradeInstruments
+
+        instruments = AsyncTastytradeInstruments("session_token", self.url, transport=self.transport)
+        symbols = [f"SYM{n}" for n in range(500)]
+
+        equities = await instruments.get_equities(symbols)
+        batches = len(self.requests)
+        chains = await instruments.get_option_chains("SPY")
+
+        with self.subTest("Check the symbols are fetched in batches and merged in input order"):
+            self.assertGreater(batches, 1)
+            self.assertEqual([e["symbol"] for e in equities], symbols)
+        with self.subTest("Check the option chain items are returned"):
+            self.assertEqual(chains, [{"underlying-symbol": "SPY", "expirations": []}])
+
+    async def test_orders(self):
+        from tastytrade_api.aio import AsyncTastytradeOrder
+
+        orders = AsyncTastytradeOrder("session_token", self.url, transport=self.transport)
+
+        created = await orders.create_order("123", {"order-type": "Limit", "price": "1.00"})
+        cancelled = await orders.cancel_order("123", "42")
+        items = [order async for order in orders.iter_orders("123", per_page=2)]
+        pages = [page async for page in aiter_pages(
+            lambda offset: orders.get_orders("123", per_page=2, page_offset=offset), prefetch=1)]
+
+        with self.subTest("Check the order is sent as JSON"):
+            self.assertEqual(created["data"]["order"], {"order-type": "Limit", "price": "1.00"})
+            self.assertEqual(cancelled["data"], {"id": "42", "status": "Cancelled"})
+        with self.subTest("Check every page is iterated in order"):
+            self.assertEqual([order["id"] for order in items], list(range(6)))
+            self.assertEqual([page["data"]["items"][0]["id"] for page in pages], [0, 2, 4])
+
+    async def test_watchlist(self):
+        from tastytrade_api.aio import AsyncTastytradeWatchlist
+
+        watchlists = AsyncTastytradeWatchlist("session_token", self.url, transport=self.transport)
+
+        created = await watchlists.create_account_watchlist({"name": "Income", "watchlist-entries": []})
+        watchlist = await watchlists.get_account_watchlists("Income")
+
+        with self.subTest("Check the watchlist is created and read"):
+            self.assertEqual(created["data"]["name"], "Income")
+            self.assertEqual(watchlist["data"]["watchlist-entries"], [{"symbol": "SPY"}])
+        with self.subTest("Check a missing watchlist raises a typed error"):
+            with self.assertRaises(NotFoundError):
+                await watchlists.get_account_watchlists("missing")
+
+    async def test_market_metrics(self):
+        from tastytrade_api.aio import AsyncMarketMetrics
+
+        metrics = AsyncMarketMetrics("session_token", self.url, transport=self.transport)
+        symbols = [f"SYM{n}" for n in range(1000)]
+
+        response = await metrics.get_metrics(symbols)
+
+        with self.subTest("Check the batches are merged into one response"):
+            self.assertGreater(len(self.requests), 1)
+            self.assertEqual([m["symbol"] for m in response["data"]["items"]], symbols)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestEventLoops(unittest.TestCase):
+    def setUp(self):
+        from tastytrade_api.aio import AsyncTransport
+
+        async def hello(request):
+            return web.json_response({"data": {}})
+
+        async def start():
+            app = web.Application()
+            app.router.add_get("/", hello)
+            self.server = TestServer(app)
+            await self.server.start_server()
+
+        # The loop of another thread, which keeps running while the test uses the transport elsewhere.
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(start(), self.loop).result(5)
+        self.url = str(self.server.make_url("/"))
+        self.transport = AsyncTransport()
+
+    def tearDown(self):
+        asyncio.run_coroutine_threadsafe(self.transport.close(), self.loop).result(5)
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+    def session_of_run(self):
+        async def get():
+            await self.transport.get(self.url)
+            return self.transport._session
+
+        return asyncio.run(get())
+
+    def test_pool_of_a_running_loop_is_closed(self):
+        first = asyncio.run_coroutine_threadsafe(self.transport.get(self.url), self.loop).result(5)
+        session = self.transport._session
+
+        second = self.session_of_run()
+
+        with self.subTest("Check the other loop's pool was closed before a new one was opened"):
+            self.assertEqual(first.status_code, 200)
+            self.assertTrue(session.closed)
+            self.assertIsNot(second, session)
+
+    def test_pool_of_a_closed_loop_is_released(self):
+        first = self.session_of_run()
+        with self.assertLogs("tastytrade_api.aio.transport", "WARNING"):
+            second = self.session_of_run()
+
+        with self.subTest("Check the pool of the ended loop is marked closed"):
+            self.assertTrue(first.closed)
+            self.assertFalse(second.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+from urllib.parse import urlencode
+import requests_mock
+from tastytrade_api.batching import chunk_symbols, merge_in_input_order, MAX_QUERY_LENGTH
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.market_data.market_metrics import MarketMetrics
+
+
+def option_symbols(count):
+    return [f"SPY   24{(n % 12) + 1:02d}15C{n:08d}" for n in range(count)]
+
+
+class TestBatching(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def test_chunk_symbols_respects_query_length(self):
+        symbols = option_symbols(3000)
+
+        for joined, key in ((False, "symbol[]"), (True, "symbols")):
+            with self.subTest(joined=joined):
+                batches = chunk_symbols(symbols, key, joined=joined)
+                self.assertGreater(len(batches), 1)
+                self.assertEqual([s for batch in batches for s in batch], symbols)
+                for batch in batches:
+                    if joined:
+                        query = urlencode({key: ",".join(batch)})
+                    else:
+                        query = urlencode({key: batch}, doseq=True)
+                    self.assertLessEqual(len(query), MAX_QUERY_LENGTH)
+
+    def test_merge_in_input_order(self):
+        items = [[{"symbol": "B"}, {"symbol": "X"}], [{"symbol": "A"}]]
+        merged = merge_in_input_order(["A", "B"], items)
+        self.assertEqual([item["symbol"] for item in merged], ["A", "B", "X"])
+
+    @requests_mock.Mocker()
+    def test_get_equity_options_in_batches(self, mock):
+        def callback(request, context):
+            # requests_mock lower-cases the query string
+            symbols = request.qs["symbol[]"]
+            return {"data": {"items": [{"symbol": s.upper()} for s in reversed(symbols)]}}
+
+        mock.get(f"{self.url}/instruments/equity-options", json=callback)
+        symbols = option_symbols(2000)
+        instruments = TastytradeInstruments("token", self.url, max_workers=3)
+
+        options = instruments.get_equity_options(symbols, active=True)
+
+        with self.subTest("Check the symbols were split into several requests"):
+            self.assertGreater(mock.call_count, 1)
+        with self.subTest("Check every URL stays short"):
+            for request in mock.request_history:
+                self.assertLessEqual(len(request.url), MAX_QUERY_LENGTH + len(self.url) + 100)
+        with self.subTest("Check the filters are sent with every batch"):
+            self.assertTrue(all(r.qs["active"] == ["true"] for r in mock.request_history))
+        with self.subTest("Check the results are merged in input order"):
+            self.assertEqual([o["symbol"] for o in options], symbols)
+
+    @requests_mock.Mocker()
+    def test_get_metrics_in_batches(self, mock):
+        def callback(request, context):
+            symbols = request.qs["symbols"][0].split(",")
+            return {"data": {"items": [{"symbol": s.upper()} for s in symbols]}}
+
+        mock.get(f"{self.url}/market-metrics", json=callback)
+        symbols = [f"SYM{n}" for n in range(2000)]
+
+        metrics = MarketMetrics("token", self.url).get_metrics(symbols)
+
+        self.assertGreater(mock.call_count, 1)
+        self.assertEqual([m["symbol"] for m in metrics["data"]["items"]], symbols)
+
+
+if __name__ == '__main__':
+    unittest.main()
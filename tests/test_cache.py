@@ -0,0 +1,138 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json
+import os
+import tempfile
+import time
+import unittest
+import requests_mock
+from tastytrade_api import MemoryCacheBackend, ResponseCache, SQLiteCacheBackend, ServerError, Transport
+from tastytrade_api.cache import CacheEntry
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.market_data.market_metrics import MarketMetrics
+
+PRODUCTS = {"data": {"items": [{"code": "ES"}, {"code": "NQ"}]}}
+
+
+class TestResponseCache(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def instruments(self, cache):
+        return TastytradeInstruments("token", self.url, transport=Transport(cache=cache, retry=None))
+
+    @requests_mock.Mocker()
+    def test_fresh_response_is_served_from_cache(self, mock):
+        mock.get(f"{self.url}/instruments/future-products", json=PRODUCTS)
+        cache = ResponseCache()
+        instruments = self.instruments(cache)
+
+        first = instruments.get_future_products()
+        second = instruments.get_future_products()
+
+        with self.subTest("Check one request was sent"):
+            self.assertEqual(mock.call_count, 1)
+        with self.subTest("Check the cached response is decoded the same way"):
+            self.assertEqual(first, second)
+        with self.subTest("Check the metrics"):
+            metrics = cache.metrics()
+            self.assertEqual((metrics["hits"], metrics["misses"]), (1, 1))
+            self.assertEqual(metrics["hit_rate"], 0.5)
+            self.assertEqual(metrics["bytes_saved"], len(json.dumps(PRODUCTS)))
+
+    @requests_mock.Mocker()
+    def test_stale_response_is_revalidated(self, mock):
+        url = f"{self.url}/instruments/future-products"
+        mock.get(url, [
+            {"json": PRODUCTS, "headers": {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}},
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ])
+        cache = ResponseCache(ttls={"*/instruments/future-products": 0.01})
+        instruments = self.instruments(cache)
+
+        instruments.get_future_products()
+        time.sleep(0.02)
+        products = instruments.get_future_products()
+
+        with self.subTest("Check the validators were sent"):
+            self.assertEqual(mock.last_request.headers["If-None-Match"], '"v1"')
+            self.assertEqual(mock.last_request.headers["If-Modified-Since"], "Mon, 05 Oct 2026 10:00:00 GMT")
+        with self.subTest("Check the cached body is returned on 304"):
+            self.assertEqual(products, PRODUCTS["data"]["items"])
+        with self.subTest("Check the revalidation is counted"):
+            self.assertEqual(cache.metrics()["revalidations"], 1)
+
+    @requests_mock.Mocker()
+    def test_only_configured_endpoints_and_successes_are_cached(self, mock):
+        mock.get(f"{self.url}/instruments/equities/active", json={"data": {"items": []}})
+        mock.get(f"{self.url}/market-metrics/historic-corporate-events/dividends/AAPL", status_code=500)
+        cache = ResponseCache()
+        instruments = self.instruments(cache)
+        metrics = MarketMetrics("token", self.url, transport=instruments.transport)
+
+        instruments.get_active_equities()
+        instruments.get_active_equities()
+        for _ in range(2):
+            with self.assertRaises(ServerError):
+                metrics.get_dividend_data("AAPL")
+
+        with self.subTest("Check every request was sent"):
+            self.assertEqual(mock.call_count, 4)
+        with self.subTest("Check nothing was stored"):
+            self.assertEqual(cache.metrics()["size"], 0)
+
+    @requests_mock.Mocker()
+    def test_earnings_are_cached_per_start_date(self, mock):
+        url = f"{self.url}/market-metrics/historic-corporate-events/earnings-reports/AAPL"
+        mock.get(url, json={"data": {"items": []}})
+        metrics = MarketMetrics("token", self.url, transport=Transport(cache=ResponseCache(), retry=None))
+
+        for start_date in ("2026-01-01", "2026-01-01", "2026-07-01", None):
+            metrics.get_earnings_data("AAPL", start_date=start_date)
+
+        with self.subTest("Check the start date is sent as a query parameter"):
+            self.assertEqual([r.qs.get("start-date") for r in mock.request_history], [["2026-01-01"], ["2026-07-01"], None])
+        with self.subTest("Check a repeated start date is served from the cache"):
+            self.assertEqual(mock.call_count, 3)
+
+    def test_memory_backend_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(max_bytes=10)
+        backend.set("a", CacheEntry(200, {}, b"xxxx", "a", time.time() + 60))
+        backend.set("b", CacheEntry(200, {}, b"xxxx", "b", time.time() + 60))
+        backend.get("a")
+        backend.set("c", CacheEntry(200, {}, b"xxxx", "c", time.time() + 60))
+
+        with self.subTest("Check the size bound is kept"):
+            self.assertEqual(backend.size, 8)
+            self.assertEqual(backend.evictions, 1)
+        with self.subTest("Check the least recently used entry was evicted"):
+            self.assertIsNone(backend.get("b"))
+            self.assertIsNotNone(backend.get("a"))
+            self.assertIsNotNone(backend.get("c"))
+
+    @requests_mock.Mocker()
+    def test_sqlite_backend_survives_restarts(self, mock):
+        mock.get(f"{self.url}/option-chains/SPY/nested", json={"data": {"items": [{"root-symbol": "SPY"}]}})
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "cache.sqlite")
+            backend = SQLiteCacheBackend(path)
+            self.instruments(ResponseCache(backend)).get_option_chains("SPY")
+            backend.close()
+
+            backend = SQLiteCacheBackend(path)
+            cache = ResponseCache(backend)
+            chains = self.instruments(cache).get_option_chains("SPY")
+            metrics = cache.metrics()
+            backend.close()
+
+        with self.subTest("Check the second process did not download the chain"):
+            self.assertEqual(mock.call_count, 1)
+            self.assertEqual(metrics["hits"], 1)
+        with self.subTest("Check the cached chain"):
+            self.assertEqual(chains, [{"root-symbol": "SPY"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,151 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+import requests_mock
+
+from tastytrade_api import NotFoundError, Transport
+from tastytrade_api.market_data.chain_loader import aload_chains, load_chains, load_snapshot
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.scheduler import Priority, RequestScheduler
+
+
+def nested(symbol):
+    return [{
+        "underlying-symbol": symbol,
+        "root-symbol": symbol,
+        "expirations": [{
+            "expiration-date": "2024-01-19",
+            "strikes": [{"strike-price": "100.0", "call": f"{symbol} C100", "put": f"{symbol} P100"}],
+        }],
+    }]
+
+
+class FakeInstruments:
+    """Stands in for TastytradeInstruments; requests_mock serializes requests."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def get_option_chains(self, symbol):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        if symbol == "BAD":
+            raise NotFoundError("Error getting symbol data for BAD", status_code=404)
+        return nested(symbol)
+
+
+class AsyncFakeInstruments:
+    async def get_option_chains(self, symbol):
+        await asyncio.sleep(0.01)
+        if symbol == "BAD":
+            raise NotFoundError("Error getting symbol data for BAD", status_code=404)
+        return nested(symbol)
+
+
+class FakeWatchlists:
+    def get_account_watchlists(self, watchlist_name=None):
+        return {"data": {"name": watchlist_name, "watchlist-entries": [
+            {"symbol": "SPY", "instrument-type": "Equity"},
+            {"symbol": "/ES", "instrument-type": "Future"},
+            {"symbol": "SPX", "instrument-type": "Index"},
+            {"symbol": "QQQ"},
+        ]}}
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.lanes = []
+
+    def acquire(self, lane):
+        self.lanes.append(lane)
+
+
+class TestLoadChains(unittest.TestCase):
+    def test_load(self):
+        instruments = FakeInstruments()
+        symbols = [f"SYM{n}" for n in range(12)] + ["BAD"]
+
+        load = load_chains(instruments, symbols, max_concurrency=4)
+
+        with self.subTest("Check chains keep the requested order"):
+            self.assertEqual(list(load.chains), symbols[:-1])
+            self.assertEqual(load["SYM3"], nested("SYM3"))
+        with self.subTest("Check a failure only fails its own symbol"):
+            self.assertEqual(load.failed, ["BAD"])
+            self.assertIsInstance(load.errors["BAD"], NotFoundError)
+        with self.subTest("Check every symbol is timed"):
+            self.assertEqual(list(load.latencies), symbols)
+            self.assertEqual(len(load.slowest(3)), 3)
+        with self.subTest("Check requests run concurrently, up to the limit"):
+            self.assertGreater(instruments.max_in_flight, 1)
+            self.assertLessEqual(instruments.max_in_flight, 4)
+
+    def test_watchlist(self):
+        scheduler = FakeScheduler()
+
+        load = load_chains(FakeInstruments(), watchlist="Income", watchlists=FakeWatchlists(), scheduler=scheduler)
+
+        with self.subTest("Check only underlyings with equity option chains are loaded"):
+            self.assertEqual(list(load.chains), ["SPY", "SPX", "QQQ"])
+        with self.subTest("Check requests are paced on the bulk lane"):
+            self.assertEqual(scheduler.lanes, [Priority.BULK] * 3)
+        with self.subTest("Check the arguments are validated"):
+            with self.assertRaises(ValueError):
+                load_chains(FakeInstruments())
+            with self.assertRaises(ValueError):
+                load_chains(FakeInstruments(), watchlist="Income")
+
+    @requests_mock.Mocker()
+    def test_transport_scheduler(self, mock):
+        url = "https://api.tastyworks.com"
+        for symbol in ("SPY", "QQQ"):
+            mock.get(f"{url}/option-chains/{symbol}/nested", json={"data": {"items": nested(symbol)}})
+        transport_scheduler = RequestScheduler(rate=100, burst=100)
+        scheduler = FakeScheduler()
+        instruments = TastytradeInstruments("token", url, transport=Transport(scheduler=transport_scheduler))
+
+        load = load_chains(instruments, ["SPY", "QQQ"], scheduler=scheduler)
+
+        with self.subTest("Check every chain is loaded"):
+            self.assertEqual(list(load.chains), ["SPY", "QQQ"])
+        with self.subTest("Check requests are only paced by the transport scheduler"):
+            self.assertEqual(transport_scheduler.metrics()[Priority.BULK]["requests"], 2)
+            self.assertEqual(scheduler.lanes, [])
+
+    def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "chains.json.gz")
+
+            load = load_chains(FakeInstruments(), ["SPY", "BAD", "QQQ"], path=path)
+            restored = load_snapshot(path)
+
+            with self.subTest("Check the chains round-trip"):
+                self.assertEqual(restored.chains, load.chains)
+                self.assertEqual(restored.failed, [])
+                self.assertLess(restored.wall_time, 60)
+            with self.subTest("Check no temporary file is left behind"):
+                self.assertEqual(os.listdir(directory), ["chains.json.gz"])
+
+    def test_aload(self):
+        load = asyncio.run(aload_chains(AsyncFakeInstruments(), ["SPY", "BAD", "QQQ"], max_concurrency=2))
+
+        self.assertEqual(list(load.chains), ["SPY", "QQQ"])
+        self.assertEqual(load.failed, ["BAD"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import threading
+import time
+import unittest
+import requests_mock
+from tastytrade_api import SingleFlight, Transport
+from tastytrade_api.coalescing import request_key
+from tastytrade_api.market_data.market_metrics import MarketMetrics
+
+
+class TestSingleFlight(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def test_request_key(self):
+        with self.subTest("Check parameter order and None values are ignored"):
+            self.assertEqual(
+                request_key("get", self.url, {"a": 1, "b": None, "c": ["X", "Y"]}),
+                request_key("GET", self.url, {"c": ("X", "Y"), "a": "1"}),
+            )
+        with self.subTest("Check different session tokens are different keys"):
+            self.assertNotEqual(
+                request_key("GET", self.url, headers={"Authorization": "a"}),
+                request_key("GET", self.url, headers={"Authorization": "b"}),
+            )
+
+    @requests_mock.Mocker()
+    def test_concurrent_identical_gets_share_one_request(self, mock):
+        def slow_metrics(request, context):
+            time.sleep(0.1)
+            return {"data": {"items": [{"symbol": "AAPL"}]}}
+
+        mock.get(f"{self.url}/market-metrics", json=slow_metrics)
+        coalescer = SingleFlight()
+        metrics = MarketMetrics("token", self.url, transport=Transport(coalescer=coalescer))
+        barrier = threading.Barrier(8)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(metrics.get_metrics(["AAPL"]))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.subTest("Check one request was sent"):
+            self.assertEqual(mock.call_count, 1)
+        with self.subTest("Check every caller got the result"):
+            self.assertEqual(results, [{"data": {"items": [{"symbol": "AAPL"}]}}] * 8)
+        with self.subTest("Check the counters"):
+            self.assertEqual(coalescer.metrics(), {"hits": 7, "misses": 1, "in_flight": 0})
+
+    @requests_mock.Mocker()
+    def test_sequential_and_non_get_requests_are_not_merged(self, mock):
+        mock.get(f"{self.url}/ping", json={})
+        mock.post(f"{self.url}/ping", json={})
+        coalescer = SingleFlight()
+        transport = Transport(coalescer=coalescer)
+
+        transport.get(f"{self.url}/ping")
+        transport.get(f"{self.url}/ping")
+        transport.post(f"{self.url}/ping")
+
+        with self.subTest("Check each call was sent"):
+            self.assertEqual(mock.call_count, 3)
+        with self.subTest("Check only the GETs went through the coalescer"):
+            self.assertEqual(coalescer.metrics()["misses"], 2)
+
+    def test_errors_are_shared(self):
+        coalescer = SingleFlight()
+        started = threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def follower():
+            started.wait()
+            try:
+                coalescer.do("key", fail)
+            except ValueError as exc:
+                errors.append(exc)
+
+        thread = threading.Thread(target=follower)
+        thread.start()
+        with self.assertRaises(ValueError):
+            coalescer.do("key", fail)
+        thread.join()
+
+        self.assertEqual(len(errors), 1)
+
+    def test_async_callers_share_one_call(self):
+        coalescer = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"symbol": "AAPL"}
+
+        async def main():
+            return await asyncio.gather(*(coalescer.do_async("key", fetch) for _ in range(5)))
+
+        results = asyncio.run(main())
+
+        with self.subTest("Check one call was made"):
+            self.assertEqual(len(calls), 1)
+        with self.subTest("Check every caller got the same decoded result"):
+            self.assertTrue(all(result is results[0] for result in results))
+        with self.subTest("Check the counters"):
+            self.assertEqual(coalescer.metrics(), {"hits": 4, "misses": 1, "in_flight": 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import unittest
+import requests_mock
+from tastytrade_api import Transport
+from tastytrade_api import codec
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+from tastytrade_api.trading.order import TastytradeOrder
+
+
+class CountingCodec(codec.StdlibCodec):
+    name = "counting"
+
+    def __init__(self):
+        self.decoded = 0
+        self.encoded = 0
+
+    def loads(self, data):
+        self.decoded += 1
+        return super().loads(data)
+
+    def dumps_bytes(self, obj):
+        self.encoded += 1
+        return super().dumps_bytes(obj)
+
+
+class TestCodec(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def setUp(self):
+        self.codec = CountingCodec()
+        self.previous = codec.set_codec(self.codec)
+
+    def tearDown(self):
+        codec.set_codec(self.previous)
+
+    def test_builtin_codecs_round_trip(self):
+        document = {"symbol": "AAPL", "strikes": [1.5, 2], "active": True, "expires": None}
+        names = ["json"] + (["orjson"] if codec.orjson is not None else [])
+        for name in names:
+            with self.subTest(f"Check the {name} codec"):
+                codec.set_codec(name)
+                self.assertEqual(codec.loads(codec.dumps(document)), document)
+                self.assertEqual(codec.loads(codec.dumps_bytes(document)), document)
+
+    @requests_mock.Mocker()
+    def test_responses_are_decoded_with_the_codec(self, mock):
+        mock.get(f"{self.url}/accounts/123/positions", json={"data": {"items": [{"symbol": "AAPL"}]}})
+        positions = TastytradeAccountPositions("token", self.url, transport=Transport())
+
+        self.assertEqual(positions.get_positions("123"), [{"symbol": "AAPL"}])
+        self.assertEqual(self.codec.decoded, 1)
+
+    @requests_mock.Mocker()
+    def test_request_bodies_are_encoded_with_the_codec(self, mock):
+        mock.post(f"{self.url}/accounts/123/orders", status_code=201, json={"data": {"order": {"id": 1}}})
+        order = TastytradeOrder("token", self.url, transport=Transport())
+
+        order.create_order("123", {"order-type": "Limit", "price": 1.5})
+
+        with self.subTest("Check the body was encoded by the codec"):
+            self.assertEqual(self.codec.encoded, 1)
+            self.assertEqual(mock.last_request.json(), {"order-type": "Limit", "price": 1.5})
+        with self.subTest("Check the content type and the session token are sent"):
+            self.assertEqual(mock.last_request.headers["Content-Type"], "application/json")
+            self.assertEqual(mock.last_request.headers["Authorization"], "token")
+
+    def test_streamer_messages_are_decoded_with_the_codec(self):
+        client = CometdWebsocketClient("wss://example", "token", asyncio.Queue())
+        message = '[{"channel": "/service/data", "data": [["Quote", ["SPY", 1.0, 1.1]]]}]'
+
+        async def collect():
+            return [data async for data in client.handle_message(message)]
+
+        self.assertEqual(asyncio.run(collect()), [[["Quote", ["SPY", 1.0, 1.1]]]])
+        self.assertEqual(self.codec.decoded, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+
+import requests_mock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tastytrade_api import Transport
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.market_data.market_metrics import MarketMetrics
+from tastytrade_api.models import EquityOption
+
+URL = "https://api.tastyworks.com"
+
+OPTIONS = [
+    {
+        "symbol": "AAPL  230616C00150000",
+        "strike-price": "150.0",
+        "expiration-date": "2023-06-16",
+        "option-type": "C",
+        "shares-per-contract": 100,
+        "active": True,
+        "expires-at": "2023-06-16T20:00:00.000+00:00",
+        "tick-sizes": [{"value": "0.01"}],
+    },
+    {
+        "symbol": "AAPL  230616P00155500",
+        "strike-price": "155.5",
+        "expiration-date": "2023-06-16",
+        "option-type": "P",
+        "shares-per-contract": None,
+        "active": False,
+    },
+]
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestColumns(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+
+    @requests_mock.Mocker()
+    def test_equity_option_columns(self, mock):
+        mock.get(f"{URL}/instruments/equity-options", json={"data": {"items": OPTIONS}})
+        client = TastytradeInstruments("session_token", URL, transport=self.transport)
+
+        for stream in (False, True):
+            columns = client.get_equity_options(stream=stream, output="columns")
+            with self.subTest(f"Check prices, dates and timestamps with stream={stream}"):
+                self.assertEqual(len(columns), 2)
+                np.testing.assert_array_equal(columns["strike_price"], [150.0, 155.5])
+                self.assertEqual(columns["expiration_date"].dtype, np.dtype("datetime64[D]"))
+                self.assertEqual(columns["expiration_date"][0], np.datetime64("2023-06-16"))
+                self.assertEqual(columns["expires_at"][0], np.datetime64("2023-06-16T20:00:00"))
+                self.assertTrue(np.isnat(columns["expires_at"][1]))
+            with self.subTest(f"Check plain fields are typed from their values with stream={stream}"):
+                self.assertEqual(columns["active"].dtype, np.dtype(bool))
+                self.assertEqual(columns["option_type"].tolist(), ["C", "P"])
+                self.assertEqual(columns["shares_per_contract"].dtype, np.dtype("float64"))
+                self.assertTrue(np.isnan(columns["shares_per_contract"][1]))
+
+    @requests_mock.Mocker()
+    def test_positions_and_metrics(self, mock):
+        mock.get(f"{URL}/accounts/5WT00000/positions", json={"data": {"items": [
+            {"symbol": "AAPL", "quantity": 100, "quantity-direction": "Long"},
+            {"symbol": "MSFT", "quantity": "5", "quantity-direction": "Short"},
+        ]}})
+        mock.get(f"{URL}/accounts/5WT00000/balances", json={"data": {"cash-balance": "1.0"}})
+        mock.get(f"{URL}/market-metrics", json={"data": {"items": [
+            {"symbol": "MSFT", "implied-volatility-index-rank": "0.25"},
+            {"symbol": "AAPL", "implied-volatility-index-rank": "0.5"},
+        ]}})
+
+        positions = TastytradeAccountPositions("session_token", URL, transport=self.transport)
+        metrics = MarketMetrics("session_token", URL, transport=self.transport)
+
+        with self.subTest("Check position quantities"):
+            columns = positions.get_positions("5WT00000", output="columns")
+            np.testing.assert_array_equal(columns["quantity"], [100.0, 5.0])
+        with self.subTest("Check metrics keep the order of the requested symbols"):
+            columns = metrics.get_metrics(["AAPL", "MSFT"], output="columns")
+            self.assertEqual(columns["symbol"].tolist(), ["AAPL", "MSFT"])
+            np.testing.assert_array_equal(columns["implied_volatility_index_rank"], [0.5, 0.25])
+        with self.subTest("Check single objects have no columns"):
+            with self.assertRaises(ValueError):
+                positions.get_account_balances("5WT00000", output="columns")
+
+    def test_projection(self):
+        from tastytrade_api.columns import Columns
+
+        columns = Columns.from_items(OPTIONS, EquityOption, names=["symbol", "strike_price"])
+
+        with self.subTest("Check only the requested columns are built"):
+            self.assertEqual(columns.names, ["symbol", "strike_price"])
+        with self.subTest("Check unknown columns are rejected"):
+            with self.assertRaises(ValueError):
+                Columns.from_items(OPTIONS, EquityOption, names=["delta"])
+
+    def test_adapters_share_memory(self):
+        from tastytrade_api.columns import Columns, pa, pd
+
+        columns = Columns.from_items(OPTIONS, EquityOption)
+        strikes = columns["strike_price"]
+
+        if pa is not None:
+            with self.subTest("Check the Arrow table"):
+                table = columns.to_arrow()
+                self.assertEqual(table.column("strike_price").to_pylist(), [150.0, 155.5])
+                self.assertEqual(str(table.schema.field("expires_at").type), "timestamp[us, tz=UTC]")
+                self.assertIsNone(table.column("expires_at").to_pylist()[1])
+                self.assertEqual(table.column("strike_price").chunk(0).buffers()[1].address, strikes.ctypes.data)
+        if pd is not None:
+            with self.subTest("Check the DataFrame"):
+                frame = columns.to_pandas()
+                self.assertEqual(frame["option_type"].tolist(), ["C", "P"])
+                self.assertTrue(np.shares_memory(frame["strike_price"].to_numpy(), strikes))
+
+
+if __name__ == '__main__':
+    unittest.main()
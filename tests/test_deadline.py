@@ -0,0 +1,128 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import time
+import unittest
+import requests
+import requests_mock
+from tastytrade_api import DeadlineExceeded, RetryPolicy, Timeout, Transport, TransportError, deadline
+from tastytrade_api.batching import fan_out
+from tastytrade_api.deadline import check_deadline, remaining
+from tastytrade_api.pagination import aiter_items, iter_items, iter_pages
+
+
+class FixedDelayRetry(RetryPolicy):
+    def delay(self, attempt, response=None):
+        return 5.0
+
+
+class TestDeadline(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def test_nested_deadlines(self):
+        with self.subTest("Check no deadline is set by default"):
+            self.assertIsNone(remaining())
+        with deadline(10):
+            with deadline(0.5):
+                with self.subTest("Check an inner deadline shortens the outer one"):
+                    self.assertLessEqual(remaining(), 0.5)
+            with deadline(60):
+                with self.subTest("Check an inner deadline cannot extend the outer one"):
+                    self.assertLessEqual(remaining(), 10)
+        with self.subTest("Check the deadline is cleared on exit"):
+            self.assertIsNone(remaining())
+
+    @requests_mock.Mocker()
+    def test_timeouts_fit_the_deadline(self, mock):
+        mock.get(f"{self.url}/ping", json={})
+        transport = Transport(timeout=(5.0, 30.0))
+
+        with deadline(1.0):
+            transport.get(f"{self.url}/ping")
+        connect, read = mock.last_request.timeout
+        with self.subTest("Check connect and read are shortened"):
+            self.assertLessEqual(connect, 1.0)
+            self.assertLessEqual(read, 1.0)
+
+        transport.get(f"{self.url}/ping", timeout=Timeout(connect=2.0, read=3.0))
+        with self.subTest("Check a Timeout is passed as (connect, read)"):
+            self.assertEqual(mock.last_request.timeout, (2.0, 3.0))
+
+    @requests_mock.Mocker()
+    def test_expired_deadline_sends_nothing(self, mock):
+        mock.get(f"{self.url}/ping", json={})
+        transport = Transport()
+
+        with deadline(0):
+            with self.assertRaises(DeadlineExceeded) as context:
+                transport.get(f"{self.url}/ping")
+        with self.subTest("Check no request was sent"):
+            self.assertEqual(mock.call_count, 0)
+        with self.subTest("Check the error is a non-retryable TransportError"):
+            self.assertIsInstance(context.exception, TransportError)
+            self.assertFalse(context.exception.retryable)
+
+    @requests_mock.Mocker()
+    def test_total_timeout_stops_retries(self, mock):
+        mock.get(f"{self.url}/ping", exc=requests.exceptions.ConnectionError("reset"))
+        transport = Transport(timeout=Timeout(connect=1.0, read=1.0, total=1.0), retry=FixedDelayRetry())
+
+        start = time.monotonic()
+        with self.assertRaises(DeadlineExceeded):
+            transport.get(f"{self.url}/ping")
+        with self.subTest("Check the backoff that would outlive the budget is skipped"):
+            self.assertLess(time.monotonic() - start, 1.0)
+            self.assertEqual(mock.call_count, 1)
+
+    def test_iter_pages_shares_one_budget(self):
+        def fetch_page(offset):
+            check_deadline()
+            time.sleep(0.05)
+            return {"data": {"items": [offset]}, "pagination": {"total-pages": 10}}
+
+        with self.assertRaises(DeadlineExceeded):
+            list(iter_items(fetch_page, prefetch=1, timeout=0.2))
+
+    def test_deadline_reaches_worker_threads(self):
+        seen = []
+
+        def fetch_page(offset):
+            seen.append(remaining())
+            return {"data": {"items": [offset]}, "pagination": {"total-pages": 4}}
+
+        with deadline(30):
+            pages = list(iter_pages(fetch_page, prefetch=3))
+            batches = fan_out(lambda batch: remaining(), [["A"], ["B"], ["C"]], max_workers=3)
+
+        with self.subTest("Check prefetched pages see the deadline"):
+            self.assertEqual(len(pages), 4)
+            self.assertTrue(all(left is not None and left <= 30 for left in seen))
+        with self.subTest("Check batches see the deadline"):
+            self.assertTrue(all(left is not None and left <= 30 for left in batches))
+
+    def test_deadline_reaches_executor_threads(self):
+        async def run():
+            with deadline(30):
+                return await asyncio.to_thread(remaining)
+
+        left = asyncio.run(run())
+        self.assertTrue(left is not None and left <= 30)
+
+    def test_async_iteration_shares_one_budget(self):
+        async def fetch_page(offset):
+            check_deadline()
+            await asyncio.sleep(0.05)
+            return {"data": {"items": [offset]}, "pagination": {"total-pages": 10}}
+
+        async def collect():
+            return [item async for item in aiter_items(fetch_page, prefetch=1, timeout=0.2)]
+
+        with self.assertRaises(DeadlineExceeded):
+            asyncio.run(collect())
+
+
+if __name__ == '__main__':
+    unittest.main()
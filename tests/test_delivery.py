@@ -0,0 +1,104 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import unittest
+
+from tastytrade_api.streamer.delivery import (
+    BlockingQueue,
+    ConflatingQueue,
+    DropOldestQueue,
+    delivery_queue,
+)
+from tastytrade_api.streamer.reconnect import Reconnected
+
+HEADER = ["Quote", ["eventSymbol", "bidPrice", "askPrice"]]
+
+
+def drain(queue):
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+class TestDeliveryQueues(unittest.IsolatedAsyncioTestCase):
+    async def test_blocking(self):
+        queue = delivery_queue("block", maxsize=2)
+        await queue.put(["Quote", [1]])
+        await queue.put(["Quote", [2]])
+
+        put = asyncio.create_task(queue.put(["Quote", [3]]))
+        await asyncio.sleep(0.01)
+        with self.subTest("Check put waits for room"):
+            self.assertFalse(put.done())
+        self.assertEqual(await queue.get(), ["Quote", [1]])
+        await put
+        with self.subTest("Check the wait is counted"):
+            self.assertIsInstance(queue, BlockingQueue)
+            self.assertEqual(queue.metrics()["blocked"], 1)
+            self.assertEqual(queue.metrics()["max_depth"], 2)
+
+    async def test_drop_oldest(self):
+        queue = DropOldestQueue(maxsize=2)
+        event = Reconnected(0.0, 1.0, 1)
+        for n in range(3):
+            await queue.put(["Quote", [n]])
+        await queue.put(event)
+        await queue.put(["Quote", [3]])
+
+        with self.subTest("Check the oldest data is dropped, and events are kept"):
+            self.assertEqual(drain(queue), [["Quote", [2]], event, ["Quote", [3]]])
+            self.assertEqual(queue.metrics(), {"queued": 0, "delivered": 3, "dropped": 2})
+        with self.subTest("Check get waits for a message"):
+            get = asyncio.create_task(queue.get())
+            await asyncio.sleep(0)
+            queue.put_nowait(["Quote", [4]])
+            self.assertEqual(await asyncio.wait_for(get, 1), ["Quote", [4]])
+
+    async def test_conflation(self):
+        queue = ConflatingQueue()
+        event = Reconnected(0.0, 1.0, 1)
+        await queue.put([HEADER, ["SPY", 1.0, 1.1, "QQQ", 2.0, 2.1]])
+        await queue.put(["Quote", ["SPY", 1.2, 1.3, "IWM", 3.0, 3.1, "SPY", 1.4, 1.5]])
+        await queue.put(["Trade", ["SPY", 1.4]])
+        await queue.put(event)
+        await queue.put(["Quote", ["SPY", 1.6, 1.7]])
+
+        with self.subTest("Check every symbol keeps its latest event"):
+            self.assertEqual(queue.get_nowait(), [HEADER, ["SPY", 1.4, 1.5, "QQQ", 2.0, 2.1, "IWM", 3.0, 3.1]])
+            self.assertEqual(queue.metrics()["conflated"], 2)
+        with self.subTest("Check messages without a header are passed through"):
+            self.assertEqual(queue.get_nowait(), ["Trade", ["SPY", 1.4]])
+        with self.subTest("Check events are not moved across connection events"):
+            self.assertIs(queue.get_nowait(), event)
+            self.assertEqual(queue.get_nowait(), ["Quote", ["SPY", 1.6, 1.7]])
+            self.assertTrue(queue.empty())
+
+    async def test_header_change(self):
+        queue = ConflatingQueue()
+        event = Reconnected(0.0, 1.0, 1)
+        await queue.put([HEADER, ["SPY", 1, 2]])
+        await queue.put(event)
+        await queue.put([["Quote", ["eventSymbol", "askPrice"]], ["SPY", 3]])
+        await queue.put(event)
+        await queue.put(["Quote", ["SPY", 9]])
+
+        with self.subTest("Check every delivery keeps the header its events were sent with"):
+            self.assertEqual(drain(queue), [
+                [HEADER, ["SPY", 1, 2]],
+                event,
+                [["Quote", ["eventSymbol", "askPrice"]], ["SPY", 3]],
+                event,
+                ["Quote", ["SPY", 9]],
+            ])
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            delivery_queue("latest")
+
+
+if __name__ == '__main__':
+    unittest.main()
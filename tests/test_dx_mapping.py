@@ -0,0 +1,70 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import math
+import unittest
+
+from tastytrade_api.streamer.dx_mapping import (
+    EVENT_CLASSES,
+    DxFeedDecoder,
+    Greeks,
+    Quote,
+    Trade,
+    TradeETH,
+    attribute_name,
+)
+
+
+class TestDxFeedDecoder(unittest.TestCase):
+    def test_header(self):
+        decoder = DxFeedDecoder()
+        header = ["Quote", ["eventSymbol", "bidPrice", "askPrice", "bidSize", "unknownField"]]
+
+        first = decoder.decode([header, ["SPY", 470.1, 470.2, "NaN", 1, "QQQ", 400.0, 400.1, 7, 2]])
+        later = decoder.decode(["Quote", ["IWM", 200.0, 200.1, 3, 3]])
+
+        with self.subTest("Check fields are read at the positions of the header"):
+            self.assertEqual([(q.symbol, q.bid_price, q.ask_price) for q in first + later],
+                             [("SPY", 470.1, 470.2), ("QQQ", 400.0, 400.1), ("IWM", 200.0, 200.1)])
+            self.assertIsInstance(first[0], Quote)
+        with self.subTest("Check special numbers become floats"):
+            self.assertTrue(math.isnan(first[0].bid_size))
+        with self.subTest("Check fields missing from the header are not set"):
+            self.assertFalse(hasattr(first[0], "ask_size"))
+            self.assertEqual(first[1].to_dict(), {"symbol": "QQQ", "bid_price": 400.0, "bid_size": 7,
+                                                  "ask_price": 400.1})
+
+    def test_default_fields_and_projection(self):
+        values = ["SPY", 1, 2, 3, 4, 5, 470.0, 0.2, 0.5, 0.01, -0.3, 0.1, 0.4]
+
+        greeks = DxFeedDecoder().decode(["Greeks", values])[0]
+        projected = DxFeedDecoder(fields={"Greeks": ["delta"]}).decode(["Greeks", values])[0]
+
+        with self.subTest("Check the default field order is used without a header"):
+            self.assertEqual((greeks.symbol, greeks.price, greeks.delta, greeks.vega), ("SPY", 470.0, 0.5, 0.4))
+        with self.subTest("Check projection only sets the symbol and the listed fields"):
+            self.assertEqual(projected.to_dict(), {"symbol": "SPY", "delta": 0.5})
+
+    def test_event_types(self):
+        with self.subTest("Check every event type is covered"):
+            self.assertEqual(sorted(EVENT_CLASSES), sorted([
+                "Quote", "Trade", "TradeETH", "Greeks", "Summary", "Profile", "TheoPrice", "TimeAndSale", "Candle",
+                "Underlying"]))
+            self.assertEqual(attribute_name("high52WeekPrice"), "high52_week_price")
+        with self.subTest("Check from_list only decodes its own type"):
+            trade = ["SPY", 1, 2, 0, 3, "Q", 470.0, 0.5, 100, 1000, 470000.0, "UP", False]
+            self.assertEqual(TradeETH.from_list(["TradeETH", trade])[0].price, 470.0)
+            self.assertIsInstance(TradeETH.from_list(["TradeETH", trade])[0], TradeETH)
+            self.assertEqual(Trade.from_list(["TradeETH", trade]), [])
+            self.assertEqual(Greeks.from_list([]), [])
+        with self.subTest("Check unknown event types are skipped"):
+            self.assertEqual(DxFeedDecoder().decode(["Order", ["SPY", 1]]), [])
+        with self.subTest("Check the positional constructor"):
+            quote = Quote("SPY", 1, 0, 0, 0, "Q", 470.1, 5, 0, "Q", 470.2, 6)
+            self.assertEqual((quote.bid_price, quote.ask_size), (470.1, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import unittest
+
+from tastytrade_api import SubscriptionError
+from tastytrade_api.codec import dumps
+from tests.helpers import FakeWebsocket
+
+try:
+    from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient, chunk_subscriptions
+except ImportError:
+    CometdWebsocketClient = None
+
+
+def ack(message, successful=True):
+    return {"id": message[0]["id"], "channel": "/service/sub", "successful": successful}
+
+
+async def receive(client, *messages):
+    return [data async for data in client.handle_message(dumps(list(messages)))]
+
+
+@unittest.skipIf(CometdWebsocketClient is None, "websockets is not installed")
+class TestChunkSubscriptions(unittest.TestCase):
+    def test_chunks(self):
+        symbols = [f".SPXW240119C{strike}" for strike in range(3000, 6000)]
+        subscriptions = {"Quote": symbols, "Trade": symbols[:10], "Greeks": symbols}
+
+        chunks = chunk_subscriptions(subscriptions, max_bytes=20000)
+
+        with self.subTest("Check every chunk stays under the limit"):
+            for chunk in chunks:
+                self.assertLessEqual(len(dumps(chunk)), 20000)
+        with self.subTest("Check few chunks are needed"):
+            self.assertLessEqual(len(chunks), len(dumps(subscriptions)) // 20000 + 1)
+        with self.subTest("Check every symbol is kept, in order"):
+            for event_type, expected in subscriptions.items():
+                self.assertEqual([s for chunk in chunks for s in chunk.get(event_type, [])], expected)
+        with self.subTest("Check small sets fit in one chunk"):
+            self.assertEqual(chunk_subscriptions({"Quote": ["SPY"], "Trade": ["SPY"]}),
+                             [{"Quote": ["SPY"], "Trade": ["SPY"]}])
+            self.assertEqual(chunk_subscriptions({}), [])
+
+
+@unittest.skipIf(CometdWebsocketClient is None, "websockets is not installed")
+class TestBulkSubscribe(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.websocket = FakeWebsocket()
+        self.client = CometdWebsocketClient("wss://streamer", "token", None)
+        self.client.client_id = "client-1"
+        self.client.websocket = self.websocket
+
+    async def test_acknowledged(self):
+        symbols = [f"SYM{n:05d}" for n in range(20000)]
+
+        acknowledged = await self.client.subscribe({"Quote": symbols})
+
+        with self.subTest("Check the symbols are sent in a few messages"):
+            self.assertEqual(len(self.websocket.sent), 4)
+            self.assertTrue(all(len(frame) < 64 * 1024 for frame in self.websocket.frames))
+            self.assertEqual(self.websocket.sent[0][0]["data"]["reset"], False)
+            self.assertEqual(sum(len(m[0]["data"]["add"]["Quote"]) for m in self.websocket.sent), 20000)
+        with self.subTest("Check the task waits for every acknowledgement"):
+            await receive(self.client, *(ack(m) for m in self.websocket.sent[:3]))
+            await asyncio.sleep(0)
+            self.assertFalse(acknowledged.done())
+            self.assertEqual(self.client.pending_acks, 1)
+            await receive(self.client, ack(self.websocket.sent[3]))
+            self.assertIsNone(await acknowledged)
+            self.assertEqual(self.client.pending_acks, 0)
+
+    async def test_unsubscribe_rejected(self):
+        acknowledged = await self.client.unsubscribe({"Quote": ["SPY"], "Greeks": [".SPY240119C500"]})
+
+        message = self.websocket.sent[0][0]
+        self.assertEqual(message["data"]["remove"], {"Quote": ["SPY"], "Greeks": [".SPY240119C500"]})
+        await receive(self.client, ack(self.websocket.sent[0], successful=False))
+        with self.assertRaises(SubscriptionError):
+            await acknowledged
+
+    async def test_timeout_and_disconnect(self):
+        with self.subTest("Check missing acknowledgements time out"):
+            acknowledged = await self.client.subscribe({"Quote": ["SPY"]}, timeout=0.01)
+            with self.assertRaises(SubscriptionError):
+                await acknowledged
+            self.assertEqual(self.client.pending_acks, 0)
+        with self.subTest("Check a closed connection fails the pending acknowledgements"):
+            acknowledged = await self.client.subscribe({"Quote": ["QQQ"]}, timeout=None)
+            self.client._fail_pending_acks("closed")
+            with self.assertRaises(SubscriptionError):
+                await acknowledged
+
+    async def test_batched_frames(self):
+        data = {"channel": "/service/data", "data": ["Quote", ["SPY", 1.0]]}
+
+        messages = await receive(self.client, {"channel": "/service/sub", "successful": True}, data, data)
+
+        self.assertEqual(messages, [data["data"], data["data"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
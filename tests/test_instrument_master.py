@@ -0,0 +1,141 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from decimal import Decimal
+
+from tastytrade_api import ServerError
+from tastytrade_api.market_data.instrument_master import InstrumentMaster
+from tastytrade_api.models import EquityOption
+
+TODAY = date.today()
+NEXT_MONTH = (TODAY + timedelta(days=30)).isoformat()
+YESTERDAY = (TODAY - timedelta(days=1)).isoformat()
+
+
+def chain(underlying, expirations):
+    return {
+        "underlying-symbol": underlying,
+        "root-symbol": underlying,
+        "option-chain-type": "Standard",
+        "shares-per-contract": 100,
+        "expirations": [
+            {
+                "expiration-date": expiration,
+                "expiration-type": "Regular",
+                "settlement-type": "PM",
+                "strikes": [
+                    {
+                        "strike-price": strike,
+                        "call": f"{underlying} {expiration} C{strike}",
+                        "call-streamer-symbol": f".{underlying}C{strike}",
+                        "put": f"{underlying} {expiration} P{strike}",
+                        "put-streamer-symbol": f".{underlying}P{strike}",
+                    }
+                    for strike in strikes
+                ],
+            }
+            for expiration, strikes in expirations.items()
+        ],
+    }
+
+
+class FakeInstruments:
+    """Stands in for TastytradeInstruments; the tests change what it lists between syncs."""
+
+    def __init__(self):
+        self.equities = [{"symbol": "AAPL", "description": "Apple"}, {"symbol": "MSFT", "description": "Microsoft"}]
+        self.chains = {"AAPL": [chain("AAPL", {NEXT_MONTH: ["150.0", "155.5"]})]}
+        self.futures = [
+            {"symbol": "/ESZ9", "product-code": "ES", "expiration-date": "2099-12-18"},
+            {"symbol": "/ESH9", "product-code": "ES", "expiration-date": "2099-03-20"},
+        ]
+        self.fail = False
+
+    def iter_active_equities(self):
+        if self.fail:
+            raise ServerError("unavailable", status_code=503)
+        return iter(self.equities)
+
+    def get_option_chains(self, symbol):
+        return self.chains[symbol]
+
+    def get_futures(self, product_codes=None):
+        return self.futures
+
+
+class TestInstrumentMaster(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "instruments.sqlite")
+        self.instruments = FakeInstruments()
+        self.master = InstrumentMaster(self.instruments, self.path, underlyings=["AAPL"])
+        self.addCleanup(self.master.close)
+
+    def test_initial_load_and_lookups(self):
+        report = self.master.sync()
+
+        with self.subTest("Check the load report"):
+            self.assertEqual(report["equities"], {"added": 2, "updated": 0, "deactivated": 0})
+            self.assertEqual(report["options"]["added"], 4)
+            self.assertEqual(report["futures"]["added"], 2)
+        with self.subTest("Check lookups by symbol"):
+            self.assertEqual(self.master.get("MSFT").description, "Microsoft")
+            self.assertIn("/ESZ9", self.master)
+            self.assertIsNone(self.master.get("TSLA"))
+        with self.subTest("Check lookups by underlying, expiration and strike"):
+            option = self.master.option("AAPL", NEXT_MONTH, 155.5, "P")
+            self.assertIsInstance(option, EquityOption)
+            self.assertEqual(option.streamer_symbol, ".AAPLP155.5")
+            self.assertEqual(self.master.expirations("AAPL"), [date.fromisoformat(NEXT_MONTH)])
+            self.assertEqual(self.master.strikes("AAPL", NEXT_MONTH), [Decimal("150"), Decimal("155.5")])
+            self.assertEqual(len(self.master.options("AAPL", option_type="C")), 2)
+            self.assertEqual(self.master.options("AAPL", strike="150")[0].option_type, "C")
+        with self.subTest("Check lookups by product code"):
+            self.assertEqual([future.symbol for future in self.master.futures("ES")], ["/ESH9", "/ESZ9"])
+
+    def test_incremental_refresh(self):
+        self.master.sync()
+        self.instruments.equities = [{"symbol": "AAPL", "description": "Apple Inc"}, {"symbol": "NVDA"}]
+        self.instruments.chains["AAPL"] = [chain("AAPL", {NEXT_MONTH: ["150.0"], YESTERDAY: ["140.0"]})]
+
+        report = self.master.sync()
+
+        with self.subTest("Check new listings, changes and deactivations"):
+            self.assertEqual(report["equities"], {"added": 1, "updated": 1, "deactivated": 1})
+            self.assertEqual(self.master.get("AAPL").description, "Apple Inc")
+            self.assertIsNone(self.master.get("MSFT"))
+        with self.subTest("Check delisted and expired options are deactivated"):
+            self.assertEqual(report["options"], {"added": 0, "updated": 0, "deactivated": 2})
+            self.assertEqual(self.master.strikes("AAPL", NEXT_MONTH), [Decimal("150")])
+            self.assertEqual(self.master.expirations("AAPL"), [date.fromisoformat(NEXT_MONTH)])
+        with self.subTest("Check unchanged instruments are not rewritten"):
+            self.assertEqual(report["futures"], {"added": 0, "updated": 0, "deactivated": 0})
+
+    def test_database_survives_restarts(self):
+        self.master.sync()
+        self.master.close()
+
+        with InstrumentMaster(FakeInstruments(), self.path) as reopened:
+            self.assertEqual(len(reopened), 8)
+            self.assertEqual(reopened.option("AAPL", NEXT_MONTH, "150", "C").strike_price, Decimal("150"))
+
+    def test_failed_sync_changes_nothing(self):
+        self.master.sync()
+        self.instruments.equities = []
+        self.instruments.fail = True
+
+        with self.assertRaises(ServerError):
+            self.master.sync()
+
+        self.assertIsNotNone(self.master.get("MSFT"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import requests_mock
+
+from tastytrade_api import Transport
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.models import EquityOption, Order, Position, convert
+from tastytrade_api.trading.order import TastytradeOrder
+
+URL = "https://api.tastyworks.com"
+
+POSITION = {
+    "account-number": "5WT00000",
+    "symbol": "AAPL",
+    "instrument-type": "Equity",
+    "quantity": 100,
+    "quantity-direction": "Long",
+    "average-open-price": "150.25",
+    "expires-at": None,
+    "created-at": "2023-05-01T14:30:00.123+00:00",
+    "realized-day-gain-date": "2023-05-02",
+    "unknown-key": "dropped",
+}
+
+ORDER = {
+    "id": 1,
+    "account-number": "5WT00000",
+    "order-type": "Limit",
+    "price": "1.5",
+    "status": "Live",
+    "legs": [
+        {"symbol": "AAPL", "instrument-type": "Equity", "action": "Buy to Open", "quantity": "100", "fills": []},
+    ],
+}
+
+
+class TestModels(unittest.TestCase):
+    def test_fields_are_decoded_when_read(self):
+        position = Position.from_dict(POSITION)
+
+        with self.subTest("Check numbers and prices are decimals"):
+            self.assertEqual(position.quantity, Decimal("100"))
+            self.assertEqual(position.average_open_price, Decimal("150.25"))
+        with self.subTest("Check dates and timestamps"):
+            self.assertEqual(position.realized_day_gain_date, date(2023, 5, 2))
+            self.assertEqual(position.created_at, datetime(2023, 5, 1, 14, 30, 0, 123000, tzinfo=timezone.utc))
+        with self.subTest("Check plain and missing fields"):
+            self.assertEqual(position.symbol, "AAPL")
+            self.assertIsNone(position.expires_at)
+            self.assertIsNone(position.mark)
+
+    def test_compact_instances(self):
+        position = Position.from_dict(POSITION)
+
+        with self.subTest("Check there is no instance dict"):
+            self.assertFalse(hasattr(position, "__dict__"))
+        with self.subTest("Check undeclared attributes cannot be set"):
+            with self.assertRaises(AttributeError):
+                position.unknown_key = "x"
+
+    def test_round_trip(self):
+        order = Order.from_dict(ORDER)
+
+        with self.subTest("Check nested legs are models"):
+            self.assertEqual(order.legs[0].action, "Buy to Open")
+            self.assertEqual(order.legs[0].quantity, Decimal("100"))
+        with self.subTest("Check to_dict gives back the declared keys"):
+            self.assertEqual(order.to_dict(), ORDER)
+            self.assertEqual(Order.from_dict(order.to_dict()), order)
+        with self.subTest("Check undeclared keys are dropped"):
+            self.assertNotIn("unknown-key", Position.from_dict(POSITION).to_dict())
+
+    def test_convert(self):
+        with self.subTest("Check dicts are returned as they are"):
+            items = [POSITION]
+            self.assertIs(convert(items, Position), items)
+        with self.subTest("Check iterators stay lazy"):
+            models = convert(iter([POSITION, POSITION]), Position, "models")
+            self.assertNotIsInstance(models, list)
+            self.assertEqual(len(list(models)), 2)
+        with self.subTest("Check unknown outputs are rejected"):
+            with self.assertRaises(ValueError):
+                convert([POSITION], Position, "xml")
+
+
+class TestClientOutput(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+
+    @requests_mock.Mocker()
+    def test_positions(self, mock):
+        mock.get(f"{URL}/accounts/5WT00000/positions", json={"data": {"items": [POSITION]}})
+        client = TastytradeAccountPositions("session_token", URL, transport=self.transport)
+
+        with self.subTest("Check dicts are the default"):
+            self.assertEqual(client.get_positions("5WT00000"), [POSITION])
+        with self.subTest("Check models"):
+            positions = client.get_positions("5WT00000", output="models")
+            self.assertEqual(positions, [Position.from_dict(POSITION)])
+
+    @requests_mock.Mocker()
+    def test_order(self, mock):
+        mock.get(f"{URL}/accounts/5WT00000/orders/1", json={"data": ORDER})
+        client = TastytradeOrder("session_token", URL, transport=self.transport)
+
+        self.assertEqual(client.get_order("5WT00000", 1, output="models"), Order.from_dict(ORDER))
+
+    @requests_mock.Mocker()
+    def test_streamed_equity_options(self, mock):
+        items = [{"symbol": f"AAPL  230616C0015{n}000", "strike-price": f"15{n}.0"} for n in range(3)]
+        mock.get(f"{URL}/instruments/equity-options", json={"data": {"items": items}})
+        client = TastytradeInstruments("session_token", URL, transport=self.transport)
+
+        options = list(client.get_equity_options(stream=True, output="models"))
+
+        self.assertEqual([option.strike_price for option in options], [Decimal("150"), Decimal("151"), Decimal("152")])
+        self.assertIsInstance(options[0], EquityOption)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from tastytrade_api.market_data.option_chain import OptionChain
+
+AS_OF = date(2024, 1, 2)
+
+
+def nested(root, expirations):
+    return {
+        "underlying-symbol": "SPX",
+        "root-symbol": root,
+        "expirations": [
+            {
+                "expiration-date": expiration,
+                "expiration-type": "Regular" if root == "SPX" else "Weekly",
+                "settlement-type": "AM" if root == "SPX" else "PM",
+                # Deliberately unsorted, as strikes are not guaranteed to come in order.
+                "strikes": [
+                    {
+                        "strike-price": f"{strike}.0",
+                        "call": f"{root} {expiration} C{strike}",
+                        "call-streamer-symbol": f".{root}{expiration}C{strike}",
+                        "put": f"{root} {expiration} P{strike}",
+                        "put-streamer-symbol": f".{root}{expiration}P{strike}",
+                    }
+                    for strike in (4750, 4700, 4800, 4725, 4775)
+                ],
+            }
+            for expiration in expirations
+        ],
+    }
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestOptionChain(unittest.TestCase):
+    def setUp(self):
+        self.chain = OptionChain.from_nested([
+            nested("SPXW", ["2024-01-05", "2024-01-19", "2024-02-16"]),
+            nested("SPX", ["2024-01-19", "2024-02-16"]),
+        ])
+
+    def test_layout(self):
+        with self.subTest("Check expirations are sorted by date and root"):
+            self.assertEqual([str(day) for day in self.chain.expirations],
+                             ["2024-01-05", "2024-01-19", "2024-01-19", "2024-02-16", "2024-02-16"])
+            self.assertEqual(self.chain.roots.tolist(), ["SPXW", "SPX", "SPXW", "SPX", "SPXW"])
+        with self.subTest("Check strikes are sorted within each expiration"):
+            rows = self.chain.rows("2024-01-19", root="SPXW")
+            self.assertEqual(self.chain.strikes[rows].tolist(), [4700, 4725, 4750, 4775, 4800])
+            self.assertEqual(len(self.chain), 25)
+        with self.subTest("Check the first root is the default"):
+            self.assertEqual(self.chain.expiration_index("2024-01-19"), 1)
+            with self.assertRaises(KeyError):
+                self.chain.expiration_index("2024-01-12")
+
+    def test_days_to_expiration_range(self):
+        indices = self.chain.expirations_between(10, 20, as_of=AS_OF)
+
+        with self.subTest("Check both bounds are included"):
+            self.assertEqual(self.chain.days_to_expiration(AS_OF)[indices].tolist(), [17, 17])
+        with self.subTest("Check the root filter"):
+            self.assertEqual(self.chain.expirations_between(0, as_of=AS_OF, root="SPX").tolist(), [1, 3])
+        with self.subTest("Check an empty range"):
+            self.assertEqual(len(self.chain.expirations_between(100, 200, as_of=AS_OF)), 0)
+
+    def test_nearest_strikes(self):
+        with self.subTest("Check the closest strikes in strike order"):
+            rows = self.chain.nearest(date(2024, 1, 5), price=4760, n=3)
+            self.assertEqual(self.chain.strikes[rows].tolist(), [4725, 4750, 4775])
+        with self.subTest("Check prices outside the strikes"):
+            rows = self.chain.nearest("2024-01-05", price=5000, n=2)
+            self.assertEqual(self.chain.strikes[rows].tolist(), [4775, 4800])
+            self.assertEqual(len(self.chain.nearest("2024-01-05", price=0, n=10)), 5)
+
+    def test_symbol_lookup(self):
+        with self.subTest("Check calls and puts"):
+            self.assertEqual(self.chain.symbol("2024-01-19", 4750, "C"), "SPX 2024-01-19 C4750")
+            self.assertEqual(self.chain.symbol("2024-01-19", 4750.0, "P", root="SPXW"), "SPXW 2024-01-19 P4750")
+            self.assertEqual(self.chain.streamer_symbol("2024-01-05", "4700", "C"), ".SPXW2024-01-05C4700")
+        with self.subTest("Check missing strikes and expirations"):
+            self.assertIsNone(self.chain.symbol("2024-01-19", 4751, "C"))
+            self.assertIsNone(self.chain.symbol("2024-01-12", 4750, "C"))
+        with self.subTest("Check the reverse lookup"):
+            row, option_type = self.chain.find(".SPX2024-02-16P4725")
+            self.assertEqual((self.chain.strikes[row], option_type), (4725, "P"))
+
+    def test_delta_buckets(self):
+        deltas = {f".SPXW2024-01-05C{strike}": delta
+                  for strike, delta in ((4700, 0.8), (4725, 0.6), (4750, 0.5), (4775, 0.35), (4800, 0.2))}
+        deltas["SPXW 2024-01-05 P4750"] = -0.5
+        deltas[".UNKNOWN"] = 0.1
+
+        self.assertEqual(self.chain.attach_greeks(deltas), 6)
+
+        with self.subTest("Check calls in a delta range"):
+            rows = self.chain.delta_range("2024-01-05", 0.3, 0.6)
+            self.assertEqual(self.chain.strikes[rows].tolist(), [4725, 4750, 4775])
+        with self.subTest("Check puts, and rows without deltas"):
+            rows = self.chain.delta_range("2024-01-05", -0.6, -0.4, option_type="P")
+            self.assertEqual(self.chain.strikes[rows].tolist(), [4750])
+            self.assertEqual(len(self.chain.delta_range("2024-01-19", -1, 1)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
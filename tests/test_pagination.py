@@ -0,0 +1,107 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import threading
+import time
+import unittest
+import requests_mock
+from tastytrade_api.pagination import iter_pages, aiter_items
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.trading.order import TastytradeOrder
+
+
+def paginated_response(page_offset, per_page, total_items):
+    start = page_offset * per_page
+    items = [{"symbol": f"SYM{n}"} for n in range(start, min(start + per_page, total_items))]
+    return {
+        "data": {"items": items},
+        "pagination": {
+            "per-page": per_page,
+            "page-offset": page_offset,
+            "total-items": total_items,
+            "total-pages": -(-total_items // per_page),
+        },
+    }
+
+
+def paginated_callback(total_items):
+    def callback(request, context):
+        per_page = int(request.qs["per-page"][0])
+        page_offset = int(request.qs["page-offset"][0])
+        return paginated_response(page_offset, per_page, total_items)
+    return callback
+
+
+class TestPagination(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    @requests_mock.Mocker()
+    def test_iter_active_equities(self, mock):
+        mock.get(f"{self.url}/instruments/equities/active", json=paginated_callback(25))
+        instruments = TastytradeInstruments("token", self.url)
+
+        symbols = [equity["symbol"] for equity in instruments.iter_active_equities(per_page=10, prefetch=2)]
+
+        with self.subTest("Check every item of every page is yielded in order"):
+            self.assertEqual(symbols, [f"SYM{n}" for n in range(25)])
+        with self.subTest("Check one request is sent per page"):
+            self.assertEqual(mock.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_iter_customer_orders(self, mock):
+        mock.get(f"{self.url}/customers/me/orders", json=paginated_callback(7))
+        orders = TastytradeOrder("token", self.url)
+
+        with self.subTest("Check every order is yielded"):
+            self.assertEqual(len(list(orders.iter_customer_orders("me", per_page=3, sort="Asc"))), 7)
+        with self.subTest("Check filters are forwarded"):
+            self.assertEqual(mock.last_request.qs["sort"], ["asc"])
+        with self.subTest("Check get_customer_orders still returns the items of one page"):
+            self.assertEqual(len(orders.get_customer_orders("me", per_page=3)), 3)
+
+    def test_prefetch_window_bounds_pages_in_flight(self):
+        lock = threading.Lock()
+        fetched = []
+        in_flight = [0, 0]
+
+        def fetch_page(offset):
+            with lock:
+                in_flight[0] += 1
+                in_flight[1] = max(in_flight[1], in_flight[0])
+                fetched.append(offset)
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return paginated_response(offset, 1, 20)
+
+        pages = iter_pages(fetch_page, prefetch=3)
+        for _ in range(5):
+            next(pages)
+        time.sleep(0.05)
+        pages.close()
+
+        with self.subTest("Check no more than the window is fetched concurrently"):
+            self.assertLessEqual(in_flight[1], 3)
+        with self.subTest("Check the generator does not run ahead of the window"):
+            self.assertLessEqual(len(fetched), 5 + 3)
+
+    def test_response_without_pagination_yields_one_page(self):
+        pages = list(iter_pages(lambda offset: {"data": {"items": [1, 2]}}))
+        self.assertEqual(len(pages), 1)
+
+    def test_async_iteration(self):
+        async def fetch_page(offset):
+            await asyncio.sleep(0)
+            return paginated_response(offset, 4, 10)
+
+        async def collect():
+            return [item["symbol"] async for item in aiter_items(fetch_page, prefetch=2)]
+
+        self.assertEqual(asyncio.run(collect()), [f"SYM{n}" for n in range(10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
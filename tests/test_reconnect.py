@@ -0,0 +1,147 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import json
+import socket
+import time
+import unittest
+
+from tastytrade_api import RetryPolicy, TransportError
+from tastytrade_api.streamer.token import StreamerToken
+
+try:
+    import websockets
+    from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+    from tastytrade_api.streamer.reconnect import Disconnected, Reconnected
+except ImportError:
+    CometdWebsocketClient = None
+
+FAST_BACKOFF = RetryPolicy(backoff=0.01, max_backoff=0.01)
+
+
+class FlakyCometdServer:
+    """Acknowledges handshakes and subscriptions, sends one data message, then drops the first connections."""
+
+    def __init__(self, drops):
+        self.drops = drops
+        self.connections = 0
+        self.subscriptions = []
+        self.paths = []
+
+    async def __call__(self, websocket, *args):
+        self.connections += 1
+        self.paths.append(websocket.path)
+        async for frame in websocket:
+            for message in json.loads(frame):
+                if message["channel"] == "/meta/handshake":
+                    client_id = f"client-{self.connections}"
+                    await websocket.send(json.dumps([{"id": message["id"], "channel": "/meta/handshake",
+                                                      "successful": True, "clientId": client_id}]))
+                elif message["channel"] == "/service/sub":
+                    self.subscriptions.append((self.connections, message["data"]["add"]))
+                    await websocket.send(json.dumps([
+                        {"id": message["id"], "channel": "/service/sub", "successful": True},
+                        {"channel": "/service/data", "data": ["Quote", [self.connections]]},
+                    ]))
+                    if self.connections <= self.drops:
+                        await websocket.close()
+
+
+class FakeTokenProvider:
+    def __init__(self, websocket_url):
+        self.websocket_url = websocket_url
+        self.gets = 0
+
+    async def get_async(self):
+        self.gets += 1
+        return StreamerToken(f"dx-{self.gets}", time.time() + 3600, websocket_url=self.websocket_url)
+
+
+def unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@unittest.skipIf(CometdWebsocketClient is None, "websockets is not installed")
+class TestRunForever(unittest.IsolatedAsyncioTestCase):
+    async def test_reconnect(self):
+        server = FlakyCometdServer(drops=2)
+        queue = asyncio.Queue()
+
+        async with websockets.serve(server, "127.0.0.1", 0) as stub:
+            client = CometdWebsocketClient(f"ws://127.0.0.1:{stub.sockets[0].getsockname()[1]}", "token", queue)
+            await client.add_subscriptions({"Quote": ["SPY"]})
+            supervisor = asyncio.create_task(client.run_forever(backoff=FAST_BACKOFF))
+            events = [await asyncio.wait_for(queue.get(), 5) for _ in range(7)]
+            supervisor.cancel()
+            await asyncio.gather(supervisor, return_exceptions=True)
+
+        with self.subTest("Check data, drops and gaps arrive in order"):
+            self.assertEqual([type(event).__name__ for event in events],
+                             ["list", "Disconnected", "Reconnected", "list", "Disconnected", "Reconnected", "list"])
+            self.assertEqual(events[-1], ["Quote", [3]])
+            self.assertGreaterEqual(events[2].downtime, 0)
+            self.assertEqual(events[2].attempts, 1)
+        with self.subTest("Check the subscriptions are sent again on every connection"):
+            self.assertEqual(server.subscriptions, [(n, {"Quote": ["SPY"]}) for n in (1, 2, 3)])
+        with self.subTest("Check the metrics"):
+            metrics = client.metrics()
+            self.assertEqual((metrics["connects"], metrics["disconnects"], metrics["reconnects"]), (3, 2, 2))
+            self.assertGreater(metrics["last_connect_latency"], 0)
+            self.assertGreaterEqual(metrics["max_downtime"], metrics["mean_downtime"])
+
+    async def test_token_url(self):
+        server = FlakyCometdServer(drops=1)
+        queue = asyncio.Queue()
+
+        async with websockets.serve(server, "127.0.0.1", 0) as stub:
+            provider = FakeTokenProvider(f"http://127.0.0.1:{stub.sockets[0].getsockname()[1]}/live")
+            client = CometdWebsocketClient(f"ws://127.0.0.1:{unused_port()}", None, queue, token_provider=provider)
+            await client.add_subscriptions({"Quote": ["SPY"]})
+            supervisor = asyncio.create_task(client.run_forever(backoff=FAST_BACKOFF, max_attempts=3))
+            events = [await asyncio.wait_for(queue.get(), 5) for _ in range(4)]
+            supervisor.cancel()
+            await asyncio.gather(supervisor, return_exceptions=True)
+
+        with self.subTest("Check every connection opens the CometD endpoint of the token's URL"):
+            self.assertEqual(server.paths, ["/live/cometd"] * 2)
+            self.assertEqual(events[-1], ["Quote", [2]])
+            self.assertEqual(provider.gets, 2)
+
+    async def test_cancel_while_connecting(self):
+        queue = asyncio.Queue()
+        handshakes = asyncio.Event()
+
+        async def silent(websocket, *args):
+            async for _ in websocket:
+                handshakes.set()
+
+        async with websockets.serve(silent, "127.0.0.1", 0) as stub:
+            client = CometdWebsocketClient(f"ws://127.0.0.1:{stub.sockets[0].getsockname()[1]}", "token", queue)
+            supervisor = asyncio.create_task(client.run_forever(backoff=FAST_BACKOFF))
+            await asyncio.wait_for(handshakes.wait(), 5)
+            supervisor.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(supervisor, 5)
+
+        with self.subTest("Check cancelling stops the loop instead of reconnecting"):
+            self.assertEqual(client.metrics()["failed_attempts"], 0)
+            self.assertTrue(queue.empty())
+
+    async def test_give_up(self):
+        queue = asyncio.Queue()
+        client = CometdWebsocketClient(f"ws://127.0.0.1:{unused_port()}", "token", queue)
+
+        with self.assertRaises(TransportError):
+            await client.run_forever(backoff=FAST_BACKOFF, max_attempts=3)
+
+        self.assertEqual(client.metrics()["failed_attempts"], 3)
+        self.assertTrue(queue.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
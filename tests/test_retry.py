@@ -0,0 +1,156 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests
+import requests_mock
+from tastytrade_api import (
+    AccountError,
+    ApiError,
+    AuthenticationError,
+    ClientError,
+    NotFoundError,
+    RetryPolicy,
+    ServerError,
+    TastytradeError,
+    Transport,
+    TransportError,
+)
+from tastytrade_api.account.account_handler import TastytradeAccount
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.scheduler import RequestScheduler
+from tastytrade_api.trading.order import TastytradeOrder
+
+
+class MockAuth:
+    def __init__(self):
+        self.session_token = "valid_session_token"
+        self.url = "https://api.tastyworks.com"
+
+    def validate_session(self):
+        pass
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def test_delay(self):
+        policy = RetryPolicy(backoff=0.5, max_backoff=2.0)
+
+        with self.subTest("Check the jittered delay stays under the exponential cap"):
+            for attempt in range(1, 6):
+                self.assertLessEqual(policy.delay(attempt), min(2.0, 0.5 * 2 ** (attempt - 1)))
+        with self.subTest("Check Retry-After is a lower bound"):
+            response = requests.Response()
+            response.headers["Retry-After"] = "3"
+            self.assertGreaterEqual(policy.delay(1, response), 3.0)
+
+    def test_can_retry(self):
+        policy = RetryPolicy(max_attempts=2)
+
+        with self.subTest("Check idempotent methods are retried"):
+            self.assertTrue(policy.can_retry("GET", 1))
+        with self.subTest("Check attempts are bounded"):
+            self.assertFalse(policy.can_retry("GET", 2))
+        with self.subTest("Check order entry is never retried"):
+            self.assertFalse(policy.can_retry("POST", 1))
+
+
+class TestRetryAndErrors(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def setUp(self):
+        self.transport = Transport(retry=RetryPolicy(backoff=0))
+
+    @requests_mock.Mocker()
+    def test_get_retried_after_server_error(self, m):
+        m.get(f"{self.url}/accounts/123/positions", [
+            {"status_code": 502, "text": "Bad Gateway"},
+            {"status_code": 200, "json": {"data": {"items": [{"symbol": "AAPL"}]}}},
+        ])
+        positions = TastytradeAccountPositions("token", self.url, transport=self.transport)
+
+        with self.subTest("Check the second attempt succeeds"):
+            self.assertEqual(positions.get_positions("123"), [{"symbol": "AAPL"}])
+        with self.subTest("Check the request was sent twice"):
+            self.assertEqual(m.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_connection_error_raises_transport_error(self, m):
+        m.get(f"{self.url}/accounts/123/positions", exc=requests.exceptions.ConnectionError("reset"))
+        positions = TastytradeAccountPositions("token", self.url, transport=self.transport)
+
+        with self.assertRaises(TransportError) as context:
+            positions.get_positions("123")
+        with self.subTest("Check every attempt was made"):
+            self.assertEqual(m.call_count, 3)
+        with self.subTest("Check the error is retryable and names the endpoint"):
+            self.assertTrue(context.exception.retryable)
+            self.assertEqual(context.exception.endpoint, f"GET {self.url}/accounts/123/positions")
+
+    @requests_mock.Mocker()
+    def test_throttled_request_retried_by_one_layer(self, m):
+        m.get(f"{self.url}/accounts/123/positions", status_code=429, headers={"Retry-After": "0"}, text="Slow down")
+        scheduler = RequestScheduler(rate=1000, burst=10, max_throttle_retries=2)
+        positions = TastytradeAccountPositions(
+            "token", self.url, transport=Transport(scheduler=scheduler, retry=RetryPolicy(backoff=0)))
+
+        with self.assertRaises(ApiError):
+            positions.get_positions("123")
+        with self.subTest("Check only the scheduler resends a 429"):
+            self.assertEqual(m.call_count, 3)
+
+        m.reset_mock()
+        with self.assertRaises(ApiError):
+            TastytradeAccountPositions("token", self.url, transport=self.transport).get_positions("123")
+        with self.subTest("Check the retry policy resends a 429 without a scheduler"):
+            self.assertEqual(m.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_post_not_retried(self, m):
+        m.post(f"{self.url}/accounts/123/orders", status_code=502, text="Bad Gateway")
+        order = TastytradeOrder("token", self.url, transport=self.transport)
+
+        with self.assertRaises(ServerError) as context:
+            order.create_order("123", {"order-type": "Limit"})
+        with self.subTest("Check the order was sent once"):
+            self.assertEqual(m.call_count, 1)
+        with self.subTest("Check the error fields"):
+            self.assertEqual(context.exception.status_code, 502)
+            self.assertTrue(context.exception.retryable)
+            self.assertEqual(context.exception.endpoint, f"POST {self.url}/accounts/123/orders")
+
+    @requests_mock.Mocker()
+    def test_status_classes(self, m):
+        m.get(f"{self.url}/accounts/123/positions", status_code=404, text="Not Found")
+        m.get(f"{self.url}/accounts/123/balances", status_code=401, text="Unauthorized")
+        positions = TastytradeAccountPositions("token", self.url, transport=self.transport)
+
+        with self.subTest("Check 404 raises NotFoundError"):
+            with self.assertRaises(NotFoundError) as context:
+                positions.get_positions("123")
+            self.assertFalse(context.exception.retryable)
+            self.assertIn("Error getting positions: 404", str(context.exception))
+        with self.subTest("Check 401 raises AuthenticationError"):
+            with self.assertRaises(AuthenticationError):
+                positions.get_account_balances("123")
+
+    @requests_mock.Mocker()
+    def test_account_error_is_typed(self, m):
+        m.get(f"{self.url}/customers/me/accounts", status_code=400, text="Bad Request")
+        account = TastytradeAccount(MockAuth(), transport=self.transport)
+
+        with self.assertRaises(AccountError) as context:
+            account.get_accounts()
+        with self.subTest("Check the error is also a ClientError"):
+            self.assertIsInstance(context.exception, ClientError)
+            self.assertIsInstance(context.exception, ApiError)
+            self.assertIsInstance(context.exception, TastytradeError)
+        with self.subTest("Check the error fields"):
+            self.assertEqual(context.exception.status_code, 400)
+            self.assertFalse(context.exception.retryable)
+            self.assertIn("Error getting accounts", str(context.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
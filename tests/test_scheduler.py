@@ -0,0 +1,135 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from unittest import mock as mocking
+import requests
+import requests_mock
+from tastytrade_api import DeadlineExceeded, Timeout, Transport, deadline
+from tastytrade_api.scheduler import RequestScheduler, Priority, parse_retry_after
+from tastytrade_api.trading.order import TastytradeOrder
+
+
+class TestRequestScheduler(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def test_token_bucket_rate(self):
+        scheduler = RequestScheduler(rate=50, burst=2)
+        start = time.monotonic()
+        for _ in range(6):
+            scheduler.acquire()
+        elapsed = time.monotonic() - start
+
+        with self.subTest("Check the burst is free and the rest is paced"):
+            self.assertGreaterEqual(elapsed, 4 / 50 * 0.9)
+            self.assertLess(elapsed, 0.5)
+        with self.subTest("Check the lane metrics"):
+            metrics = scheduler.metrics()[Priority.DEFAULT]
+            self.assertEqual(metrics["requests"], 6)
+            self.assertEqual(metrics["queue_depth"], 0)
+            self.assertGreater(metrics["max_wait"], 0)
+
+    def test_orders_lane_goes_first(self):
+        scheduler = RequestScheduler(rate=20, burst=1)
+        scheduler.acquire(Priority.BULK)
+        granted = []
+
+        def request(lane, name):
+            scheduler.acquire(lane)
+            granted.append(name)
+
+        threads = [threading.Thread(target=request, args=(Priority.BULK, f"bulk{n}")) for n in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.01)
+        order_thread = threading.Thread(target=request, args=(Priority.ORDERS, "order"))
+        order_thread.start()
+        for thread in threads + [order_thread]:
+            thread.join()
+
+        with self.subTest("Check the order was granted before the queued bulk requests"):
+            self.assertEqual(granted[0], "order")
+        with self.subTest("Check the bulk queue depth was recorded"):
+            self.assertEqual(scheduler.metrics()[Priority.BULK]["max_queue_depth"], 3)
+
+    def test_async_acquire(self):
+        scheduler = RequestScheduler(rate=100, burst=1)
+
+        async def run():
+            await asyncio.gather(*(scheduler.acquire_async(Priority.BULK) for _ in range(5)))
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.metrics()[Priority.BULK]["requests"], 5)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after("2"), 2.0)
+        self.assertEqual(parse_retry_after(None, default=1.5), 1.5)
+        self.assertAlmostEqual(parse_retry_after(formatdate(time.time() + 30, usegmt=True)), 30, delta=2)
+
+    @requests_mock.Mocker()
+    def test_throttled_request_is_resent_after_retry_after(self, mock):
+        mock.delete(f"{self.url}/accounts/123/orders/1", [
+            {"status_code": 429, "headers": {"Retry-After": "0.05"}},
+            {"status_code": 200, "json": {"data": {"status": "Cancel Requested"}}},
+        ])
+        scheduler = RequestScheduler()
+        orders = TastytradeOrder("token", self.url, transport=Transport(scheduler=scheduler))
+
+        start = time.monotonic()
+        data = orders.cancel_order("123", "1")
+
+        with self.subTest("Check the request succeeded after the pause"):
+            self.assertEqual(data["data"]["status"], "Cancel Requested")
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        with self.subTest("Check the throttle was counted on the orders lane"):
+            self.assertEqual(scheduler.metrics()[Priority.ORDERS]["throttled"], 1)
+            self.assertEqual(scheduler.metrics()[Priority.ORDERS]["requests"], 2)
+
+    @requests_mock.Mocker()
+    def test_throttled_responses_are_closed(self, mock):
+        mock.get(f"{self.url}/accounts", status_code=429, headers={"Retry-After": "0"})
+        transport = Transport(scheduler=RequestScheduler(max_throttle_retries=2), retry=None)
+        close = requests.Response.close
+
+        with mocking.patch.object(requests.Response, "close", autospec=True, side_effect=close) as closed:
+            response = transport.get(f"{self.url}/accounts", stream=True)
+
+        with self.subTest("Check every resent response was closed"):
+            self.assertEqual(mock.call_count, 3)
+            self.assertEqual(closed.call_count, 2)
+            self.assertNotIn(response, [call.args[0] for call in closed.call_args_list])
+
+    @requests_mock.Mocker()
+    def test_throttled_scheduler_respects_the_deadline(self, mock):
+        mock.get(f"{self.url}/accounts", json={"data": {"items": []}})
+        scheduler = RequestScheduler(rate=10, burst=1)
+        scheduler.throttled(Priority.DEFAULT, "5")
+        transport = Transport(scheduler=scheduler)
+
+        with self.subTest("Check a short total timeout fails fast"):
+            start = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                transport.get(f"{self.url}/accounts", timeout=Timeout(connect=1, read=1, total=0.5))
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual(mock.call_count, 0)
+        with self.subTest("Check the async wait fails fast too"):
+            async def run():
+                with deadline(0.5):
+                    await scheduler.acquire_async()
+
+            start = time.monotonic()
+            with self.assertRaises(DeadlineExceeded):
+                asyncio.run(run())
+            self.assertLess(time.monotonic() - start, 0.5)
+        with self.subTest("Check the queue depth is restored"):
+            self.assertEqual(scheduler.metrics()[Priority.DEFAULT]["queue_depth"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
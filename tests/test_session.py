@@ -0,0 +1,225 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs
+
+import requests
+import requests_mock
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+from tastytrade_api import AccountError, RetryPolicy, SessionManager, Transport, ValidationError
+from tastytrade_api.account.account_handler import TastytradeAccount
+from tastytrade_api.authentication import TastytradeAuth
+from tests.helpers import session_response
+
+
+class TestSessionManager(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def setUp(self):
+        self.auth = TastytradeAuth("user", "password", transport=Transport())
+
+    @requests_mock.Mocker()
+    def test_logs_in_once_and_refreshes_with_remember_token(self, mock):
+        sessions = mock.post(f"{self.url}/sessions", [session_response(1), session_response(2)])
+        manager = SessionManager(self.auth, lifetime=100, refresh_margin=10)
+
+        with self.subTest("Check the first token request logs in"):
+            self.assertEqual(manager.token(), "st-1")
+            self.assertEqual(manager.token(), "st-1")
+            self.assertEqual(sessions.call_count, 1)
+
+        self.auth.token_timestamp = time.time() - 95
+        with self.subTest("Check the session is refreshed before it expires"):
+            self.assertEqual(manager.token(), "st-2")
+            self.assertEqual(sessions.call_count, 2)
+        with self.subTest("Check the refresh uses the remember token"):
+            payload = parse_qs(sessions.last_request.text)
+            self.assertEqual(payload["remember-token"], ["rm-1"])
+            self.assertNotIn("password", payload)
+
+    @requests_mock.Mocker()
+    def test_refresh_is_scheduled_from_the_reported_expiration(self, mock):
+        expiration = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+        sessions = mock.post(f"{self.url}/sessions", [
+            session_response(1, expiration=expiration.isoformat().replace("+00:00", ".000Z")),
+            session_response(2),
+        ])
+        manager = SessionManager(self.auth, lifetime=100, refresh_margin=10)
+        manager.token()
+
+        self.auth.token_timestamp = time.time() - 95
+        with self.subTest("Check the session-expiration of the login is used"):
+            self.assertEqual(manager.expires_at, expiration.timestamp())
+            self.assertEqual(manager.token(), "st-1")
+            self.assertEqual(sessions.call_count, 1)
+
+        self.auth.session_expiration = time.time() + 5
+        with self.subTest("Check the session is refreshed before the reported expiration"):
+            self.assertEqual(manager.token(), "st-2")
+        with self.subTest("Check the lifetime is assumed when no expiration is reported"):
+            self.assertIsNone(self.auth.session_expiration)
+            self.assertEqual(manager.expires_at, self.auth.token_timestamp + 100)
+
+    @requests_mock.Mocker()
+    def test_transport_sends_current_token_and_relogs_in_on_401(self, mock):
+        sessions = mock.post(f"{self.url}/sessions", [session_response(1), session_response(2)])
+        accounts = mock.get(f"{self.url}/customers/me/accounts", [
+            {"status_code": 401, "text": "expired"},
+            {"json": {"data": {"items": []}}},
+        ])
+        transport = Transport(session_manager=SessionManager(self.auth))
+        account = TastytradeAccount(self.auth, transport=transport, validate=False)
+
+        self.assertEqual(account.get_accounts(), [])
+        with self.subTest("Check no validation request is sent"):
+            self.assertFalse(any(r.path == "/sessions/validate" for r in mock.request_history))
+        with self.subTest("Check the rejected request is sent again with the new token"):
+            self.assertEqual([r.headers["Authorization"] for r in accounts.request_history], ["st-1", "st-2"])
+            self.assertEqual(sessions.call_count, 2)
+
+        mock.get(f"{self.url}/customers/me/accounts", status_code=401, text="expired")
+        with self.subTest("Check a request still rejected after the new login fails"):
+            with self.assertRaises(AccountError):
+                account.get_accounts()
+
+    @requests_mock.Mocker()
+    def test_concurrent_401s_log_in_once(self, mock):
+        self.auth.session_token = "st-0"
+        sessions = mock.post(f"{self.url}/sessions", **session_response(1))
+
+        def positions(request, context):
+            context.status_code = 200 if request.headers["Authorization"] == "st-1" else 401
+            return {"data": {"items": []}}
+
+        mock.get(f"{self.url}/accounts/1/positions", json=positions)
+        transport = Transport(session_manager=SessionManager(self.auth))
+        barrier = threading.Barrier(8)
+        statuses = []
+
+        def call():
+            barrier.wait()
+            statuses.append(transport.get(f"{self.url}/accounts/1/positions", headers={"Authorization": "st-0"})
+                            .status_code)
+
+        threads = [threading.Thread(target=call) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.subTest("Check every call succeeds"):
+            self.assertEqual(statuses, [200] * 8)
+        with self.subTest("Check a single login was made"):
+            self.assertEqual(sessions.call_count, 1)
+
+    @requests_mock.Mocker()
+    def test_remember_token_rejected_falls_back_to_password(self, mock):
+        self.auth.session_token, self.auth.remember_token = "st-0", "rm-0"
+        sessions = mock.post(f"{self.url}/sessions", [{"status_code": 401, "text": "bad token"}, session_response(1)])
+
+        self.auth.refresh_session()
+
+        with self.subTest("Check the password was used"):
+            self.assertEqual(parse_qs(sessions.last_request.text)["password"], ["password"])
+        with self.subTest("Check the new session is kept"):
+            self.assertEqual(self.auth.session_token, "st-1")
+
+        self.auth.password = None
+        mock.post(f"{self.url}/sessions", status_code=401, text="bad token")
+        with self.subTest("Check the error is raised without a password"):
+            with self.assertRaises(ValidationError):
+                self.auth.refresh_session()
+
+    @requests_mock.Mocker()
+    def test_background_refresh(self, mock):
+        sessions = mock.post(f"{self.url}/sessions", [session_response(n) for n in range(1, 10)])
+
+        with SessionManager(self.auth, lifetime=0.3, refresh_margin=0.2, background=True):
+            time.sleep(0.35)
+
+        with self.subTest("Check the session was refreshed without any API call"):
+            self.assertGreaterEqual(sessions.call_count, 2)
+
+    @requests_mock.Mocker()
+    def test_background_refresh_survives_unexpected_errors(self, mock):
+        sessions = mock.post(f"{self.url}/sessions", [
+            {"status_code": 201, "text": "<html>maintenance</html>"},
+            {"exc": requests.exceptions.ConnectionError("reset")},
+            session_response(1),
+        ])
+        backoff = RetryPolicy(backoff=0.01, max_backoff=0.01)
+
+        with self.assertLogs("tastytrade_api.session", "WARNING") as logs:
+            with SessionManager(self.auth, background=True, refresh_backoff=backoff) as manager:
+                for _ in range(100):
+                    if self.auth.session_token is not None:
+                        break
+                    time.sleep(0.01)
+                alive = manager._thread.is_alive()
+
+        with self.subTest("Check the refresh was retried after a bad body and a connection error"):
+            self.assertEqual(self.auth.session_token, "st-1")
+            self.assertEqual(sessions.call_count, 3)
+            self.assertEqual(len(logs.records), 2)
+        with self.subTest("Check the thread kept running"):
+            self.assertTrue(alive)
+
+    @requests_mock.Mocker()
+    def test_dxfeed_token_is_not_validated(self, mock):
+        self.auth.session_token = "st-0"
+        mock.get(f"{self.url}/quote-streamer-tokens", json={"data": {"token": "dx"}})
+
+        self.auth.get_dxfeed_token()
+
+        self.assertEqual([r.path for r in mock.request_history], ["/quote-streamer-tokens"])
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncSessionManager(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.tokens = []
+
+        async def positions(request):
+            self.tokens.append(request.headers["Authorization"])
+            if request.headers["Authorization"] != "st-1":
+                return web.json_response({"error": "expired"}, status=401)
+            return web.json_response({"data": {"items": []}})
+
+        app = web.Application()
+        app.router.add_get("/accounts/{account_number}/positions", positions)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.url = str(self.server.make_url("")).rstrip("/")
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_relogin_on_401(self):
+        from tastytrade_api.aio import AsyncTastytradeAccountPositions, AsyncTransport
+
+        auth = TastytradeAuth("user", "password", transport=Transport())
+        auth.url, auth.session_token = self.url, "st-0"
+
+        with requests_mock.Mocker(real_http=True) as mock:
+            mock.post(f"{self.url}/sessions", **session_response(1))
+            async with AsyncTransport(session_manager=SessionManager(auth)) as transport:
+                positions = AsyncTastytradeAccountPositions("st-0", self.url, transport=transport)
+                self.assertEqual(await positions.get_positions("1"), [])
+
+        self.assertEqual(self.tokens, ["st-0", "st-1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
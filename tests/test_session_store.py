@@ -0,0 +1,142 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import tempfile
+import threading
+import time
+import unittest
+
+import requests_mock
+
+from tastytrade_api import FileSessionStore, SessionManager, Transport
+from tastytrade_api.authentication import TastytradeAuth
+from tests.helpers import session_response
+
+
+class TestFileSessionStore(unittest.TestCase):
+    url = "https://api.tastyworks.com/sessions"
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.key = FileSessionStore.generate_key()
+
+    def worker(self, key=None, store=None):
+        store = store or FileSessionStore(self.directory.name, key=key or self.key)
+        return TastytradeAuth("user", "password", transport=Transport(), session_store=store)
+
+    @requests_mock.Mocker()
+    def test_workers_share_one_login(self, mock):
+        sessions = mock.post(self.url, [session_response(n) for n in range(1, 20)])
+        workers = [self.worker() for _ in range(16)]
+        barrier = threading.Barrier(len(workers))
+
+        def start(auth):
+            barrier.wait()
+            auth.login()
+
+        # Separate stores open separate lock files, so the threads contend like processes would.
+        threads = [threading.Thread(target=start, args=(auth,)) for auth in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self.subTest("Check a single login was made"):
+            self.assertEqual(sessions.call_count, 1)
+        with self.subTest("Check every worker has the session and remember token"):
+            self.assertEqual({(a.session_token, a.remember_token) for a in workers}, {("st-1", "rm-1")})
+
+    @requests_mock.Mocker()
+    def test_sessions_are_encrypted(self, mock):
+        mock.post(self.url, **session_response(1))
+        self.worker().login()
+
+        files = list(Path(self.directory.name).glob("*.session"))
+        with self.subTest("Check the file does not contain the token or the username"):
+            self.assertEqual(len(files), 1)
+            self.assertNotIn(b"st-1", files[0].read_bytes())
+            self.assertNotIn("user", files[0].name)
+        with self.subTest("Check only the owner can read it"):
+            self.assertEqual(files[0].stat().st_mode & 0o077, 0)
+
+        mock.post(self.url, **session_response(2))
+        with self.subTest("Check a session saved with another key is not used"):
+            auth = self.worker(key=FileSessionStore.generate_key())
+            auth.login()
+            self.assertEqual(auth.session_token, "st-2")
+
+    def test_key_is_required(self):
+        with self.subTest("Check a store without a key is refused"):
+            with self.assertRaises(ValueError):
+                FileSessionStore(self.directory.name)
+        with self.subTest("Check plaintext is an explicit opt-in"):
+            self.assertIsNone(FileSessionStore(self.directory.name, insecure_plaintext=True).fernet)
+
+    @requests_mock.Mocker()
+    def test_malformed_record_is_not_reused(self, mock):
+        sessions = mock.post(self.url, [session_response(1), session_response(2), session_response(3)])
+        store = FileSessionStore(self.directory.name, insecure_plaintext=True)
+        self.worker(store=store).login()
+
+        for content in (b'{"data": {"session-token": "old"}}', b'["not", "a", "record"]'):
+            store._file("user", ".session").write_bytes(content)
+            auth = self.worker(store=store)
+            auth.login()
+            with self.subTest("Check a new session is fetched", content=content):
+                self.assertNotEqual(auth.session_token, "old")
+        with self.subTest("Check every login was made"):
+            self.assertEqual(sessions.call_count, 3)
+
+    @requests_mock.Mocker()
+    def test_expiring_session_is_not_reused(self, mock):
+        mock.post(self.url, **session_response(1))
+        store = FileSessionStore(self.directory.name, key=self.key, lifetime=100, refresh_margin=10)
+        self.worker(store=store).login()
+        record = store.load("user")
+        store.save("user", record["data"], time.time() - 95)
+
+        mock.post(self.url, **session_response(2))
+        auth = self.worker(store=store)
+        auth.login()
+        with self.subTest("Check a session near the end of its lifetime is replaced"):
+            self.assertEqual(auth.session_token, "st-2")
+
+        record = store.load("user")
+        store.save("user", dict(record["data"], **{"session-expiration": "2020-01-01T00:00:00.000Z"}), time.time())
+        mock.post(self.url, **session_response(3))
+        auth = self.worker(store=store)
+        auth.login()
+        with self.subTest("Check a session past its reported expiration is replaced"):
+            self.assertEqual(auth.session_token, "st-3")
+
+    @requests_mock.Mocker()
+    def test_refresh_adopts_session_refreshed_by_another_process(self, mock):
+        sessions = mock.post(self.url, [session_response(1), session_response(2)])
+        first, second = self.worker(), self.worker()
+        first.login()
+        second.login()
+        SessionManager(first).renew("st-1")
+
+        with self.subTest("Check the rejected session of the second worker is replaced without a login"):
+            self.assertEqual(SessionManager(second).renew("st-1"), "st-2")
+            self.assertEqual(sessions.call_count, 2)
+        with self.subTest("Check the refresh used the shared remember token"):
+            self.assertIn("remember-token=rm-1", sessions.last_request.text)
+
+    @requests_mock.Mocker()
+    def test_destroy_session_forgets_it(self, mock):
+        mock.post(self.url, **session_response(1))
+        mock.delete(self.url, status_code=204)
+        auth = self.worker()
+        auth.login()
+
+        auth.destroy_session()
+
+        self.assertIsNone(auth.session_store.load("user"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import asyncio
+import threading
+import time
+import unittest
+
+import requests_mock
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+from tastytrade_api import AccountError, NotFoundError, Transport
+from tastytrade_api.account.account_handler import TastytradeAccount
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.account.snapshot import atake_snapshot, take_snapshot
+
+
+class MockAuth:
+    def __init__(self, url):
+        self.session_token = "session_token"
+        self.url = url
+
+
+class FakeClient:
+    """Stands in for both TastytradeAccount and TastytradeAccountPositions; requests_mock serializes requests."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def call(self, number, data):
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self.lock:
+            self.in_flight -= 1
+        if number == "bad":
+            raise AccountError("nope", status_code=400)
+        return data
+
+    def get_accounts(self):
+        return [{"account": {"account-number": "A1"}}, {"account": {"account-number": "A2"}}]
+
+    def get_customer_account(self, number):
+        return self.call(number, {"account-number": number})
+
+    def get_positions(self, number):
+        return self.call(number, [{"symbol": number}])
+
+    def get_account_balances(self, number):
+        return self.call(number, {"cash-balance": number})
+
+    def get_margin_requirements(self, number):
+        return self.call(number, {"account-number": number})
+
+
+class TestTakeSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeClient()
+
+    def test_snapshot(self):
+        numbers = [f"5WT{n:05d}" for n in range(10)] + ["bad"]
+
+        snapshot = take_snapshot(self.client, self.client, numbers, max_concurrency=4)
+
+        with self.subTest("Check accounts keep the requested order"):
+            self.assertEqual(list(snapshot.accounts), numbers)
+        with self.subTest("Check every section is filled"):
+            first = snapshot["5WT00000"]
+            self.assertTrue(first.ok)
+            self.assertEqual(first.account, {"account-number": "5WT00000"})
+            self.assertEqual(first.positions, [{"symbol": "5WT00000"}])
+            self.assertEqual(first.balances, {"cash-balance": "5WT00000"})
+            self.assertEqual(first.margin_requirements, {"account-number": "5WT00000"})
+        with self.subTest("Check errors are isolated to the failing account"):
+            self.assertEqual(snapshot.failed, ["bad"])
+            self.assertIsInstance(snapshot["bad"].errors["balances"], AccountError)
+            self.assertIsNone(snapshot["bad"].positions)
+        with self.subTest("Check the concurrency cap"):
+            self.assertEqual(self.client.max_in_flight, 4)
+        with self.subTest("Check timings are reported"):
+            latencies = snapshot.endpoint_latencies()
+            self.assertEqual(list(latencies), ["account", "positions", "balances", "margin_requirements"])
+            self.assertEqual(latencies["positions"]["calls"], 11)
+            self.assertEqual(latencies["positions"]["errors"], 1)
+            self.assertGreaterEqual(latencies["positions"]["max"], 0.01)
+            self.assertLess(snapshot.wall_time, 44 * 0.01)
+
+    def test_all_accounts_and_selected_endpoints(self):
+        snapshot = take_snapshot(self.client, self.client, endpoints=("positions",))
+
+        with self.subTest("Check every account of the customer is included"):
+            self.assertEqual(list(snapshot.accounts), ["A1", "A2"])
+        with self.subTest("Check only the selected section is fetched"):
+            self.assertIsNone(snapshot["A1"].balances)
+            self.assertEqual(list(snapshot.endpoint_latencies()), ["positions"])
+        with self.subTest("Check unknown sections are rejected"):
+            with self.assertRaises(ValueError):
+                take_snapshot(self.client, self.client, ["A1"], endpoints=("orders",))
+
+    @requests_mock.Mocker()
+    def test_http_errors_are_recorded(self, mock):
+        url = "https://api.tastyworks.com"
+        transport = Transport()
+        account = TastytradeAccount(MockAuth(url), transport=transport, validate=False)
+        positions = TastytradeAccountPositions("session_token", url, transport=transport)
+        mock.get(f"{url}/customers/me/accounts/A1", json={"data": {"account-number": "A1"}})
+        mock.get(f"{url}/accounts/A1/balances", status_code=404, text="Not Found")
+
+        snapshot = take_snapshot(account, positions, ["A1"], endpoints=("account", "balances"))
+
+        with self.subTest("Check the successful section"):
+            self.assertEqual(snapshot["A1"].account, {"account-number": "A1"})
+        with self.subTest("Check the failed section keeps its typed error"):
+            self.assertIsInstance(snapshot["A1"].errors["balances"], NotFoundError)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncTakeSnapshot(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        from tastytrade_api.aio import AsyncTransport
+
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        def handler(data):
+            async def handle(request):
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                await asyncio.sleep(0.01)
+                self.in_flight -= 1
+                number = request.match_info["account_number"]
+                if number == "bad":
+                    return web.json_response({"error": "nope"}, status=400)
+                return web.json_response({"data": data(number)})
+            return handle
+
+        app = web.Application()
+        app.router.add_get("/customers/me/accounts/{account_number}", handler(lambda n: {"account-number": n}))
+        app.router.add_get("/accounts/{account_number}/positions", handler(lambda n: {"items": []}))
+        app.router.add_get("/accounts/{account_number}/balances", handler(lambda n: {"cash-balance": n}))
+        app.router.add_get("/margin/accounts/{account_number}/requirements", handler(lambda n: {}))
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.url = str(self.server.make_url("")).rstrip("/")
+        self.transport = AsyncTransport()
+
+    async def asyncTearDown(self):
+        await self.transport.close()
+        await self.server.close()
+
+    async def test_snapshot(self):
+        from tastytrade_api.aio import AsyncTastytradeAccount, AsyncTastytradeAccountPositions
+
+        account = AsyncTastytradeAccount(MockAuth(self.url), transport=self.transport)
+        positions = AsyncTastytradeAccountPositions("session_token", self.url, transport=self.transport)
+
+        snapshot = await atake_snapshot(account, positions, ["A1", "bad", "A2"], max_concurrency=3)
+
+        with self.subTest("Check results and isolated errors"):
+            self.assertEqual(snapshot["A2"].balances, {"cash-balance": "A2"})
+            self.assertEqual(snapshot.failed, ["bad"])
+            self.assertEqual(set(snapshot["bad"].errors), {"account", "positions", "balances", "margin_requirements"})
+        with self.subTest("Check the concurrency cap"):
+            self.assertEqual(self.max_in_flight, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import requests_mock
+
+from tastytrade_api import Transport
+from tastytrade_api.authentication import TastytradeAuth
+from tastytrade_api.streamer.token import DEFAULT_TOKEN_LIFETIME, StreamerToken, StreamerTokenCache
+from tests.helpers import FakeWebsocket
+
+try:
+    from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+except ImportError:
+    CometdWebsocketClient = None
+
+
+def token_response(token, expires_in=None):
+    data = {"token": token, "websocket-url": "https://tasty-live-ws.dxfeed.com/realtime", "level": "api"}
+    if expires_in is not None:
+        data["expires-at"] = (datetime.now(timezone.utc) + timedelta(seconds=expires_in)).isoformat()
+    return {"json": {"data": data}}
+
+
+class TestStreamerTokenCache(unittest.TestCase):
+    url = "https://api.tastyworks.com/quote-streamer-tokens"
+
+    def setUp(self):
+        self.auth = TastytradeAuth("user", "password", transport=Transport())
+        self.auth.session_token = "st-1"
+
+    def test_expiry(self):
+        with self.subTest("Check the server-reported expiry is used"):
+            token = StreamerToken.from_response(token_response("dx", expires_in=600)["json"])
+            self.assertAlmostEqual(token.expires_in(), 600, delta=5)
+            self.assertEqual(token.websocket_url, "https://tasty-live-ws.dxfeed.com/realtime")
+            self.assertEqual(token.cometd_url, "wss://tasty-live-ws.dxfeed.com/realtime/cometd")
+        with self.subTest("Check a Z-suffixed expiry is read as UTC"):
+            data = token_response("dx")["json"]
+            data["data"]["expires-at"] = "2030-01-02T03:04:05.000Z"
+            expected = datetime(2030, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp()
+            self.assertEqual(StreamerToken.from_response(data).expires_at, expected)
+        with self.subTest("Check the default lifetime is assumed without one"):
+            token = StreamerToken.from_response(token_response("dx")["json"], fetched_at=1000.0)
+            self.assertEqual(token.expires_at, 1000.0 + DEFAULT_TOKEN_LIFETIME)
+
+    @requests_mock.Mocker()
+    def test_token_is_cached_until_refresh_margin(self, mock):
+        tokens = mock.get(self.url, [token_response("dx-1", expires_in=7200), token_response("dx-2", expires_in=7200)])
+        cache = StreamerTokenCache(self.auth, refresh_margin=3600)
+
+        with self.subTest("Check repeated gets make a single request"):
+            self.assertEqual([cache.get().token for _ in range(5)], ["dx-1"] * 5)
+            self.assertEqual(tokens.call_count, 1)
+
+        cache._token.expires_at = time.time() + 1800
+        with self.subTest("Check a token inside the refresh margin is replaced"):
+            self.assertEqual(cache.get().token, "dx-2")
+            self.assertEqual(tokens.call_count, 2)
+
+        cache.invalidate(StreamerToken("stale", 0))
+        with self.subTest("Check invalidating another token keeps the cache"):
+            self.assertEqual(cache.get().token, "dx-2")
+        cache.invalidate()
+        with self.subTest("Check invalidating fetches a new token"):
+            mock.get(self.url, **token_response("dx-3", expires_in=7200))
+            self.assertEqual(cache.get().token, "dx-3")
+
+    @requests_mock.Mocker()
+    def test_background_fetch(self, mock):
+        tokens = mock.get(self.url, **token_response("dx-1", expires_in=7200))
+
+        with StreamerTokenCache(self.auth, background=True) as cache:
+            for _ in range(100):
+                if cache._token is not None:
+                    break
+                time.sleep(0.01)
+
+        with self.subTest("Check the token was fetched before it was asked for"):
+            self.assertEqual(tokens.call_count, 1)
+            self.assertEqual(cache._token.token, "dx-1")
+
+
+@unittest.skipIf(CometdWebsocketClient is None, "websockets is not installed")
+class TestCometdTokenProvider(unittest.IsolatedAsyncioTestCase):
+    async def test_reconnect_uses_cached_token(self):
+        auth = TastytradeAuth("user", "password", transport=Transport())
+        auth.session_token = "st-1"
+        websocket = FakeWebsocket()
+
+        with requests_mock.Mocker() as mock:
+            tokens = mock.get("https://api.tastyworks.com/quote-streamer-tokens",
+                              [token_response("dx-1", expires_in=7200), token_response("dx-2", expires_in=7200)])
+            client = CometdWebsocketClient("wss://streamer", None, None, token_provider=StreamerTokenCache(auth))
+
+            for _ in range(3):
+                await client.refresh_auth_token()
+                await client.send_handshake(websocket)
+
+            with self.subTest("Check the client connects to the URL reported with the token"):
+                self.assertEqual(client.url, "wss://tasty-live-ws.dxfeed.com/realtime/cometd")
+            with self.subTest("Check every handshake sends the cached token"):
+                self.assertEqual([m[0]["ext"]["com.devexperts.auth.AuthToken"] for m in websocket.sent], ["dx-1"] * 3)
+                self.assertEqual(tokens.call_count, 1)
+
+            await client.process_handshake({"successful": False, "error": "403::invalid token"})
+            await client.refresh_auth_token()
+            with self.subTest("Check a rejected token is fetched again"):
+                self.assertEqual(client.auth_token, "dx-2")
+                self.assertEqual(tokens.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
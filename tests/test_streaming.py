@@ -0,0 +1,106 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json
+import unittest
+import requests_mock
+from tastytrade_api import NotFoundError, Transport
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+from tastytrade_api.streaming import ItemParser, iter_json_items
+
+
+def chunked(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestItemParser(unittest.TestCase):
+    def test_items_across_chunk_boundaries(self):
+        items = [
+            {"symbol": "AAPL", "description": 'Apple "Inc", [common] {stock}\\', "tags": [1, [2, {"x": None}]]},
+            "plain string",
+            12.5,
+            [],
+            {},
+        ]
+        document = json.dumps({
+            "context": "/instruments",
+            "data": {"other": [{"items": [0]}], "items": items, "after": {"items": [9]}},
+            "pagination": {"total-pages": 1},
+        }, indent=1).encode()
+
+        for size in (1, 2, 7, 64, len(document)):
+            with self.subTest(f"Check chunks of {size} bytes"):
+                self.assertEqual(list(iter_json_items(chunked(document, size))), items)
+
+    def test_numbers_split_across_chunks(self):
+        document = b'{"data": {"items": [-2500.0, 1e-7, 42]}}'
+        for size in range(1, 10):
+            with self.subTest(f"Check chunks of {size} bytes"):
+                self.assertEqual(list(iter_json_items(chunked(document, size))), [-2500.0, 1e-7, 42])
+
+    def test_only_the_current_item_is_buffered(self):
+        parser = ItemParser()
+        parser.feed(b'{"data": {"items": [')
+        largest = 0
+        for n in range(1000):
+            parser.feed(json.dumps({"symbol": f"SYM{n}", "padding": "x" * 100}).encode() + b",")
+            largest = max(largest, len(parser._buffer))
+        self.assertLess(largest, 300)
+
+    def test_empty_and_missing_arrays(self):
+        with self.subTest("Check an empty array yields nothing"):
+            self.assertEqual(list(iter_json_items([b'{"data": {"items": []}}'])), [])
+        with self.subTest("Check a document without the array yields nothing"):
+            self.assertEqual(list(iter_json_items([b'{"data": {"count": 3}}'])), [])
+
+    def test_truncated_document(self):
+        with self.assertRaises(ValueError):
+            list(iter_json_items([b'{"data": {"items": [{"a": 1}, {"b"']))
+
+
+class TestStreamingClients(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def setUp(self):
+        self.instruments = TastytradeInstruments("token", self.url, transport=Transport(), max_workers=1)
+
+    @requests_mock.Mocker()
+    def test_active_equities_stream(self, mock):
+        equities = [{"symbol": f"SYM{n}"} for n in range(50)]
+        mock.get(f"{self.url}/instruments/equities/active", json={"data": {"items": equities}})
+
+        items = self.instruments.get_active_equities(per_page=50, stream=True)
+
+        with self.subTest("Check an iterator is returned"):
+            self.assertFalse(isinstance(items, list))
+        with self.subTest("Check every equity is yielded"):
+            self.assertEqual(list(items), equities)
+
+    @requests_mock.Mocker()
+    def test_batched_stream_keeps_response_order(self, mock):
+        def equity_options(request, context):
+            # requests_mock lower-cases the query string
+            return {"data": {"items": [{"symbol": s.upper()} for s in request.qs["symbol[]"]]}}
+
+        mock.get(f"{self.url}/instruments/equity-options", json=equity_options)
+        symbols = [f"OPT{n:05d}" for n in range(2000)]
+
+        options = list(self.instruments.get_equity_options(symbols, stream=True))
+
+        with self.subTest("Check the symbols were split into batches"):
+            self.assertGreater(mock.call_count, 1)
+        with self.subTest("Check every option is yielded"):
+            self.assertEqual([o["symbol"] for o in options], symbols)
+
+    @requests_mock.Mocker()
+    def test_error_is_raised_before_iterating(self, mock):
+        mock.get(f"{self.url}/option-chains/NOPE/nested", status_code=404, text="Not Found")
+
+        with self.assertRaises(NotFoundError):
+            self.instruments.get_option_chains("NOPE", stream=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+
+from tastytrade_api.streamer.subscriptions import SubscriptionRegistry
+from tests.helpers import FakeWebsocket
+
+try:
+    from tastytrade_api.streamer.dxfeed_handler import CometdWebsocketClient
+except ImportError:
+    CometdWebsocketClient = None
+
+
+class TestSubscriptionRegistry(unittest.TestCase):
+    def test_ref_counts(self):
+        registry = SubscriptionRegistry()
+
+        with self.subTest("Check only new pairs are returned"):
+            self.assertEqual(registry.add({"Quote": ["SPY", "QQQ"]}), {"Quote": ["SPY", "QQQ"]})
+            self.assertEqual(registry.add({"Quote": ["SPY", "IWM"], "Trade": ["SPY"]}),
+                             {"Quote": ["IWM"], "Trade": ["SPY"]})
+            self.assertEqual(registry.count("Quote", "SPY"), 2)
+        with self.subTest("Check pairs are only removed with their last interest"):
+            self.assertEqual(registry.remove({"Quote": ["SPY", "QQQ"]}), {"Quote": ["QQQ"]})
+            self.assertEqual(registry.remove({"Quote": ["SPY", "DIA"]}), {"Quote": ["SPY"]})
+            self.assertNotIn(("Quote", "SPY"), registry)
+        with self.subTest("Check the snapshot"):
+            self.assertEqual(registry.snapshot(), {"Quote": ["IWM"], "Trade": ["SPY"]})
+            self.assertEqual(len(registry), 2)
+
+
+@unittest.skipIf(CometdWebsocketClient is None, "websockets is not installed")
+class TestClientSubscriptions(unittest.IsolatedAsyncioTestCase):
+    async def test_diff_and_replay(self):
+        client = CometdWebsocketClient("wss://streamer", "token", None)
+        client.websocket = websocket = FakeWebsocket()
+
+        with self.subTest("Check subscriptions added while disconnected are only recorded"):
+            self.assertIsNone(await client.add_subscriptions({"Quote": ["SPY", "QQQ"]}))
+            self.assertEqual(websocket.sent, [])
+
+        await client.process_handshake({"successful": True, "clientId": "client-1"})
+        with self.subTest("Check the handshake replays the registry in bulk"):
+            self.assertEqual([m["data"]["add"] for (m,) in websocket.sent], [{"Quote": ["SPY", "QQQ"]}])
+            self.assertIsNotNone(client.replayed)
+
+        await client.add_subscriptions({"Quote": ["SPY", "IWM"]})
+        await client.add_subscriptions({"Quote": ["SPY"]})
+        await client.remove_subscriptions({"Quote": ["SPY", "QQQ"]})
+        with self.subTest("Check only the net changes are sent"):
+            self.assertEqual([m["data"].get("add") or m["data"].get("remove") for (m,) in websocket.sent[1:]],
+                             [{"Quote": ["IWM"]}, {"Quote": ["QQQ"]}])
+
+        websocket.sent.clear()
+        await client.process_handshake({"successful": True, "clientId": "client-2"})
+        with self.subTest("Check a reconnect replays the current set"):
+            self.assertEqual(websocket.sent[0][0]["clientId"], "client-2")
+            self.assertEqual(websocket.sent[0][0]["data"]["add"], {"Quote": ["SPY", "IWM"]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import unittest
+import requests_mock
+from tastytrade_api import Transport
+from tastytrade_api.transport import get_default_transport, DEFAULT_TIMEOUT
+from tastytrade_api.authentication import TastytradeAuth
+from tastytrade_api.account.balances_positions import TastytradeAccountPositions
+from tastytrade_api.market_data.instruments import TastytradeInstruments
+
+
+class TestTransport(unittest.TestCase):
+    url = "https://api.tastyworks.com"
+
+    def setUp(self):
+        self.transport = Transport(headers={"X-Test": "yes"}, timeout=(1.0, 2.0))
+
+    def tearDown(self):
+        self.transport.close()
+
+    def test_default_transport_is_shared(self):
+        with self.subTest("Check that the default transport is a singleton"):
+            self.assertIs(get_default_transport(), get_default_transport())
+
+        with self.subTest("Check that clients without a transport share the default one"):
+            instruments = TastytradeInstruments("token", self.url)
+            positions = TastytradeAccountPositions("token", self.url)
+            self.assertIs(instruments.transport, positions.transport)
+            self.assertIs(instruments.transport, get_default_transport())
+
+    def test_auth_transport_is_reused(self):
+        auth = TastytradeAuth("user", "password", transport=self.transport)
+        self.assertIs(auth.transport, self.transport)
+
+    @requests_mock.Mocker()
+    def test_requests_go_through_injected_transport(self, mock):
+        mock.get(f"{self.url}/accounts/123/balances", json={"data": {"cash-balance": "1.0"}}, status_code=200)
+        positions = TastytradeAccountPositions("token", self.url, transport=self.transport)
+
+        data = positions.get_account_balances("123")
+
+        with self.subTest("Check response data"):
+            self.assertEqual(data["cash-balance"], "1.0")
+        with self.subTest("Check default and per-call headers are merged"):
+            self.assertEqual(mock.last_request.headers["X-Test"], "yes")
+            self.assertEqual(mock.last_request.headers["Authorization"], "token")
+            self.assertEqual(mock.last_request.headers["Accept"], "application/json")
+        with self.subTest("Check the default timeout is applied"):
+            self.assertEqual(mock.last_request.timeout, (1.0, 2.0))
+
+    @requests_mock.Mocker()
+    def test_per_call_timeout_overrides_default(self, mock):
+        mock.get(f"{self.url}/ping", status_code=200)
+        Transport().get(f"{self.url}/ping")
+        self.assertEqual(mock.last_request.timeout, DEFAULT_TIMEOUT)
+        self.transport.get(f"{self.url}/ping", timeout=9)
+        self.assertEqual(mock.last_request.timeout, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()